@@ -0,0 +1,58 @@
+import argparse
+import json
+import logging
+import sys
+import time
+
+from stock_data_analysis.data_sources import AlphaVantageApi
+from stock_data_analysis.data_sources import EarningsRecord
+from stock_data_analysis.symbol_filters import EarningsBacktester
+from stock_data_analysis.symbol_filters import QuarterlyEarningsPerShareIncrementEvaluator
+from stock_data_analysis.symbol_filters import YearlyEarningsPerShareIncrementEvaluator
+from stock_data_analysis.utilities import Logger
+from stock_data_analysis.utilities import SqliteResponseStore
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description='replay the scan evaluators at past quarter ends from Alpha Vantage earnings cached by main.py '
+        '--response-cache-file, without API calls')
+    parser.add_argument('response_cache_file', type=str, help='SQLite response cache')
+    parser.add_argument('--start-date', type=str, required=True, help='first as of date, YYYY-MM-DD')
+    parser.add_argument('--end-date', type=str, required=True, help='last as of date, YYYY-MM-DD')
+    parser.add_argument('--quarterly-threshold', type=float, default=0.25)
+    parser.add_argument('--quarters', type=int, default=3, help='number of quarters to check')
+    parser.add_argument('--yearly-threshold', type=float, default=0.25)
+    parser.add_argument('--years', type=int, default=3, help='number of years to check')
+    parser.add_argument('--reporting-lag-days',
+                        type=int,
+                        default=EarningsBacktester.DEFAULT_REPORTING_LAG_DAYS,
+                        help='days after the period end at which periods without a reported date become known')
+    args = parser.parse_args()
+
+    # evaluators log every evaluation, a backtest only prints its result
+    Logger.configure(level=logging.WARNING)
+
+    start_time = time.perf_counter()
+    earnings_cache_key_prefix = '{}:EARNINGS:'.format(AlphaVantageApi.__name__)
+    response_store = SqliteResponseStore(args.response_cache_file, read_only=True)
+    earnings_records = {
+        key[len(earnings_cache_key_prefix):]: EarningsRecord.from_alpha_vantage_response(value)
+        for key, value, _ in response_store.items() if key.startswith(earnings_cache_key_prefix)
+    }
+    response_store.close()
+    loading_milliseconds = (time.perf_counter() - start_time) * 1000
+
+    # evaluators only read the histories handed to them by the backtester
+    earnings_backtester = EarningsBacktester(
+        [QuarterlyEarningsPerShareIncrementEvaluator(None, args.quarterly_threshold, args.quarters)],
+        [YearlyEarningsPerShareIncrementEvaluator(None, args.yearly_threshold, args.years)], args.reporting_lag_days)
+    start_time = time.perf_counter()
+    passed_symbols_by_date = earnings_backtester.backtest(
+        earnings_records, EarningsBacktester.get_quarter_end_dates(args.start_date, args.end_date))
+    backtest_milliseconds = (time.perf_counter() - start_time) * 1000
+
+    for as_of_date, passed_symbols in passed_symbols_by_date.items():
+        print(json.dumps({'as_of_date': as_of_date, 'passed_symbols': passed_symbols}))
+    print('loaded {} symbols in {:.1f} ms, backtested {} dates in {:.1f} ms'.format(
+        len(earnings_records), loading_milliseconds, len(passed_symbols_by_date), backtest_milliseconds),
+          file=sys.stderr)
@@ -0,0 +1,340 @@
+import argparse
+import array
+import datetime
+import gc
+import glob
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy
+
+# benchmarks run from a checkout like the tests, without installing the package
+REPOSITORY_FOLDER_NAME = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPOSITORY_FOLDER_NAME)
+
+from stock_data_analysis.data_sources import AlphaVantageApi  # pylint: disable=wrong-import-position
+from stock_data_analysis.data_sources import AlphaVantageDataSourceAdapter  # pylint: disable=wrong-import-position
+from stock_data_analysis.data_sources import EarningsRecord  # pylint: disable=wrong-import-position
+from stock_data_analysis.data_sources import IDataSourceAdapter  # pylint: disable=wrong-import-position
+from stock_data_analysis.data_sources import StubApiServer  # pylint: disable=wrong-import-position
+from stock_data_analysis.symbol_filters import QuarterlyEarningsPerShareIncrementEvaluator  # pylint: disable=C0413
+from stock_data_analysis.symbol_filters import SymbolFilter  # pylint: disable=wrong-import-position
+from stock_data_analysis.symbol_filters import YearlyEarningsPerShareIncrementEvaluator  # pylint: disable=C0413
+from stock_data_analysis.utilities import Logger  # pylint: disable=wrong-import-position
+from stock_data_analysis.utilities import RateLimiter  # pylint: disable=wrong-import-position
+from stock_data_analysis.utilities import ResponseArchive  # pylint: disable=wrong-import-position
+from stock_data_analysis.utilities import ResponseCache  # pylint: disable=wrong-import-position
+
+DEFAULT_BASELINE_FILE_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+NUMBER_OF_YEARS = 10
+# per symbol evaluation and parsing are measured on a sample, their cost does not depend on the universe size
+MAX_SAMPLED_SYMBOLS = 10000
+MEASUREMENT_REPEATS = 3
+STUB_BASE_URI = 'http://127.0.0.1'
+
+
+class SyntheticDataSourceAdapter(IDataSourceAdapter):
+    def __init__(self, earnings_records: {str: EarningsRecord}):
+        self._earnings_records = earnings_records
+
+    def __str__(self):
+        return self.__class__.__name__
+
+    def get_all_symbols(self) -> [str]:
+        return list(self._earnings_records)
+
+    def get_quarterly_earnings_per_share(self, symbol: str, number_of_quarters: int) -> [float]:
+        return self._earnings_records[symbol].get_quarterly_earnings_per_share(number_of_quarters)
+
+    def get_yearly_earnings_per_share(self, symbol: str, number_of_years: int) -> [float]:
+        return self._earnings_records[symbol].get_yearly_earnings_per_share(number_of_years)
+
+
+def create_earnings_records(number_of_symbols: int, random_seed: int = 42) -> {str: EarningsRecord}:
+    random_generator = numpy.random.default_rng(random_seed)
+    quarter_ends = [
+        datetime.date(year, month, 30 if month in (6, 9) else 31)
+        for year in range(2020 - NUMBER_OF_YEARS, 2020) for month in (3, 6, 9, 12)
+    ]
+    quarterly_period_ends = tuple(str(i) for i in quarter_ends)
+    quarterly_reported_dates = tuple(str(i + datetime.timedelta(30)) for i in quarter_ends)
+    yearly_period_ends = quarterly_period_ends[3::4]
+
+    # random walks with a drift, so that a share of the symbols passes the default thresholds
+    quarterly_growth = random_generator.normal(0.06, 0.25, (number_of_symbols, len(quarter_ends)))
+    quarterly_earnings_per_share = numpy.round(
+        random_generator.uniform(0.1, 5, (number_of_symbols, 1)) * numpy.cumprod(1 + quarterly_growth, axis=1), 2)
+    yearly_earnings_per_share = quarterly_earnings_per_share.reshape(number_of_symbols, NUMBER_OF_YEARS, 4).sum(axis=2)
+
+    return {
+        'SYM{:06d}'.format(i): EarningsRecord(quarterly_period_ends, quarterly_reported_dates,
+                                              array.array('d', quarterly_earnings_per_share[i]), yearly_period_ends,
+                                              array.array('d', yearly_earnings_per_share[i]))
+        for i in range(number_of_symbols)
+    }
+
+
+def to_alpha_vantage_response(symbol: str, earnings_record: EarningsRecord) -> str:
+    # Alpha Vantage lists the most recent period first and sends fields the adapters do not read
+    return json.dumps({
+        'symbol':
+        symbol,
+        'annualEarnings': [{
+            'fiscalDateEnding': period_end,
+            'reportedEPS': str(earnings_per_share)
+        } for period_end, earnings_per_share in zip(reversed(earnings_record.yearly_period_ends),
+                                                    reversed(earnings_record.yearly_earnings_per_share))],
+        'quarterlyEarnings': [{
+            'fiscalDateEnding': period_end,
+            'reportedDate': reported_date,
+            'reportedEPS': str(earnings_per_share),
+            'estimatedEPS': str(round(earnings_per_share * 0.95, 2)),
+            'surprise': str(round(earnings_per_share * 0.05, 2)),
+            'surprisePercentage': '5.0'
+        } for period_end, reported_date, earnings_per_share in zip(
+            reversed(earnings_record.quarterly_period_ends), reversed(earnings_record.quarterly_reported_dates),
+            reversed(earnings_record.quarterly_earnings_per_share))]
+    })
+
+
+def measure_seconds(function, repeats: int = MEASUREMENT_REPEATS) -> float:
+    # the fastest run is the one least disturbed by the rest of the machine
+    elapsed_seconds = []
+    for _ in range(repeats):
+        gc.collect()
+        start_time = time.perf_counter()
+        function()
+        elapsed_seconds.append(time.perf_counter() - start_time)
+
+    return min(elapsed_seconds)
+
+
+def benchmark_evaluators(earnings_records: {str: EarningsRecord}) -> dict:
+    symbols = list(earnings_records)
+    sampled_symbols = symbols[:MAX_SAMPLED_SYMBOLS]
+    data_source_adapter = SyntheticDataSourceAdapter(earnings_records)
+    evaluators = {
+        'quarterly': QuarterlyEarningsPerShareIncrementEvaluator(data_source_adapter),
+        'yearly': YearlyEarningsPerShareIncrementEvaluator(data_source_adapter)
+    }
+    results = {}
+
+    for evaluator_name, evaluator in evaluators.items():
+        results['evaluator.{}.batch_symbols_per_second'.format(evaluator_name)] = len(symbols) / measure_seconds(
+            lambda: evaluator.evaluate_batch(symbols))
+        results['evaluator.{}.symbols_per_second'.format(evaluator_name)] = len(sampled_symbols) / measure_seconds(
+            lambda: [evaluator.evaluate(symbol) for symbol in sampled_symbols])
+
+    symbol_filter = SymbolFilter(list(evaluators.values()))
+    results['symbol_filter.batch_symbols_per_second'] = len(symbols) / measure_seconds(
+        lambda: symbol_filter.filter_symbols(symbols))
+    results['symbol_filter.symbols_per_second'] = len(sampled_symbols) / measure_seconds(
+        lambda: [symbol_filter.filter(symbol) for symbol in sampled_symbols])
+    return results
+
+
+def benchmark_memory(number_of_symbols: int) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    earnings_records = create_earnings_records(number_of_symbols)
+    record_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sampled_earnings_records = list(earnings_records.items())[:MAX_SAMPLED_SYMBOLS]
+    gc.collect()
+    tracemalloc.start()
+    parsed_responses = [json.loads(to_alpha_vantage_response(*i)) for i in sampled_earnings_records]
+    parsed_response_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed_responses
+
+    return {
+        'memory.earnings_record_bytes_per_symbol': record_bytes / number_of_symbols,
+        'memory.parsed_response_bytes_per_symbol': parsed_response_bytes / len(sampled_earnings_records)
+    }
+
+
+def benchmark_parsing(earnings_records: {str: EarningsRecord}) -> dict:
+    sampled_symbols = list(earnings_records)[:MAX_SAMPLED_SYMBOLS]
+    response_texts = {symbol: to_alpha_vantage_response(symbol, earnings_records[symbol]) for symbol in sampled_symbols}
+
+    # the cache holds every response, so the adapter measures parsing and not the stub HTTP client
+    response_cache = ResponseCache(max_entries=len(sampled_symbols))
+    for symbol, response_text in response_texts.items():
+        response_cache.put('{}:EARNINGS:{}'.format(AlphaVantageApi.__name__, symbol), response_text)
+
+    def read_both_series():
+        # a new API object per run, its parsed records would otherwise serve the later runs
+        alpha_vantage_data_source_adapter = AlphaVantageDataSourceAdapter(
+            AlphaVantageApi(response_cache=response_cache, rate_limiter=RateLimiter()))
+        for symbol in sampled_symbols:
+            alpha_vantage_data_source_adapter.get_yearly_earnings_per_share(symbol, 3)
+            alpha_vantage_data_source_adapter.get_quarterly_earnings_per_share(symbol, 7)
+
+    return {
+        'parse.earnings_record_microseconds_per_symbol':
+        measure_seconds(lambda: [EarningsRecord.from_alpha_vantage_response(i) for i in response_texts.values()]) *
+        1e6 / len(sampled_symbols),
+        'parse.adapter_microseconds_per_symbol':
+        measure_seconds(read_both_series) * 1e6 / len(sampled_symbols)
+    }
+
+
+def benchmark_scan(number_of_symbols: int, latency_seconds: float, workers: int) -> dict:
+    earnings_records = create_earnings_records(number_of_symbols)
+
+    with tempfile.TemporaryDirectory() as temporary_folder_name:
+        archive_file_name = os.path.join(temporary_folder_name, 'responses.jsonl.gz')
+        response_archive = ResponseArchive(archive_file_name, writable=True)
+        # archive keys leave out the host, both APIs are served from the root of the stub server
+        response_archive.record(
+            '{}/ref-data/symbols?token=token'.format(STUB_BASE_URI), 200,
+            json.dumps([{
+                'symbol': symbol,
+                'type': 'cs',
+                'exchange': 'NAS',
+                'isEnabled': True
+            } for symbol in earnings_records]))
+        for symbol, earnings_record in earnings_records.items():
+            response_archive.record(AlphaVantageApi.URI.format(STUB_BASE_URI, 'EARNINGS', symbol, 'token'), 200,
+                                    to_alpha_vantage_response(symbol, earnings_record))
+        response_archive.close()
+
+        stub_api_server = StubApiServer(ResponseArchive(archive_file_name), latency_seconds=latency_seconds)
+        stub_api_server.start()
+        try:
+            # the quotas of the real APIs would only measure the rate limiter, the daily budget covers the one earnings
+            # call of every symbol, IEX has no daily limit unless one is given
+            command = [
+                sys.executable,
+                os.path.join(REPOSITORY_FOLDER_NAME, 'main.py'), '--iex-public-token', 'token', '--alpha-vantage-token',
+                'token', '--iex-base-uri',
+                stub_api_server.get_base_uri(), '--alpha-vantage-base-uri',
+                stub_api_server.get_base_uri(), '--alpha-vantage-calls-per-minute', '1000000',
+                '--alpha-vantage-calls-per-day',
+                str(max(AlphaVantageApi.CALLS_PER_DAY, number_of_symbols)), '--iex-calls-per-minute', '1000000',
+                '--workers',
+                str(workers), '--log-level', 'WARNING'
+            ]
+            scan_seconds = measure_seconds(
+                lambda: subprocess.run(command, cwd=temporary_folder_name, check=True, stdout=subprocess.DEVNULL), 1)
+        finally:
+            stub_api_server.stop()
+
+        # a scan that failed to reach the stub server would look fast
+        scanned_symbols = 0
+        for scan_results_file_name in glob.glob(os.path.join(temporary_folder_name, 'output', 'scan_results_*.jsonl')):
+            with open(scan_results_file_name) as scan_results_file:
+                scanned_symbols += sum(1 for _ in scan_results_file)
+        if scanned_symbols != number_of_symbols:
+            raise Exception('scan wrote {} of {} symbols'.format(scanned_symbols, number_of_symbols))
+
+    return {'scan.symbols_per_second': number_of_symbols / scan_seconds}
+
+
+def run_benchmarks(sizes: [int], scan_symbols: int, latency_seconds: float, workers: int) -> dict:
+    results = {}
+    for size in sizes:
+        earnings_records = create_earnings_records(size)
+        size_results = benchmark_evaluators(earnings_records)
+        size_results.update(benchmark_memory(size))
+        size_results.update(benchmark_parsing(earnings_records))
+        results.update({'{}.{}'.format(name, size): value for name, value in size_results.items()})
+        print('benchmarked {} symbols'.format(size), file=sys.stderr)
+
+    if scan_symbols:
+        results.update({
+            '{}.{}'.format(name, scan_symbols): value
+            for name, value in benchmark_scan(scan_symbols, latency_seconds, workers).items()
+        })
+        print('benchmarked a scan of {} symbols'.format(scan_symbols), file=sys.stderr)
+
+    return results
+
+
+def is_higher_better(name: str) -> bool:
+    return '_per_second' in name
+
+
+def compare_with_baseline(results: dict, baseline_results: dict, tolerance: float) -> [str]:
+    regressions = []
+    for name in sorted(set(results) & set(baseline_results)):
+        # ratios above one are always improvements, whichever direction the metric goes
+        ratio = results[name] / baseline_results[name] if is_higher_better(name) else \
+            baseline_results[name] / results[name]
+        is_regression = ratio < 1 - tolerance
+        print('{:<70} {:>14.2f} {:>14.2f} {:>7.2f}x{}'.format(name, baseline_results[name], results[name], ratio,
+                                                               ' REGRESSION' if is_regression else ''))
+        if is_regression:
+            regressions.append(name)
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description='measure evaluator, SymbolFilter, parsing and scan throughput on synthetic earnings and compare '
+        'them with a baseline')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000], help='numbers of symbols')
+    parser.add_argument('--scan-symbols',
+                        type=int,
+                        default=500,
+                        help='symbols of the end to end main.py scan against a stub API server, 0 to skip it')
+    parser.add_argument('--latency-seconds', type=float, default=0.01, help='delay of every stub API response')
+    parser.add_argument('--workers', type=int, default=8, help='workers of the end to end scan')
+    parser.add_argument('--output-file', type=str, help='JSON file receiving the results')
+    parser.add_argument('--baseline-file', type=str, default=DEFAULT_BASELINE_FILE_NAME, help='JSON baseline')
+    parser.add_argument('--tolerance',
+                        type=float,
+                        default=0.3,
+                        help='share by which a result may be worse than its baseline before it is a regression')
+    parser.add_argument('--write-baseline', action='store_true', help='store the results as the new baseline')
+    args = parser.parse_args()
+
+    # benchmarks measure the work, not the logging of every evaluation
+    Logger.configure(level=logging.WARNING)
+
+    benchmark_report = {
+        'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'arguments': {
+            'sizes': args.sizes,
+            'scan_symbols': args.scan_symbols,
+            'latency_seconds': args.latency_seconds,
+            'workers': args.workers
+        },
+        'results': run_benchmarks(args.sizes, args.scan_symbols, args.latency_seconds, args.workers)
+    }
+
+    benchmark_report_text = json.dumps(benchmark_report, indent=2, sort_keys=True)
+    if args.output_file:
+        with open(args.output_file, 'w') as output_file:
+            output_file.write(benchmark_report_text)
+    else:
+        print(benchmark_report_text)
+
+    if args.write_baseline:
+        with open(args.baseline_file, 'w') as baseline_file:
+            baseline_file.write(benchmark_report_text + '\n')
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline_file):
+        print('no baseline at {}, store one with --write-baseline'.format(args.baseline_file), file=sys.stderr)
+        sys.exit(0)
+
+    with open(args.baseline_file) as baseline_file:
+        regressed_results = compare_with_baseline(benchmark_report['results'],
+                                                  json.load(baseline_file)['results'], args.tolerance)
+
+    if regressed_results:
+        print('{} results regressed by more than {:.0%}'.format(len(regressed_results), args.tolerance),
+              file=sys.stderr)
+        sys.exit(1)
@@ -1,3 +1,4 @@
 yapf -i -r --style='{based_on_style: pep8, column_limit: 120}' stock_data_analysis
 yapf -i -r --style='{based_on_style: pep8, column_limit: 120}' stock_data_analysis_test
-yapf -i -r --style='{based_on_style: pep8, column_limit: 120}' main.py
\ No newline at end of file
+yapf -i -r --style='{based_on_style: pep8, column_limit: 120}' main.py
+yapf -i -r --style='{based_on_style: pep8, column_limit: 120}' stub_api_server.py
\ No newline at end of file
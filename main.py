@@ -1,5 +1,8 @@
 import argparse
 import datetime
+import glob
+import json
+import logging
 import os
 import sys
 
@@ -7,25 +10,307 @@ from stock_data_analysis.data_sources import IexDataSourceAdapter
 from stock_data_analysis.data_sources import IexApi
 from stock_data_analysis.data_sources import AlphaVantageDataSourceAdapter
 from stock_data_analysis.data_sources import AlphaVantageApi
+from stock_data_analysis.data_sources import EarningsPerShareIndex
+from stock_data_analysis.data_sources import IndexingDataSourceAdapter
+from stock_data_analysis.data_sources import ReplayDataSourceAdapter
+from stock_data_analysis.data_sources import RoutingDataSourceAdapter
+from stock_data_analysis.exceptions import DailyQuotaExceededException
 from stock_data_analysis.exceptions import TooManyRequestsException
-from stock_data_analysis.utilities import RetryExecutor
+from stock_data_analysis.scanning import ConcurrentSymbolScanner
+from stock_data_analysis.scanning import CsvResultSink
+from stock_data_analysis.scanning import IncrementalScanState
+from stock_data_analysis.scanning import IncrementalSymbolFilter
+from stock_data_analysis.scanning import JsonLinesResultSink
+from stock_data_analysis.scanning import LocalShardLauncher
+from stock_data_analysis.scanning import ParquetResultSink
+from stock_data_analysis.scanning import ScanJournal
+from stock_data_analysis.scanning import ScanProgressReporter
+from stock_data_analysis.scanning import ScanResult
+from stock_data_analysis.scanning import ShardManifest
+from stock_data_analysis.scanning import ShardPartitioner
+from stock_data_analysis.scanning import ShardResultMerger
+from stock_data_analysis.utilities import HttpClient
+from stock_data_analysis.utilities import MetricsExporter
+from stock_data_analysis.utilities import QuotaPlanner
+from stock_data_analysis.utilities import RateLimiter
+from stock_data_analysis.utilities import RecordingHttpClient
+from stock_data_analysis.utilities import ReplayHttpClient
+from stock_data_analysis.utilities import ResponseArchive
+from stock_data_analysis.utilities import ResponseCache
+from stock_data_analysis.utilities import SqliteQuotaStore
+from stock_data_analysis.utilities import SqliteResponseStore
+from stock_data_analysis.symbol_filters import ProfilingSymbolFilter
 from stock_data_analysis.symbol_filters import SymbolFilter
+from stock_data_analysis.symbol_filters import SymbolRecordFilter
 from stock_data_analysis.symbol_filters import QuarterlyEarningsPerShareIncrementEvaluator
 from stock_data_analysis.symbol_filters import YearlyEarningsPerShareIncrementEvaluator
 from stock_data_analysis.utilities import Logger
 
 if __name__ == "__main__":
     logger = Logger('main', print_to_console=True)
-    logger.log_info('running with command line arguments ' + str(sys.argv))
 
     parser = argparse.ArgumentParser()
     parser.add_argument('--iex-public-token', type=str, nargs='?', help='public token to IEX Cloud')
     parser.add_argument('--alpha-vantage-token', type=str, nargs='?', help='API token of Alpha Vantage')
+    parser.add_argument('--response-cache-file',
+                        type=str,
+                        nargs='?',
+                        help='SQLite file persisting API responses and the API calls made today across runs, in memory '
+                        'only if omitted')
+    parser.add_argument('--response-cache-ttl-hours',
+                        type=float,
+                        default=24,
+                        help='hours before a cached API response is fetched again')
+    parser.add_argument('--response-cache-max-entries',
+                        type=int,
+                        default=1024,
+                        help='maximum number of API responses kept in memory')
+    parser.add_argument('--alpha-vantage-calls-per-minute',
+                        type=float,
+                        help='Alpha Vantage calls allowed per minute for the given token, defaults to {} and to no '
+                        'limit when replaying'.format(AlphaVantageApi.CALLS_PER_MINUTE))
+    parser.add_argument('--alpha-vantage-calls-per-day',
+                        type=int,
+                        help='Alpha Vantage calls allowed per day for the given token, defaults to {} and to no limit '
+                        'when replaying'.format(AlphaVantageApi.CALLS_PER_DAY))
+    parser.add_argument('--iex-calls-per-minute',
+                        type=float,
+                        help='IEX Cloud calls allowed per minute for the given token, defaults to {} and to no limit '
+                        'when replaying'.format(IexApi.CALLS_PER_MINUTE))
+    parser.add_argument('--iex-calls-per-day', type=int, help='IEX Cloud calls allowed per day for the given token')
+    parser.add_argument('--schedule-day',
+                        type=int,
+                        help='only scan the symbols planned for this 0-based day of a multi-day schedule that fits '
+                        'the Alpha Vantage daily quota')
+    parser.add_argument('--workers', type=int, default=1, help='number of symbols evaluated concurrently')
+    parser.add_argument('--batch-size',
+                        type=int,
+                        default=1,
+                        help='symbols evaluated together, IEX earnings of a batch are fetched in one request')
+    parser.add_argument('--progress-interval-seconds',
+                        type=float,
+                        default=30,
+                        help='seconds between progress and throughput reports')
+    parser.add_argument('--http-connect-timeout-seconds',
+                        type=float,
+                        default=HttpClient.DEFAULT_CONNECT_TIMEOUT_SECONDS,
+                        help='seconds to wait for an API connection to be established')
+    parser.add_argument('--http-read-timeout-seconds',
+                        type=float,
+                        default=HttpClient.DEFAULT_READ_TIMEOUT_SECONDS,
+                        help='seconds to wait for an API response')
+    parser.add_argument('--resume',
+                        type=str,
+                        metavar='RUN_ID',
+                        help='resume an interrupted run, skipping symbols its journal already records')
+    parser.add_argument('--adaptive-evaluator-ordering',
+                        action='store_true',
+                        help='run the cheapest and most selective evaluator first based on observed statistics')
+    parser.add_argument('--log-level',
+                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+                        default='INFO',
+                        help='minimum level of logged messages')
+    parser.add_argument('--log-format', choices=['text', 'json'], default='text', help='format of logged messages')
+    parser.add_argument('--symbol-types',
+                        type=str,
+                        nargs='*',
+                        default=['cs'],
+                        help='IEX symbol types to evaluate, such as cs for common stock or et for ETFs, all if empty')
+    parser.add_argument('--exchanges', type=str, nargs='*', help='IEX exchange codes to evaluate, all if omitted')
+    parser.add_argument('--include-disabled-symbols',
+                        action='store_true',
+                        help='also evaluate symbols IEX marks as not enabled')
+    parser.add_argument('--earnings-index-file',
+                        type=str,
+                        help='SQLite index receiving every fetched earnings per share series, see screen.py')
+    parser.add_argument('--earnings-index-quarters',
+                        type=int,
+                        default=0,
+                        help='quarters fetched and indexed at least, allowing screens over longer windows')
+    parser.add_argument('--earnings-index-years',
+                        type=int,
+                        default=0,
+                        help='years fetched and indexed at least, allowing screens over longer windows')
+    parser.add_argument('--incremental-state-file',
+                        type=str,
+                        help='SQLite file of previous verdicts, only symbols with new filings are evaluated again')
+    parser.add_argument('--min-days-between-filings',
+                        type=int,
+                        default=IncrementalSymbolFilter.DEFAULT_MIN_DAYS_BETWEEN_FILINGS,
+                        help='days after the last filing before an incremental scan checks a symbol for a new one')
+    parser.add_argument('--record-archive', type=str, help='file recording every raw API response of this run')
+    parser.add_argument('--replay-archive',
+                        type=str,
+                        help='file of recorded API responses to serve instead of calling the APIs')
+    parser.add_argument('--iex-base-uri', type=str, default=IexApi.SANDBOX_URI, help='base URI of IEX Cloud')
+    parser.add_argument('--alpha-vantage-base-uri',
+                        type=str,
+                        default=AlphaVantageApi.BASE_URI,
+                        help='base URI of Alpha Vantage')
+    parser.add_argument('--earnings-data-sources',
+                        choices=['alpha-vantage', 'iex'],
+                        nargs='+',
+                        default=['alpha-vantage'],
+                        help='data sources of earnings per share, several are routed by quota headroom and latency '
+                        'and fall back on each other')
+    parser.add_argument('--hedge-delay-seconds',
+                        type=float,
+                        help='seconds before a slow earnings request is also sent to the next data source')
+    parser.add_argument('--retry-deadline-seconds',
+                        type=float,
+                        help='seconds after which an API call stops retrying throttled or failed requests')
+    parser.add_argument('--metrics-file',
+                        type=str,
+                        help='file rewritten with metrics in Prometheus text format while the scan runs')
+    parser.add_argument('--metrics-port',
+                        type=int,
+                        help='port serving metrics in Prometheus text format at /metrics, shards add their index')
+    parser.add_argument('--metrics-interval-seconds',
+                        type=float,
+                        default=15,
+                        help='seconds between rewrites of the metrics file')
+    parser.add_argument('--profile-file', type=str, help='file receiving cProfile statistics of symbol evaluation')
+    parser.add_argument('--profile-sample-rate',
+                        type=float,
+                        default=1.0,
+                        help='fraction of symbol evaluations profiled when --profile-file is given')
+    parser.add_argument('--output-format',
+                        choices=['jsonl', 'csv', 'parquet'],
+                        default='jsonl',
+                        help='format of the scan results, parquet requires pyarrow')
+    parser.add_argument('--run-id', type=str, help='name of the run used for its journal and output files')
+    parser.add_argument('--shard-count',
+                        type=int,
+                        default=1,
+                        help='number of shards the symbol universe is partitioned into by symbol hash')
+    parser.add_argument('--shard-index',
+                        type=int,
+                        default=0,
+                        help='0-based shard scanned by this process, each shard may run on its own host and token')
+    parser.add_argument('--launch-shards',
+                        type=int,
+                        metavar='SHARD_COUNT',
+                        help='scan every shard in its own local process and merge their results')
+    parser.add_argument('--shard-alpha-vantage-tokens',
+                        type=str,
+                        nargs='+',
+                        help='one Alpha Vantage token per shard started with --launch-shards')
+    parser.add_argument('--merge-shards',
+                        type=str,
+                        metavar='RUN_ID',
+                        help='merge the shard results of a run and report missing or duplicated symbols')
     args = parser.parse_args()
 
-    iex_public_token = args.iex_public_token if args.iex_public_token else os.environ.get('IEX_PUBLIC_TOKEN')
+    if args.shard_count < 1 or not 0 <= args.shard_index < args.shard_count:
+        parser.error('--shard-index must be between 0 and --shard-count - 1')
+
+    # a single shard is an ordinary scan, which writes no shard manifests to merge
+    if args.launch_shards is not None and args.launch_shards < 2:
+        parser.error('--launch-shards needs at least 2 shards, scan without it for a single process')
+
+    if args.shard_alpha_vantage_tokens and len(args.shard_alpha_vantage_tokens) != args.launch_shards:
+        parser.error('--shard-alpha-vantage-tokens needs one token per shard of --launch-shards')
+
+    shard_partitioner = ShardPartitioner(args.shard_count)
+    shard_name = shard_partitioner.get_shard_name(args.shard_index) if args.shard_count > 1 else None
+
+    def get_shard_file_name(file_name: str) -> str:
+        file_name_root, file_name_extension = os.path.splitext(file_name)
+        return '{}_{}{}'.format(file_name_root, shard_name, file_name_extension)
+
+    # logging is only set up here, importing the package leaves the file system untouched
+    log_file_name = os.path.join('logs', '{}.log'.format(datetime.datetime.now().strftime('%Y-%m-%dT%H-%M-%S')))
+    if shard_name:
+        # shards started together would otherwise write to the same files
+        log_file_name = get_shard_file_name(log_file_name)
+        args.record_archive = get_shard_file_name(args.record_archive) if args.record_archive else None
+        args.metrics_file = get_shard_file_name(args.metrics_file) if args.metrics_file else None
+        args.metrics_port = args.metrics_port + args.shard_index if args.metrics_port is not None else None
+        args.profile_file = get_shard_file_name(args.profile_file) if args.profile_file else None
+    Logger.configure(log_file_name, level=getattr(logging, args.log_level), json_format=args.log_format == 'json')
+    logger.log_info('running with command line arguments {}', sys.argv)
+
+    journal_directory = './journals'
+    output_directory = './output'
+    run_id = args.resume if args.resume else args.run_id if args.run_id else datetime.datetime.now().strftime(
+        '%Y-%m-%dT%H-%M-%S')
+
+    # in the order the symbol filter runs them, shards and their merge share the columns of the result files
+    evaluator_names = [
+        YearlyEarningsPerShareIncrementEvaluator.__name__, QuarterlyEarningsPerShareIncrementEvaluator.__name__
+    ]
+
+    def create_result_sink(file_name: str, **kwargs):
+        if args.output_format == 'csv':
+            return CsvResultSink(file_name, evaluator_names, **kwargs)
+        elif args.output_format == 'parquet':
+            return ParquetResultSink(file_name, evaluator_names, **kwargs)
+        return JsonLinesResultSink(file_name, **kwargs)
+
+    def merge_shards(merged_run_id: str) -> dict:
+        manifest_file_names = sorted(
+            glob.glob(
+                os.path.join(journal_directory, '{}_shard-*-of-*.manifest.json'.format(glob.escape(merged_run_id)))))
+        if not manifest_file_names:
+            raise Exception('No shard manifests found for run {}'.format(merged_run_id))
+
+        merge_report = ShardResultMerger().merge(manifest_file_names)
+        if not os.path.exists(output_directory):
+            os.mkdir(output_directory)
+
+        with open(os.path.join(output_directory, 'merge_report_{}.json'.format(merged_run_id)), 'w') as report_file:
+            json.dump(merge_report, report_file, indent=2)
+        with open(os.path.join(output_directory, 'filtered_symbols_{}.txt'.format(merged_run_id)), 'w') as out_file:
+            out_file.write(''.join('{}\n'.format(i) for i in merge_report['passed_symbols']))
+
+        # only finished shards have published their result file, the report lists the symbols of the others as missing
+        shard_result_file_names = sorted(
+            glob.glob(
+                os.path.join(output_directory, 'scan_results_{}_shard-*-of-*.{}'.format(glob.escape(merged_run_id),
+                                                                                       args.output_format))))
+        merged_result_file_name = os.path.join(output_directory,
+                                               'scan_results_{}.{}'.format(merged_run_id, args.output_format))
+        merged_result_sink = create_result_sink(merged_result_file_name)
+        merged_symbols = set()
+        for shard_result_file_name in shard_result_file_names:
+            merged_symbols.update(merged_result_sink.append_file(shard_result_file_name, merged_symbols))
+        merged_result_sink.close()
+        logger.log_info('merged {} results of {} shard result files into {}', len(merged_symbols),
+                        len(shard_result_file_names), merged_result_file_name)
+
+        logger.log_info(
+            'merged {} shards of run {}: {} of {} symbols evaluated, {} passed, missing shards {}, '
+            'incomplete shards {}, {} missing, {} duplicated and {} misassigned symbols', len(manifest_file_names),
+            merged_run_id, merge_report['evaluated_symbols'], merge_report['expected_symbols'],
+            len(merge_report['passed_symbols']), merge_report['missing_shards'], merge_report['incomplete_shards'],
+            len(merge_report['missing_symbols']), len(merge_report['duplicated_symbols']),
+            len(merge_report['misassigned_symbols']))
+        return merge_report
+
+    if args.merge_shards:
+        merge_shards(args.merge_shards)
+        sys.exit(0)
+
+    if args.launch_shards:
+        launcher_options = [
+            '--launch-shards', '--shard-alpha-vantage-tokens', '--run-id', '--shard-index', '--shard-count'
+        ]
+        shard_environments = None
+        if args.shard_alpha_vantage_tokens:
+            launcher_options.append('--alpha-vantage-token')
+            shard_environments = [{'ALPHA_VANTAGE_TOKEN': i} for i in args.shard_alpha_vantage_tokens]
+        shard_arguments = LocalShardLauncher.remove_options(sys.argv[1:], launcher_options)
+
+        LocalShardLauncher(os.path.abspath(__file__), shard_arguments, args.launch_shards,
+                           shard_environments).launch(run_id)
+        sys.exit(1 if merge_shards(run_id)['missing_symbols'] else 0)
+
+    # recorded responses do not depend on the tokens they were requested with
+    default_token = ReplayDataSourceAdapter.REPLAY_TOKEN if args.replay_archive else None
+    iex_public_token = args.iex_public_token if args.iex_public_token else os.environ.get(
+        'IEX_PUBLIC_TOKEN', default_token)
     alpha_vantage_token = args.alpha_vantage_token if args.alpha_vantage_token else os.environ.get(
-        'ALPHA_VANTAGE_TOKEN')
+        'ALPHA_VANTAGE_TOKEN', default_token)
 
     if iex_public_token is None:
         raise Exception('Missing IEX public token')
@@ -33,33 +318,210 @@ if __name__ == "__main__":
     if alpha_vantage_token is None:
         raise Exception('Missing Alpha Vantage token')
 
-    iex_api = IexApi(iex_public_token)
+    response_cache = ResponseCache(
+        time_to_live_seconds=args.response_cache_ttl_hours * 60 * 60,
+        max_entries=args.response_cache_max_entries,
+        persistent_store=SqliteResponseStore(args.response_cache_file) if args.response_cache_file else None)
+
+    if args.replay_archive:
+        http_client = ReplayHttpClient(ResponseArchive(args.replay_archive))
+    else:
+        http_client = HttpClient(args.http_connect_timeout_seconds, args.http_read_timeout_seconds,
+                                 max(HttpClient.DEFAULT_POOL_SIZE, args.workers))
+
+    if args.alpha_vantage_calls_per_minute is None and not args.replay_archive:
+        args.alpha_vantage_calls_per_minute = AlphaVantageApi.CALLS_PER_MINUTE
+
+    if args.alpha_vantage_calls_per_day is None and not args.replay_archive:
+        args.alpha_vantage_calls_per_day = AlphaVantageApi.CALLS_PER_DAY
+
+    if args.iex_calls_per_minute is None and not args.replay_archive:
+        args.iex_calls_per_minute = IexApi.CALLS_PER_MINUTE
+
+    if args.record_archive:
+        http_client = RecordingHttpClient(http_client, ResponseArchive(args.record_archive, writable=True))
+
+    # daily budgets are kept next to the persisted responses, so that a restarted run knows the calls already spent
+    quota_store = SqliteQuotaStore(args.response_cache_file) if args.response_cache_file else None
+    iex_rate_limiter = RateLimiter.get_shared('IexApi:{}'.format(iex_public_token),
+                                              args.iex_calls_per_minute,
+                                              args.iex_calls_per_day,
+                                              quota_store=quota_store)
+    iex_api = IexApi(iex_public_token,
+                     response_cache,
+                     iex_rate_limiter,
+                     http_client,
+                     args.iex_base_uri,
+                     retry_deadline_seconds=args.retry_deadline_seconds)
     iex_api_adapter = IexDataSourceAdapter(iex_api)
 
-    alpha_vantage_api = AlphaVantageApi(alpha_vantage_token)
+    # throttled earnings calls are not retried in place: the router falls back to another data source and the scanner
+    # reschedules the symbol once every data source is throttled, so no worker sleeps through a backoff
+    is_routing_earnings = len(args.earnings_data_sources) > 1
+    alpha_vantage_rate_limiter = RateLimiter.get_shared('AlphaVantageApi:{}'.format(alpha_vantage_token),
+                                                        args.alpha_vantage_calls_per_minute,
+                                                        args.alpha_vantage_calls_per_day,
+                                                        quota_store=quota_store)
+    alpha_vantage_api = AlphaVantageApi(
+        alpha_vantage_token, response_cache, alpha_vantage_rate_limiter, http_client, args.alpha_vantage_base_uri, 0,
+        args.retry_deadline_seconds)
     alpha_vantage_api_adapter = AlphaVantageDataSourceAdapter(alpha_vantage_api)
 
+    earnings_data_source_adapters = {
+        'alpha-vantage': (alpha_vantage_api_adapter, alpha_vantage_rate_limiter),
+        'iex': (IexDataSourceAdapter(
+            IexApi(iex_public_token, response_cache, iex_rate_limiter, http_client, args.iex_base_uri, 0,
+                   args.retry_deadline_seconds)), iex_rate_limiter)
+    }
+    earnings_data_source_adapter, _ = earnings_data_source_adapters[args.earnings_data_sources[0]]
+    if is_routing_earnings:
+        earnings_data_source_adapter = RoutingDataSourceAdapter(
+            [earnings_data_source_adapters[i][0] for i in args.earnings_data_sources],
+            [earnings_data_source_adapters[i][1] for i in args.earnings_data_sources], args.hedge_delay_seconds)
+
+    earnings_per_share_index = None
+    evaluated_earnings_data_source_adapter = earnings_data_source_adapter
+    if args.earnings_index_file:
+        earnings_per_share_index = EarningsPerShareIndex(args.earnings_index_file)
+        evaluated_earnings_data_source_adapter = IndexingDataSourceAdapter(earnings_data_source_adapter,
+                                                                           earnings_per_share_index,
+                                                                           args.earnings_index_quarters,
+                                                                           args.earnings_index_years)
+
     quarterly_earnings_per_share_increment_evaluator = QuarterlyEarningsPerShareIncrementEvaluator(
-        alpha_vantage_api_adapter)
-    yearly_earnings_per_share_increment_evaluator = YearlyEarningsPerShareIncrementEvaluator(alpha_vantage_api_adapter)
+        evaluated_earnings_data_source_adapter)
+    yearly_earnings_per_share_increment_evaluator = YearlyEarningsPerShareIncrementEvaluator(
+        evaluated_earnings_data_source_adapter)
     symbol_filter = SymbolFilter(
-        [yearly_earnings_per_share_increment_evaluator, quarterly_earnings_per_share_increment_evaluator])
+        [yearly_earnings_per_share_increment_evaluator, quarterly_earnings_per_share_increment_evaluator],
+        adaptive_ordering=args.adaptive_evaluator_ordering,
+        api_call_counter=http_client.get_thread_request_count)
 
-    all_symbols = RetryExecutor().execute_with_exponential_backoff_retry(
-        iex_api_adapter.get_all_symbols, lambda exception: isinstance(exception, TooManyRequestsException))
+    profiling_symbol_filter = None
+    evaluated_symbol_filter = symbol_filter
+    if args.profile_file:
+        profiling_symbol_filter = ProfilingSymbolFilter(symbol_filter, args.profile_sample_rate)
+        evaluated_symbol_filter = profiling_symbol_filter
 
-    logger.log_info('retrieved [{}] symbols'.format(len(all_symbols)))
+    # symbols are parsed from the IEX response as it streams in and reach the evaluators before it is complete
+    symbol_record_filter = SymbolRecordFilter(args.symbol_types, args.exchanges, not args.include_disabled_symbols)
+    symbols = symbol_record_filter.filter_symbols(iex_api_adapter.stream_symbol_records())
+    number_of_symbols = None
+
+    assigned_symbols = []
+    if shard_name:
+        def collect_assigned_symbols(shard_symbols):
+            for symbol in shard_symbols:
+                assigned_symbols.append(symbol)
+                yield symbol
+
+        symbols = collect_assigned_symbols(shard_partitioner.filter_symbols(symbols, args.shard_index))
+
+    if args.schedule_day is not None:
+        # both evaluators share one cached EARNINGS response, so each symbol costs a single Alpha Vantage call
+        quota_planner = QuotaPlanner(args.alpha_vantage_calls_per_day or AlphaVantageApi.CALLS_PER_DAY)
+        symbols = list(symbols)
+        logger.log_info('scanning day {} of a {} day schedule with {} symbols per day', args.schedule_day,
+                        quota_planner.get_number_of_days(symbols), quota_planner.get_symbols_per_day())
+        symbols = quota_planner.get_symbols_for_day(symbols, args.schedule_day)
+        number_of_symbols = len(symbols)
+
+    # shards of one run keep their own journal and output so that they can run on different hosts
+    run_name = '{}_{}'.format(run_id, shard_name) if shard_name else run_id
+    journal_file_name = os.path.join(journal_directory, '{}.jsonl'.format(run_name))
+    if args.resume and not os.path.exists(journal_file_name):
+        raise Exception('No journal found for run {}'.format(run_id))
+
+    configuration_fingerprint = ScanJournal.create_fingerprint(symbol_filter)
 
-    output_directory = './output'
     if not os.path.exists(output_directory):
         os.mkdir(output_directory)
-    output_file_name = os.path.join(
-        output_directory, 'filtered_symbols_{}.txt'.format(datetime.datetime.now().strftime('%Y-%m-%dT%H-%M-%S')))
+    # every evaluated symbol is written with its evaluator details, a resumed run continues the same file
+    output_file_name = os.path.join(output_directory, 'scan_results_{}.{}'.format(run_name, args.output_format))
+    # results are flushed by the journal right before it records their symbols, so a crash cannot lose results of
+    # symbols that a resumed run skips
+    result_sink_options = {'append': bool(args.resume), 'batch_size': None, 'flush_interval_seconds': None}
+    result_sink = create_result_sink(output_file_name, **result_sink_options)
+    scan_journal = ScanJournal(journal_file_name, configuration_fingerprint, before_flush=result_sink.flush)
+
+    incremental_scan_state = None
+    scanned_symbol_filter = evaluated_symbol_filter
+    if args.incremental_state_file:
+        incremental_scan_state = IncrementalScanState(args.incremental_state_file)
+        # only Alpha Vantage reports filing dates
+        scanned_symbol_filter = IncrementalSymbolFilter(
+            evaluated_symbol_filter, earnings_data_source_adapter if is_routing_earnings else alpha_vantage_api_adapter,
+            incremental_scan_state, configuration_fingerprint, args.min_days_between_filings)
+    if args.resume:
+        completed_symbols = set(scan_journal.get_completed_symbols())
+        symbols = (i for i in symbols if i not in completed_symbols)
+        number_of_symbols = None
+        logger.log_info('resuming run {} with {} symbols completed', run_id, len(completed_symbols))
+
+    progress_reporter = ScanProgressReporter(args.progress_interval_seconds, number_of_symbols)
+    metrics_exporter = MetricsExporter(prometheus_file_name=args.metrics_file,
+                                       port=args.metrics_port,
+                                       write_interval_seconds=args.metrics_interval_seconds)
+    metrics_exporter.start()
+
+    def write_result(symbol: str, symbol_passed: bool, symbol_evaluations) -> None:
+        progress_reporter.record_result(symbol_passed)
+        result_sink.write(ScanResult(symbol, symbol_passed, symbol_evaluations))
+        scan_journal.record(symbol, symbol_passed)
+
+        if symbol_passed:
+            logger.log_info('found symbol {}', symbol)
+
+    is_scan_complete = False
+    try:
+        ConcurrentSymbolScanner(scanned_symbol_filter, args.workers,
+                                batch_size=args.batch_size).scan(symbols, write_result, with_details=True)
+        is_scan_complete = True
+    except DailyQuotaExceededException:
+        logger.log_warning('daily API quota exhausted, stopping scan, continue with --resume {}', run_id)
+    except TooManyRequestsException:
+        # the scanner gave up rescheduling symbols that every data source kept throttling
+        logger.log_warning('API calls still throttled after rescheduling, stopping scan, continue with --resume {}',
+                           run_id)
+    except KeyboardInterrupt:
+        logger.log_warning('scan interrupted, continue with --resume {}', run_id)
+    finally:
+        metrics_exporter.stop()
+        scan_journal.close()
+        result_sink.close()
+        logger.log_info('wrote scan results to {}', output_file_name)
+        if shard_name:
+            # an interrupted shard has not read the whole universe, so its assigned symbols may be incomplete
+            shard_manifest = ShardManifest(run_id, args.shard_index, args.shard_count, configuration_fingerprint,
+                                           journal_file_name, assigned_symbols, is_scan_complete)
+            shard_manifest.write(os.path.join(journal_directory, '{}.manifest.json'.format(run_name)))
+        if incremental_scan_state is not None:
+            logger.log_info('incremental scan statistics {}', scanned_symbol_filter.get_statistics())
+            incremental_scan_state.close()
+        if earnings_per_share_index is not None:
+            earnings_per_share_index.close()
+
+    progress_reporter.report()
+    logger.log_info('scan summary {}', progress_reporter.get_summary())
+    logger.log_info('symbol pre-filter statistics {}', symbol_record_filter.get_statistics())
+    logger.log_info('evaluator statistics {}', symbol_filter.get_evaluator_statistics())
+
+    metrics_summary_file_name = os.path.join(output_directory, 'metrics_{}.json'.format(run_name))
+    metrics_exporter.write_json_summary(metrics_summary_file_name)
+    logger.log_info('wrote metrics summary to {}', metrics_summary_file_name)
+
+    if profiling_symbol_filter is not None:
+        profiling_symbol_filter.dump_statistics(args.profile_file)
+        logger.log_info('profile of symbol evaluation\n{}', profiling_symbol_filter.get_statistics_text())
+
+    if is_routing_earnings:
+        logger.log_info('earnings data source statistics {}', earnings_data_source_adapter.get_statistics())
+        earnings_data_source_adapter.close()
 
-    for symbol in all_symbols:
-        logger.log_info('processing symbol {}'.format(symbol))
+    logger.log_info('response cache statistics {}', response_cache.get_statistics())
+    response_cache.close()
+    if quota_store is not None:
+        quota_store.close()
 
-        if symbol_filter.filter(symbol):
-            logger.log_info('found symbol {}'.format(symbol))
-            with open(output_file_name, 'a') as out_file:
-                out_file.write(symbol)
+    logger.log_info('HTTP connection statistics {}', http_client.get_connection_statistics())
+    http_client.close()
@@ -0,0 +1,60 @@
+import argparse
+import logging
+import sys
+import time
+
+from stock_data_analysis.data_sources import EarningsPerShareIndex
+from stock_data_analysis.data_sources import EarningsPerShareIndexDataSourceAdapter
+from stock_data_analysis.symbol_filters import QuarterlyEarningsPerShareIncrementEvaluator
+from stock_data_analysis.symbol_filters import SymbolFilter
+from stock_data_analysis.symbol_filters import YearlyEarningsPerShareIncrementEvaluator
+from stock_data_analysis.utilities import Logger
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description='screen symbols from an earnings index written by main.py --earnings-index-file, without API calls')
+    parser.add_argument('earnings_index_file', type=str, help='SQLite earnings per share index')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    growth_parser = subparsers.add_parser('growth', help='symbols with consecutive periods of growth above a threshold')
+    growth_parser.add_argument('--period-type',
+                               choices=[EarningsPerShareIndex.QUARTERLY, EarningsPerShareIndex.YEARLY],
+                               default=EarningsPerShareIndex.QUARTERLY,
+                               help='quarterly growth is year over year, yearly growth is against the previous year')
+    growth_parser.add_argument('--min-growth', type=float, required=True, help='growth to exceed, 0.3 for 30%%')
+    growth_parser.add_argument('--periods', type=int, default=3, help='number of consecutive periods')
+    growth_parser.add_argument('--anywhere',
+                               action='store_true',
+                               help='also accept streaks that do not end with the latest period')
+
+    evaluate_parser = subparsers.add_parser('evaluate', help='run the scan evaluators with other thresholds')
+    evaluate_parser.add_argument('--quarterly-threshold', type=float, default=0.25)
+    evaluate_parser.add_argument('--quarters', type=int, default=3, help='number of quarters to check')
+    evaluate_parser.add_argument('--yearly-threshold', type=float, default=0.25)
+    evaluate_parser.add_argument('--years', type=int, default=3, help='number of years to check')
+    args = parser.parse_args()
+
+    # evaluators log every symbol, a screen only prints its result
+    Logger.configure(level=logging.WARNING)
+
+    earnings_per_share_index = EarningsPerShareIndex(args.earnings_index_file)
+    start_time = time.perf_counter()
+
+    if args.command == 'growth':
+        symbols = earnings_per_share_index.find_growth_streaks(args.period_type, args.min_growth, args.periods,
+                                                               not args.anywhere)
+    else:
+        index_data_source_adapter = EarningsPerShareIndexDataSourceAdapter(earnings_per_share_index)
+        symbol_filter = SymbolFilter([
+            YearlyEarningsPerShareIncrementEvaluator(index_data_source_adapter, args.yearly_threshold, args.years),
+            QuarterlyEarningsPerShareIncrementEvaluator(index_data_source_adapter, args.quarterly_threshold,
+                                                        args.quarters)
+        ])
+        symbols = symbol_filter.filter_symbols(index_data_source_adapter.get_all_symbols())
+
+    elapsed_milliseconds = (time.perf_counter() - start_time) * 1000
+    earnings_per_share_index.close()
+
+    for symbol in symbols:
+        print(symbol)
+    print('{} symbols matched in {:.1f} ms'.format(len(symbols), elapsed_milliseconds), file=sys.stderr)
@@ -1,4 +1,15 @@
-from . import data_sources
-from . import exceptions
-from . import symbol_filters
-from . import utilities
+import importlib
+
+# subpackages are imported on first use, a worker that only needs scanning does not pay for the rest
+_SUBPACKAGE_NAMES = ('data_sources', 'exceptions', 'symbol_filters', 'utilities', 'scanning')
+
+
+def __getattr__(name: str):
+    if name not in _SUBPACKAGE_NAMES:
+        raise AttributeError('module {} has no attribute {}'.format(__name__, name))
+
+    return importlib.import_module('.' + name, __name__)
+
+
+def __dir__() -> [str]:
+    return sorted(set(globals()) | set(_SUBPACKAGE_NAMES))
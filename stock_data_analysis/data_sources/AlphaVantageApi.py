@@ -1,17 +1,33 @@
+import collections
 import json
-import logging
+import threading
 
+from . import EarningsRecord
 from . import HttpStatusCodes
 from ..exceptions import BadRequestException
+from ..exceptions import DailyQuotaExceededException
+from ..exceptions import ServerErrorException
 from ..exceptions import TooManyRequestsException
+from ..utilities import HttpClient
 from ..utilities import HttpRequestHandler
+from ..utilities import MetricsRegistry
+from ..utilities import RateLimiter
+from ..utilities import ResponseCache
 from ..utilities import RetryExecutor
 from ..utilities import Logger
 
 
 class AlphaVantageApi:
     DEMO_API_KEY = 'demo'
-    URI = 'https://www.alphavantage.co/query?function={}&symbol={}&apikey={}'
+    BASE_URI = 'https://www.alphavantage.co'
+    URI = '{}/query?function={}&symbol={}&apikey={}'
+    CALLS_PER_MINUTE = 5
+    CALLS_PER_DAY = 500
+    EARNINGS_ENDPOINT = 'alpha_vantage_earnings'
+    MAX_THROTTLE_RETRIES = 2
+    # the throttled response has no Retry-After header, the per minute quota is free again after a minute
+    THROTTLE_RETRY_AFTER_SECONDS = 60
+    MAX_EARNINGS_RECORDS = 4096
     RATE_THROTTLED_RESPONSE = {
         "Note":
         "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute and 500 calls "
@@ -19,29 +35,112 @@ class AlphaVantageApi:
         "frequency."
     }
 
-    def __init__(self, api_key: str = DEMO_API_KEY):
+    def __init__(self,
+                 api_key: str = DEMO_API_KEY,
+                 response_cache: ResponseCache = None,
+                 rate_limiter: RateLimiter = None,
+                 http_client: HttpClient = None,
+                 base_uri: str = BASE_URI,
+                 max_throttle_retries: int = MAX_THROTTLE_RETRIES,
+                 retry_deadline_seconds: float = None):
         self._api_key = api_key
+        self._base_uri = base_uri
+        self._max_throttle_retries = max_throttle_retries
+        self._retry_deadline_seconds = retry_deadline_seconds
+        self._http_client = http_client
+        self._response_cache = response_cache
+        self._rate_limiter = rate_limiter if rate_limiter else RateLimiter.get_shared(
+            '{}:{}'.format(self.__class__.__name__, api_key), AlphaVantageApi.CALLS_PER_MINUTE,
+            AlphaVantageApi.CALLS_PER_DAY)
+        # the evaluators of a symbol share one parsed record instead of parsing the cached response each, the record is
+        # kept with the cache version of its response instead of a copy of the response
+        self._earnings_records = collections.OrderedDict()
+        self._earnings_records_lock = threading.Lock()
+        self._metrics_registry = MetricsRegistry.get_default()
         self._logger = Logger(self.__class__.__name__)
 
     def get_quarterly_and_annual_earnings_per_share(self, symbol: str) -> dict:
+        response_text, _ = self._get_earnings_response(symbol)
+        with self._metrics_registry.time('json_parse_seconds', endpoint=AlphaVantageApi.EARNINGS_ENDPOINT):
+            return json.loads(response_text)
+
+    def get_earnings_record(self, symbol: str) -> EarningsRecord:
+        response_text, response_version = self._get_earnings_response(symbol)
+        with self._earnings_records_lock:
+            record_response_version, earnings_record = self._earnings_records.get(symbol, (None, None))
+            if response_version is not None and record_response_version == response_version:
+                self._earnings_records.move_to_end(symbol)
+                return earnings_record
+
+        with self._metrics_registry.time('json_parse_seconds', endpoint=AlphaVantageApi.EARNINGS_ENDPOINT):
+            earnings_record = EarningsRecord.from_alpha_vantage_response(response_text)
+
+        with self._earnings_records_lock:
+            self._earnings_records[symbol] = (response_version, earnings_record)
+            self._earnings_records.move_to_end(symbol)
+            if len(self._earnings_records) > AlphaVantageApi.MAX_EARNINGS_RECORDS:
+                self._earnings_records.popitem(last=False)
+
+        return earnings_record
+
+    def _get_earnings_response(self, symbol: str) -> (str, int):
         def execute_api_request():
-            http_response = HttpRequestHandler.get(AlphaVantageApi.URI.format('EARNINGS', symbol, self._api_key))
+            with self._metrics_registry.time('rate_limiter_wait_seconds', endpoint=AlphaVantageApi.EARNINGS_ENDPOINT):
+                self._rate_limiter.acquire()
+
+            with self._metrics_registry.time('api_request_seconds', endpoint=AlphaVantageApi.EARNINGS_ENDPOINT):
+                http_response = HttpRequestHandler.get(
+                    AlphaVantageApi.URI.format(self._base_uri, 'EARNINGS', symbol, self._api_key), self._http_client)
+            self._metrics_registry.increment('api_responses_total',
+                                             endpoint=AlphaVantageApi.EARNINGS_ENDPOINT,
+                                             status_code=http_response.status_code)
             self._logger.log_info(
-                'Getting quarterly and annual earnings per share for symbol {} returned status code {} and response {}'.
-                format(symbol, http_response.status_code, http_response.text))
+                'Getting quarterly and annual earnings per share for symbol {} returned status code {}', symbol,
+                http_response.status_code)
+            self._logger.log_debug('Quarterly and annual earnings per share response for symbol {}: {}', symbol,
+                                   http_response.text)
 
+            # error responses are raised instead of returned so that they never reach the response cache
             if http_response.status_code == HttpStatusCodes.BAD_REQUEST_STATUS_CODE:
                 raise BadRequestException()
 
-            json_response = json.loads(http_response.text)
-            if json_response == AlphaVantageApi.RATE_THROTTLED_RESPONSE:
-                logging.info('Exceeded rate limit')
-                raise TooManyRequestsException()
+            if http_response.status_code == HttpStatusCodes.TOO_MANY_REQUESTS_STATUS_CODE:
+                self._metrics_registry.increment('throttle_events_total', endpoint=AlphaVantageApi.EARNINGS_ENDPOINT)
+                raise TooManyRequestsException(
+                    RetryExecutor.parse_retry_after(http_response.headers.get('Retry-After')))
+
+            if http_response.status_code >= HttpStatusCodes.INTERNAL_SERVER_ERROR_STATUS_CODE:
+                raise ServerErrorException(http_response.status_code)
+
+            if http_response.status_code != HttpStatusCodes.OK_STATUS_CODE:
+                raise BadRequestException('status code {}'.format(http_response.status_code))
+
+            # only the small error payloads are parsed here, earnings are parsed once when they are read
+            if '"Note"' in http_response.text and \
+                    json.loads(http_response.text) == AlphaVantageApi.RATE_THROTTLED_RESPONSE:
+                self._logger.log_info('Exceeded rate limit')
+                self._metrics_registry.increment('throttle_events_total', endpoint=AlphaVantageApi.EARNINGS_ENDPOINT)
+                raise TooManyRequestsException(AlphaVantageApi.THROTTLE_RETRY_AFTER_SECONDS)
+
+            if '"Error Message"' in http_response.text or '"Information"' in http_response.text:
+                error_response = json.loads(http_response.text)
+                # an invalid call, such as an unknown symbol, is answered with status code 200 and an error message
+                if 'Error Message' in error_response:
+                    raise BadRequestException(error_response['Error Message'])
+
+                # exhausted daily requests and premium only functions are answered with an information message
+                if 'Information' in error_response:
+                    raise DailyQuotaExceededException(error_response['Information'])
+
+            return http_response.text
 
-            return json_response
+        def execute_api_request_with_retry():
+            return HttpRequestHandler.execute_with_retry(execute_api_request, self._max_throttle_retries,
+                                                         self._retry_deadline_seconds)
 
-        def can_retry(exception):
-            return isinstance(exception, TooManyRequestsException)
+        if self._response_cache is None:
+            # without a cache every call fetches a new response
+            return execute_api_request_with_retry(), None
 
-        return RetryExecutor(max_retries=2, initial_backoff_seconds=70).execute_with_exponential_backoff_retry(
-            execute_api_request, can_retry)
+        return self._response_cache.get_or_fetch_entry('{}:EARNINGS:{}'.format(self.__class__.__name__, symbol),
+                                                       execute_api_request_with_retry)
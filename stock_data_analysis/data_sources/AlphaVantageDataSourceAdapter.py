@@ -1,5 +1,7 @@
 from . import AlphaVantageApi
+from . import EarningsRecord
 from ..data_sources import IDataSourceAdapter
+from ..exceptions import BadRequestException
 from ..exceptions import NotSupportedByApiException
 from ..utilities import Logger
 
@@ -16,37 +18,44 @@ class AlphaVantageDataSourceAdapter(IDataSourceAdapter):
         raise NotSupportedByApiException()
 
     def get_quarterly_earnings_per_share(self, symbol: str, number_of_quarters: int) -> [float]:
-        quarterly_and_yearly_earnings_per_share = self._alpha_vantage_api.get_quarterly_and_annual_earnings_per_share(
-            symbol)
-
-        if not quarterly_and_yearly_earnings_per_share:
-            self._logger.log_info('{} obtained empty quarterly and yearly earnings response for symbol {}'.format(
-                str(self), symbol))
+        try:
+            earnings_record = self._alpha_vantage_api.get_earnings_record(symbol)
+        except BadRequestException:
             return []
 
-        if 'quarterlyEarnings' not in quarterly_and_yearly_earnings_per_share:
-            self._logger.log_info('{} quarterly earnings not present in API response'.format(str(self)))
+        if not earnings_record.quarterly_period_ends:
+            self._logger.log_info('{} quarterly earnings not present in API response for symbol {}', self, symbol)
             return []
 
-        return [
-            float(i['reportedEPS'])
-            for i in quarterly_and_yearly_earnings_per_share['quarterlyEarnings'][-number_of_quarters:]
-        ]
+        return earnings_record.get_quarterly_earnings_per_share(number_of_quarters)
 
     def get_yearly_earnings_per_share(self, symbol: str, number_of_years: int) -> [float]:
-        quarterly_and_yearly_earnings_per_share = self._alpha_vantage_api.get_quarterly_and_annual_earnings_per_share(
-            symbol)
-
-        if not quarterly_and_yearly_earnings_per_share:
-            self._logger.log_info('{} obtained empty quarterly and yearly earnings response for symbol {}'.format(
-                str(self), symbol))
+        try:
+            earnings_record = self._alpha_vantage_api.get_earnings_record(symbol)
+        except BadRequestException:
             return []
 
-        if 'annualEarnings' not in quarterly_and_yearly_earnings_per_share:
-            self._logger.log_info('{} yearly earnings not present in API response'.format(str(self)))
+        if not earnings_record.yearly_period_ends:
+            self._logger.log_info('{} yearly earnings not present in API response for symbol {}', self, symbol)
             return []
 
-        return [
-            float(i['reportedEPS'])
-            for i in quarterly_and_yearly_earnings_per_share['annualEarnings'][-number_of_years:]
-        ]
+        return earnings_record.get_yearly_earnings_per_share(number_of_years)
+
+    def get_earnings_record(self, symbol: str, number_of_quarters: int, number_of_years: int) -> EarningsRecord:
+        # the EARNINGS response has every period of both series, whatever number of periods is asked for
+        try:
+            return self._alpha_vantage_api.get_earnings_record(symbol)
+        except BadRequestException:
+            return EarningsRecord()
+
+    def get_latest_earnings_report_dates(self, symbol: str) -> (str, str):
+        try:
+            latest_earnings_report_dates = self._alpha_vantage_api.get_earnings_record(
+                symbol).get_latest_quarterly_report_dates()
+        except BadRequestException:
+            return None
+
+        if latest_earnings_report_dates is None:
+            self._logger.log_info('{} quarterly earnings not present in API response for symbol {}', self, symbol)
+
+        return latest_earnings_report_dates
@@ -0,0 +1,156 @@
+import math
+import os
+import sqlite3
+import threading
+import time
+
+from . import EarningsRecord
+
+
+class EarningsPerShareIndex:
+    QUARTERLY = 'quarterly'
+    YEARLY = 'yearly'
+    # growth is compared with the same quarter of the previous year, and with the previous year for yearly series
+    GROWTH_LAGS = {QUARTERLY: 4, YEARLY: 1}
+    MAX_QUERY_SYMBOLS = 500
+
+    def __init__(self, database_file_name: str):
+        database_folder_name = os.path.dirname(database_file_name)
+        if database_folder_name and not os.path.exists(database_folder_name):
+            os.makedirs(database_folder_name)
+
+        self._lock = threading.Lock()
+        # shards of a run share one index, every update is committed at once so that none of them waits long
+        self._connection = sqlite3.connect(database_file_name, timeout=30, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        # periods are numbered backwards from the most recent one, which is period 0
+        self._connection.execute('CREATE TABLE IF NOT EXISTS earnings_per_share (symbol TEXT NOT NULL, '
+                                 'period_type TEXT NOT NULL, periods_ago INTEGER NOT NULL, '
+                                 'earnings_per_share REAL NOT NULL, growth REAL, data_source_name TEXT, '
+                                 'indexed_at REAL NOT NULL, period_end TEXT, '
+                                 'PRIMARY KEY (symbol, period_type, periods_ago))')
+        # indexes created before periods were matched by their end lack that column
+        if 'period_end' not in [i[1] for i in self._connection.execute('PRAGMA table_info(earnings_per_share)')]:
+            self._connection.execute('ALTER TABLE earnings_per_share ADD COLUMN period_end TEXT')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS earnings_per_share_period '
+                                 'ON earnings_per_share (period_type, periods_ago, growth)')
+        self._connection.commit()
+
+    @staticmethod
+    def compute_growth(earnings_per_share: [float], period_type: str) -> [float]:
+        growth_lag = EarningsPerShareIndex.GROWTH_LAGS[period_type]
+
+        growth = []
+        for i, current in enumerate(earnings_per_share):
+            previous = earnings_per_share[i - growth_lag] if i >= growth_lag else None
+            growth.append((current - previous) / previous if previous else None)
+
+        return growth
+
+    def put(self,
+            symbol: str,
+            period_type: str,
+            earnings_per_share: [float],
+            data_source_name: str = None,
+            period_ends: [str] = None) -> None:
+        indexed_at = time.time()
+        periods = [(None if period_ends is None else period_ends[i], value, data_source_name, indexed_at)
+                   for i, value in enumerate(earnings_per_share)]
+
+        with self._lock:
+            # shards of a run share the index, so the stored periods must not change before the merged ones are written
+            self._connection.execute('BEGIN IMMEDIATE')
+            if periods and all(i[0] is not None for i in periods):
+                # periods are matched by their end, so a fetch of fewer periods than are stored only replaces the
+                # periods it has, stored periods without an end cannot be matched and are dropped
+                stored_periods = self._connection.execute(
+                    'SELECT period_end, earnings_per_share, data_source_name, indexed_at FROM earnings_per_share '
+                    'WHERE symbol = ? AND period_type = ? AND period_end IS NOT NULL', (symbol, period_type)).fetchall()
+                periods_by_end = {i[0]: i for i in stored_periods}
+                periods_by_end.update((i[0], i) for i in periods)
+                periods = sorted(periods_by_end.values(), key=lambda i: i[0])
+
+            growths = EarningsPerShareIndex.compute_growth([i[1] for i in periods], period_type)
+            rows = [(symbol, period_type, len(periods) - 1 - i, period[1], growth, period[2], period[3], period[0])
+                    for i, (period, growth) in enumerate(zip(periods, growths))]
+
+            self._connection.execute('DELETE FROM earnings_per_share WHERE symbol = ? AND period_type = ?',
+                                     (symbol, period_type))
+            self._connection.executemany(
+                'INSERT INTO earnings_per_share (symbol, period_type, periods_ago, earnings_per_share, growth, '
+                'data_source_name, indexed_at, period_end) VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            self._connection.commit()
+
+    def put_earnings_record(self, symbol: str, earnings_record: EarningsRecord, data_source_name: str = None) -> None:
+        series = [(EarningsPerShareIndex.QUARTERLY, earnings_record.quarterly_period_ends,
+                   earnings_record.quarterly_earnings_per_share),
+                  (EarningsPerShareIndex.YEARLY, earnings_record.yearly_period_ends,
+                   earnings_record.yearly_earnings_per_share)]
+
+        for period_type, period_ends, earnings_per_share in series:
+            # growth over a period without earnings is meaningless, so only the periods after the latest gap are kept
+            first_period = len(earnings_per_share)
+            while first_period > 0 and not math.isnan(earnings_per_share[first_period - 1]):
+                first_period -= 1
+
+            # a series that is missing from the record keeps the periods stored for it
+            if first_period < len(earnings_per_share):
+                self.put(symbol, period_type, earnings_per_share[first_period:].tolist(), data_source_name,
+                         period_ends[first_period:])
+
+    def get(self, symbol: str, period_type: str, number_of_periods: int) -> [float]:
+        return self.get_batch([symbol], period_type, number_of_periods)[symbol]
+
+    def get_batch(self, symbols: [str], period_type: str, number_of_periods: int) -> {str: [float]}:
+        earnings_per_share_by_symbol = {symbol: [] for symbol in symbols}
+
+        with self._lock:
+            for start_index in range(0, len(symbols), EarningsPerShareIndex.MAX_QUERY_SYMBOLS):
+                batch_symbols = symbols[start_index:start_index + EarningsPerShareIndex.MAX_QUERY_SYMBOLS]
+                rows = self._connection.execute(
+                    'SELECT symbol, earnings_per_share FROM earnings_per_share '
+                    'WHERE period_type = ? AND periods_ago < ? AND symbol IN ({}) '
+                    'ORDER BY symbol, periods_ago DESC'.format(', '.join('?' * len(batch_symbols))),
+                    [period_type, number_of_periods] + list(batch_symbols)).fetchall()
+
+                for symbol, earnings_per_share in rows:
+                    earnings_per_share_by_symbol[symbol].append(earnings_per_share)
+
+        return earnings_per_share_by_symbol
+
+    def get_growth(self, symbol: str, period_type: str, number_of_periods: int) -> [float]:
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT growth FROM earnings_per_share WHERE symbol = ? AND period_type = ? AND periods_ago < ? '
+                'ORDER BY periods_ago DESC', (symbol, period_type, number_of_periods)).fetchall()
+
+        return [i[0] for i in rows]
+
+    def get_symbols(self) -> [str]:
+        with self._lock:
+            rows = self._connection.execute('SELECT DISTINCT symbol FROM earnings_per_share ORDER BY symbol').fetchall()
+
+        return [i[0] for i in rows]
+
+    def find_growth_streaks(self,
+                            period_type: str,
+                            min_growth: float,
+                            number_of_periods: int,
+                            ending_with_latest_period: bool = True) -> [str]:
+        assert number_of_periods >= 1
+
+        # consecutive periods above the threshold share the difference between their number and their rank
+        with self._lock:
+            rows = self._connection.execute(
+                'WITH growing_periods AS (SELECT symbol, periods_ago, periods_ago - ROW_NUMBER() OVER '
+                '(PARTITION BY symbol ORDER BY periods_ago) AS streak FROM earnings_per_share '
+                'WHERE period_type = ? AND growth > ?) '
+                'SELECT DISTINCT symbol FROM growing_periods GROUP BY symbol, streak '
+                'HAVING COUNT(*) >= ? AND (? = 0 OR MIN(periods_ago) = 0) ORDER BY symbol',
+                (period_type, min_growth, number_of_periods, int(ending_with_latest_period))).fetchall()
+
+        return [i[0] for i in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
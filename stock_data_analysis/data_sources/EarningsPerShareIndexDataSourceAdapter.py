@@ -0,0 +1,25 @@
+from . import EarningsPerShareIndex
+from . import IDataSourceAdapter
+
+
+class EarningsPerShareIndexDataSourceAdapter(IDataSourceAdapter):
+    def __init__(self, earnings_per_share_index: EarningsPerShareIndex):
+        self._earnings_per_share_index = earnings_per_share_index
+
+    def __str__(self):
+        return self.__class__.__name__
+
+    def get_all_symbols(self) -> [str]:
+        return self._earnings_per_share_index.get_symbols()
+
+    def get_quarterly_earnings_per_share(self, symbol: str, number_of_quarters: int) -> [float]:
+        return self._earnings_per_share_index.get(symbol, EarningsPerShareIndex.QUARTERLY, number_of_quarters)
+
+    def get_yearly_earnings_per_share(self, symbol: str, number_of_years: int) -> [float]:
+        return self._earnings_per_share_index.get(symbol, EarningsPerShareIndex.YEARLY, number_of_years)
+
+    def get_quarterly_earnings_per_share_batch(self, symbols: [str], number_of_quarters: int) -> {str: [float]}:
+        return self._earnings_per_share_index.get_batch(symbols, EarningsPerShareIndex.QUARTERLY, number_of_quarters)
+
+    def get_yearly_earnings_per_share_batch(self, symbols: [str], number_of_years: int) -> {str: [float]}:
+        return self._earnings_per_share_index.get_batch(symbols, EarningsPerShareIndex.YEARLY, number_of_years)
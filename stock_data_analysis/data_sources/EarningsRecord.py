@@ -0,0 +1,112 @@
+import array
+import json
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class EarningsRecord:
+    __slots__ = ('quarterly_period_ends', 'quarterly_reported_dates', 'quarterly_earnings_per_share',
+                 'yearly_period_ends', 'yearly_earnings_per_share')
+
+    def __init__(self,
+                 quarterly_period_ends: tuple = (),
+                 quarterly_reported_dates: tuple = (),
+                 quarterly_earnings_per_share: array.array = None,
+                 yearly_period_ends: tuple = (),
+                 yearly_earnings_per_share: array.array = None):
+        # every series is ordered oldest first, missing earnings per share are NaN
+        self.quarterly_period_ends = quarterly_period_ends
+        self.quarterly_reported_dates = quarterly_reported_dates
+        self.quarterly_earnings_per_share = quarterly_earnings_per_share if quarterly_earnings_per_share is not None \
+            else array.array('d')
+        self.yearly_period_ends = yearly_period_ends
+        self.yearly_earnings_per_share = yearly_earnings_per_share if yearly_earnings_per_share is not None \
+            else array.array('d')
+        assert len(self.quarterly_period_ends) == len(self.quarterly_earnings_per_share)
+        assert len(self.yearly_period_ends) == len(self.yearly_earnings_per_share)
+
+    @staticmethod
+    def loads(json_text: str):
+        return orjson.loads(json_text) if orjson is not None else json.loads(json_text)
+
+    @staticmethod
+    def to_float(earnings_per_share) -> float:
+        # Alpha Vantage reports the string None and IEX null for periods without earnings
+        try:
+            return float(earnings_per_share)
+        except (TypeError, ValueError):
+            return math.nan
+
+    @classmethod
+    def from_alpha_vantage_response(cls, response_text: str):
+        earnings = EarningsRecord.loads(response_text) if response_text else None
+        if not isinstance(earnings, dict):
+            return cls()
+
+        # Alpha Vantage lists the most recent period first
+        quarterly_earnings = sorted(((i.get('fiscalDateEnding', ''), i.get('reportedDate'), i.get('reportedEPS'))
+                                     for i in earnings.get('quarterlyEarnings', ())),
+                                    key=lambda i: i[0])
+        yearly_earnings = sorted(
+            ((i.get('fiscalDateEnding', ''), i.get('reportedEPS')) for i in earnings.get('annualEarnings', ())),
+            key=lambda i: i[0])
+
+        return cls(tuple(i[0] for i in quarterly_earnings), tuple(i[1] for i in quarterly_earnings),
+                   array.array('d', (EarningsRecord.to_float(i[2]) for i in quarterly_earnings)),
+                   tuple(i[0] for i in yearly_earnings),
+                   array.array('d', (EarningsRecord.to_float(i[1]) for i in yearly_earnings)))
+
+    @classmethod
+    def from_earnings_per_share(cls, quarterly_earnings_per_share: [float], yearly_earnings_per_share: [float]):
+        # series without period ends are indexed by their position from the most recent period only
+        return cls((None, ) * len(quarterly_earnings_per_share), (None, ) * len(quarterly_earnings_per_share),
+                   array.array('d', quarterly_earnings_per_share), (None, ) * len(yearly_earnings_per_share),
+                   array.array('d', yearly_earnings_per_share))
+
+    @classmethod
+    def from_iex_reported_financials(cls, reported_financials: [dict], is_quarterly: bool):
+        # time series are returned most recent first, the period end orders them when IEX includes it
+        if all('periodEnd' in report for report in reported_financials):
+            reports = sorted(((i['periodEnd'], i.get('EarningsPerShareDiluted')) for i in reported_financials),
+                             key=lambda i: i[0])
+        else:
+            reports = [(None, i.get('EarningsPerShareDiluted')) for i in reversed(reported_financials)]
+
+        period_ends = tuple(i[0] for i in reports)
+        earnings_per_share = array.array('d', (EarningsRecord.to_float(i[1]) for i in reports))
+        if is_quarterly:
+            return cls(period_ends, (None, ) * len(period_ends), earnings_per_share)
+
+        return cls(yearly_period_ends=period_ends, yearly_earnings_per_share=earnings_per_share)
+
+    def get_quarterly_earnings_per_share(self, number_of_quarters: int) -> [float]:
+        return EarningsRecord._get_latest_periods(self.quarterly_earnings_per_share, number_of_quarters)
+
+    def get_yearly_earnings_per_share(self, number_of_years: int) -> [float]:
+        return EarningsRecord._get_latest_periods(self.yearly_earnings_per_share, number_of_years)
+
+    def get_latest_quarterly_report_dates(self) -> (str, str):
+        if not self.quarterly_period_ends:
+            return None
+
+        return self.quarterly_period_ends[-1], self.quarterly_reported_dates[-1]
+
+    @staticmethod
+    def _get_latest_periods(earnings_per_share: array.array, number_of_periods: int) -> [float]:
+        latest_earnings_per_share = earnings_per_share[-number_of_periods:].tolist() if number_of_periods > 0 else []
+        # a gap makes growth over the periods meaningless, like a series that is too short
+        if any(math.isnan(i) for i in latest_earnings_per_share):
+            return []
+
+        return latest_earnings_per_share
+
+    def __bool__(self):
+        return bool(self.quarterly_period_ends or self.yearly_period_ends)
+
+    def __repr__(self):
+        return '{}[quarters={}, years={}]'.format(self.__class__.__name__, len(self.quarterly_earnings_per_share),
+                                                  len(self.yearly_earnings_per_share))
@@ -1,2 +1,4 @@
 TOO_MANY_REQUESTS_STATUS_CODE = 429
 BAD_REQUEST_STATUS_CODE = 400
+OK_STATUS_CODE = 200
+INTERNAL_SERVER_ERROR_STATUS_CODE = 500
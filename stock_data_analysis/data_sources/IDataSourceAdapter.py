@@ -1,5 +1,8 @@
 import abc
 
+from . import EarningsRecord
+from ..exceptions import NotSupportedByApiException
+
 
 class IDataSourceAdapter(abc.ABC):
     @abc.abstractmethod
@@ -13,3 +16,26 @@ class IDataSourceAdapter(abc.ABC):
     @abc.abstractmethod
     def get_yearly_earnings_per_share(self, symbol: str, number_of_years: int) -> [float]:
         pass
+
+    # adapters of APIs that serve several symbols per request override these to group them
+    def get_quarterly_earnings_per_share_batch(self, symbols: [str], number_of_quarters: int) -> {str: [float]}:
+        return {symbol: self.get_quarterly_earnings_per_share(symbol, number_of_quarters) for symbol in symbols}
+
+    def get_yearly_earnings_per_share_batch(self, symbols: [str], number_of_years: int) -> {str: [float]}:
+        return {symbol: self.get_yearly_earnings_per_share(symbol, number_of_years) for symbol in symbols}
+
+    # adapters of APIs that return both series of a symbol in one response override this to share that response
+    def get_earnings_record(self, symbol: str, number_of_quarters: int, number_of_years: int) -> EarningsRecord:
+        return EarningsRecord.from_earnings_per_share(
+            self.get_quarterly_earnings_per_share(symbol, number_of_quarters) if number_of_quarters > 0 else [],
+            self.get_yearly_earnings_per_share(symbol, number_of_years) if number_of_years > 0 else [])
+
+    def get_earnings_record_batch(self, symbols: [str], number_of_quarters: int,
+                                  number_of_years: int) -> {str: EarningsRecord}:
+        return {symbol: self.get_earnings_record(symbol, number_of_quarters, number_of_years) for symbol in symbols}
+
+    def get_latest_earnings_report_dates(self, symbol: str) -> (str, str):
+        raise NotSupportedByApiException()
+
+    def get_last_used_data_source_name(self) -> str:
+        return str(self)
@@ -1,58 +1,198 @@
 import json
-
-import requests
+import urllib.parse
 
 from . import HttpStatusCodes
 from ..exceptions import BadRequestException
+from ..exceptions import ServerErrorException
 from ..exceptions import TooManyRequestsException
+from ..utilities import HttpClient
+from ..utilities import JsonArrayStreamParser
+from ..utilities import MetricsRegistry
+from ..utilities import RateLimiter
+from ..utilities import ResponseCache
 from ..utilities import RetryExecutor
 from ..utilities import HttpRequestHandler
 
 
 class IexApi:
     SANDBOX_URI = 'https://sandbox.iexapis.com/stable'
-
-    def __init__(self, public_token: str):
+    STREAM_CHUNK_SIZE = 64 * 1024
+    SYMBOLS_ENDPOINT = 'iex_ref_data_symbols'
+    REPORTED_FINANCIALS_ENDPOINT = 'iex_reported_financials'
+    REPORTED_FINANCIALS_BATCH_ENDPOINT = 'iex_reported_financials_batch'
+    MAX_BATCH_SYMBOLS = 100
+    MAX_THROTTLE_RETRIES = 5
+    CALLS_PER_MINUTE = 6000
+
+    def __init__(self,
+                 public_token: str,
+                 response_cache: ResponseCache = None,
+                 rate_limiter: RateLimiter = None,
+                 http_client: HttpClient = None,
+                 base_uri: str = SANDBOX_URI,
+                 max_throttle_retries: int = MAX_THROTTLE_RETRIES,
+                 retry_deadline_seconds: float = None):
         self._public_token = public_token
+        self._base_uri = base_uri
+        self._max_throttle_retries = max_throttle_retries
+        self._retry_deadline_seconds = retry_deadline_seconds
+        self._http_client = http_client
+        self._response_cache = response_cache
+        self._rate_limiter = rate_limiter if rate_limiter else RateLimiter.get_shared(
+            '{}:{}'.format(self.__class__.__name__, public_token), IexApi.CALLS_PER_MINUTE)
+        self._metrics_registry = MetricsRegistry.get_default()
+
+    def _get(self, url: str, endpoint: str, stream: bool = False):
+        with self._metrics_registry.time('rate_limiter_wait_seconds', endpoint=endpoint):
+            self._rate_limiter.acquire()
+
+        with self._metrics_registry.time('api_request_seconds', endpoint=endpoint):
+            http_response = HttpRequestHandler.get(url, self._http_client, stream=stream)
+        self._metrics_registry.increment('api_responses_total',
+                                         endpoint=endpoint,
+                                         status_code=http_response.status_code)
+
+        if http_response.status_code == HttpStatusCodes.BAD_REQUEST_STATUS_CODE:
+            http_response.close()
+            raise BadRequestException()
+
+        if http_response.status_code == HttpStatusCodes.TOO_MANY_REQUESTS_STATUS_CODE:
+            retry_after_seconds = RetryExecutor.parse_retry_after(http_response.headers.get('Retry-After'))
+            http_response.close()
+            self._metrics_registry.increment('throttle_events_total', endpoint=endpoint)
+            raise TooManyRequestsException(retry_after_seconds)
+
+        # error responses are raised instead of returned so that they never reach the response cache
+        if http_response.status_code >= HttpStatusCodes.INTERNAL_SERVER_ERROR_STATUS_CODE:
+            http_response.close()
+            raise ServerErrorException(http_response.status_code)
+
+        if http_response.status_code != HttpStatusCodes.OK_STATUS_CODE:
+            http_response.close()
+            raise BadRequestException('status code {}'.format(http_response.status_code))
+
+        return http_response
 
     @staticmethod
-    def make_api_call_with_retry(execute_api_call):
-        return RetryExecutor().execute_with_exponential_backoff_retry(
-            execute_api_call, lambda exception: isinstance(exception, TooManyRequestsException))
+    def make_api_call_with_retry(execute_api_call,
+                                 max_retries: int = MAX_THROTTLE_RETRIES,
+                                 deadline_seconds: float = None):
+        return HttpRequestHandler.execute_with_retry(execute_api_call, max_retries, deadline_seconds)
 
     def get_all_symbols(self):
         def execute_api_call():
-            http_response = HttpRequestHandler.get('{}/ref-data/symbols?token={}'.format(
-                IexApi.SANDBOX_URI, self._public_token))
+            http_response = self._get('{}/ref-data/symbols?token={}'.format(self._base_uri, self._public_token),
+                                      IexApi.SYMBOLS_ENDPOINT)
+
+            with self._metrics_registry.time('json_parse_seconds', endpoint=IexApi.SYMBOLS_ENDPOINT):
+                return json.loads(http_response.text)
+
+        return IexApi.make_api_call_with_retry(execute_api_call, self._max_throttle_retries,
+                                               self._retry_deadline_seconds)
+
+    def stream_all_symbols(self):
+        def execute_api_call():
+            return self._get('{}/ref-data/symbols?token={}'.format(self._base_uri, self._public_token),
+                             IexApi.SYMBOLS_ENDPOINT,
+                             stream=True)
 
-            if http_response.status_code == HttpStatusCodes.BAD_REQUEST_STATUS_CODE:
-                raise BadRequestException()
+        http_response = IexApi.make_api_call_with_retry(execute_api_call, self._max_throttle_retries,
+                                                        self._retry_deadline_seconds)
+        try:
+            yield from JsonArrayStreamParser().parse(http_response.iter_content(IexApi.STREAM_CHUNK_SIZE))
+        finally:
+            http_response.close()
 
-            if http_response.status_code == HttpStatusCodes.TOO_MANY_REQUESTS_STATUS_CODE:
-                raise TooManyRequestsException()
+    @staticmethod
+    def _get_period_interval_parameter(period_interval: str) -> str:
+        if period_interval == 'yearly':
+            return '10-K'
+
+        if period_interval == 'quarterly':
+            return '10-Q'
 
-            return json.loads(http_response.text)
+        raise Exception('Invalid period interval')
 
-        return IexApi.make_api_call_with_retry(execute_api_call)
+    def _get_reported_financials_cache_key(self, symbol: str, period_interval_parameter: str,
+                                           number_of_periods: int) -> str:
+        return '{}:REPORTED_FINANCIALS:{}:{}:{}'.format(self.__class__.__name__, symbol, period_interval_parameter,
+                                                        number_of_periods)
 
     def get_reported_financials(self, symbol: str, number_of_periods: int, period_interval: str):
+        period_interval_parameter = IexApi._get_period_interval_parameter(period_interval)
+
         def execute_api_call():
-            if period_interval == 'yearly':
-                period_interval_parameter = '10-Q'
-            elif period_interval == 'quarterly':
-                period_interval_parameter = '10-K'
+            return self._get(
+                '{}/time-series/REPORTED_FINANCIALS/{}/{}?token={}&last={}'.format(
+                    self._base_uri, symbol, period_interval_parameter, self._public_token, number_of_periods),
+                IexApi.REPORTED_FINANCIALS_ENDPOINT).text
+
+        def execute_api_call_with_retry():
+            return IexApi.make_api_call_with_retry(execute_api_call, self._max_throttle_retries,
+                                                   self._retry_deadline_seconds)
+
+        if self._response_cache is None:
+            response_text = execute_api_call_with_retry()
+        else:
+            response_text = self._response_cache.get_or_fetch(
+                self._get_reported_financials_cache_key(symbol, period_interval_parameter, number_of_periods),
+                execute_api_call_with_retry)
+
+        with self._metrics_registry.time('json_parse_seconds', endpoint=IexApi.REPORTED_FINANCIALS_ENDPOINT):
+            return json.loads(response_text)
+
+    def get_reported_financials_batch(self, symbols: [str], number_of_periods: int, period_interval: str) -> dict:
+        period_interval_parameter = IexApi._get_period_interval_parameter(period_interval)
+        reported_financials_by_symbol = {}
+
+        # batches are split into the same per symbol cache entries that get_reported_financials reads
+        uncached_symbols = []
+        for symbol in symbols:
+            response_text = self._response_cache.get(
+                self._get_reported_financials_cache_key(symbol, period_interval_parameter,
+                                                        number_of_periods)) if self._response_cache else None
+            if response_text is None:
+                uncached_symbols.append(symbol)
             else:
-                raise Exception('Invalid period interval')
+                reported_financials_by_symbol[symbol] = json.loads(response_text)
 
-            http_response = requests.get('{}/time-series/REPORTED_FINANCIALS/{}/{}?token={}&last={}'.format(
-                IexApi.SANDBOX_URI, symbol, period_interval_parameter, self._public_token, number_of_periods))
+        for start_index in range(0, len(uncached_symbols), IexApi.MAX_BATCH_SYMBOLS):
+            batch_symbols = uncached_symbols[start_index:start_index + IexApi.MAX_BATCH_SYMBOLS]
+            reported_financials_by_symbol.update(
+                self._get_uncached_reported_financials_batch(batch_symbols, number_of_periods,
+                                                             period_interval_parameter))
 
-            if http_response.status_code == HttpStatusCodes.BAD_REQUEST_STATUS_CODE:
-                raise BadRequestException()
+        return reported_financials_by_symbol
 
-            if http_response.status_code == HttpStatusCodes.TOO_MANY_REQUESTS_STATUS_CODE:
-                raise TooManyRequestsException()
-
-            return json.loads(http_response.text)
-
-        return IexApi.make_api_call_with_retry(execute_api_call)
+    def _get_uncached_reported_financials_batch(self, symbols: [str], number_of_periods: int,
+                                                period_interval_parameter: str) -> dict:
+        # time series take a comma separated list of keys, the last parameter applies to each of them
+        def execute_api_call():
+            return self._get(
+                '{}/time-series/REPORTED_FINANCIALS/{}/{}?token={}&last={}'.format(
+                    self._base_uri, urllib.parse.quote(','.join(symbols), safe=','), period_interval_parameter,
+                    self._public_token, number_of_periods), IexApi.REPORTED_FINANCIALS_BATCH_ENDPOINT).text
+
+        response_text = IexApi.make_api_call_with_retry(execute_api_call, self._max_throttle_retries,
+                                                        self._retry_deadline_seconds)
+        self._metrics_registry.increment('api_batched_symbols_total',
+                                         len(symbols),
+                                         endpoint=IexApi.REPORTED_FINANCIALS_BATCH_ENDPOINT)
+
+        with self._metrics_registry.time('json_parse_seconds', endpoint=IexApi.REPORTED_FINANCIALS_BATCH_ENDPOINT):
+            reports = json.loads(response_text)
+
+        reported_financials_by_symbol = {symbol: [] for symbol in symbols}
+        symbols_by_key = {symbol.upper(): symbol for symbol in symbols}
+        for report in reports:
+            symbol = symbols_by_key.get(str(report.get('key', '')).upper())
+            if symbol is not None:
+                reported_financials_by_symbol[symbol].append(report)
+
+        if self._response_cache is not None:
+            for symbol, reported_financials in reported_financials_by_symbol.items():
+                self._response_cache.put(
+                    self._get_reported_financials_cache_key(symbol, period_interval_parameter, number_of_periods),
+                    json.dumps(reported_financials))
+
+        return reported_financials_by_symbol
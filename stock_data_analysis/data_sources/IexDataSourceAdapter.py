@@ -1,5 +1,7 @@
+from . import EarningsRecord
 from . import IDataSourceAdapter
 from . import IexApi
+from . import SymbolRecord
 from ..exceptions import BadRequestException
 
 
@@ -7,40 +9,109 @@ class IexDataSourceAdapter(IDataSourceAdapter):
     def __init__(self, iex_api: IexApi):
         self._iex_api = iex_api
 
+    def __str__(self):
+        return self.__class__.__name__
+
     def get_all_symbols(self):
         try:
             return [i['symbol'] for i in self._iex_api.get_all_symbols()]
         except BadRequestException:
             return []
 
+    def stream_symbol_records(self):
+        try:
+            for reference_data in self._iex_api.stream_all_symbols():
+                yield SymbolRecord.from_iex_reference_data(reference_data)
+        except BadRequestException:
+            return
+
     def get_quarterly_earnings_per_share(self, symbol: str, number_of_quarters: int) -> [float]:
         try:
             reported_financials = self._iex_api.get_reported_financials(symbol, number_of_quarters, 'quarterly')
         except BadRequestException:
             return []
 
-        earnings_per_share = []
+        return EarningsRecord.from_iex_reported_financials(
+            reported_financials, True).get_quarterly_earnings_per_share(number_of_quarters)
 
-        for report in reported_financials:
-            if 'EarningsPerShareDiluted' not in report:
-                return []
+    def get_yearly_earnings_per_share(self, symbol: str, number_of_years: int) -> [float]:
+        try:
+            reported_financials = self._iex_api.get_reported_financials(symbol, number_of_years, 'yearly')
+        except BadRequestException:
+            return []
 
-            earnings_per_share.append(report['EarningsPerShareDiluted'])
+        return EarningsRecord.from_iex_reported_financials(reported_financials,
+                                                           False).get_yearly_earnings_per_share(number_of_years)
 
-        return earnings_per_share
+    def get_quarterly_earnings_per_share_batch(self, symbols: [str], number_of_quarters: int) -> {str: [float]}:
+        return self._get_earnings_per_share_batch(symbols, number_of_quarters, 'quarterly')
+
+    def get_yearly_earnings_per_share_batch(self, symbols: [str], number_of_years: int) -> {str: [float]}:
+        return self._get_earnings_per_share_batch(symbols, number_of_years, 'yearly')
+
+    def get_earnings_record(self, symbol: str, number_of_quarters: int, number_of_years: int) -> EarningsRecord:
+        return IexDataSourceAdapter._to_earnings_record(
+            self._get_reported_financials(symbol, number_of_quarters, 'quarterly'),
+            self._get_reported_financials(symbol, number_of_years, 'yearly'))
+
+    def get_earnings_record_batch(self, symbols: [str], number_of_quarters: int,
+                                  number_of_years: int) -> {str: EarningsRecord}:
+        quarterly_reported_financials_by_symbol = self._get_reported_financials_batch(symbols, number_of_quarters,
+                                                                                      'quarterly')
+        yearly_reported_financials_by_symbol = self._get_reported_financials_batch(symbols, number_of_years, 'yearly')
+
+        return {
+            symbol: IexDataSourceAdapter._to_earnings_record(quarterly_reported_financials_by_symbol[symbol],
+                                                             yearly_reported_financials_by_symbol[symbol])
+            for symbol in symbols
+        }
+
+    @staticmethod
+    def _to_earnings_record(quarterly_reported_financials: [dict],
+                            yearly_reported_financials: [dict]) -> EarningsRecord:
+        quarterly_earnings_record = EarningsRecord.from_iex_reported_financials(quarterly_reported_financials, True)
+        yearly_earnings_record = EarningsRecord.from_iex_reported_financials(yearly_reported_financials, False)
+
+        return EarningsRecord(quarterly_earnings_record.quarterly_period_ends,
+                              quarterly_earnings_record.quarterly_reported_dates,
+                              quarterly_earnings_record.quarterly_earnings_per_share,
+                              yearly_earnings_record.yearly_period_ends,
+                              yearly_earnings_record.yearly_earnings_per_share)
+
+    def _get_reported_financials(self, symbol: str, number_of_periods: int, period_interval: str) -> [dict]:
+        if number_of_periods <= 0:
+            return []
 
-    def get_yearly_earnings_per_share(self, symbol: str, number_of_years: int) -> [float]:
         try:
-            reported_financials = self._iex_api.get_reported_financials(symbol, number_of_years, 'yearly')
+            return self._iex_api.get_reported_financials(symbol, number_of_periods, period_interval)
         except BadRequestException:
             return []
 
-        earnings_per_share = []
+    def _get_reported_financials_batch(self, symbols: [str], number_of_periods: int,
+                                       period_interval: str) -> {str: [dict]}:
+        if number_of_periods <= 0:
+            return {symbol: [] for symbol in symbols}
+
+        try:
+            return self._iex_api.get_reported_financials_batch(symbols, number_of_periods, period_interval)
+        except BadRequestException:
+            # a single malformed symbol fails the whole batch, so its symbols are requested one by one
+            return {
+                symbol: self._get_reported_financials(symbol, number_of_periods, period_interval)
+                for symbol in symbols
+            }
 
-        for report in reported_financials:
-            if 'EarningsPerShareDiluted' not in report:
-                return []
+    def _get_earnings_per_share_batch(self, symbols: [str], number_of_periods: int,
+                                      period_interval: str) -> {str: [float]}:
+        reported_financials_by_symbol = self._get_reported_financials_batch(symbols, number_of_periods,
+                                                                            period_interval)
 
-            earnings_per_share.append(report['EarningsPerShareDiluted'])
+        is_quarterly = period_interval == 'quarterly'
+        earnings_per_share_by_symbol = {}
+        for symbol in symbols:
+            earnings_record = EarningsRecord.from_iex_reported_financials(reported_financials_by_symbol[symbol],
+                                                                          is_quarterly)
+            earnings_per_share_by_symbol[symbol] = earnings_record.get_quarterly_earnings_per_share(
+                number_of_periods) if is_quarterly else earnings_record.get_yearly_earnings_per_share(number_of_periods)
 
-        return earnings_per_share
+        return earnings_per_share_by_symbol
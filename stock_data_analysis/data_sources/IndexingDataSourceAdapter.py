@@ -0,0 +1,94 @@
+import collections
+import threading
+
+from . import EarningsPerShareIndex
+from . import EarningsRecord
+from . import IDataSourceAdapter
+
+
+class IndexingDataSourceAdapter(IDataSourceAdapter):
+    MAX_INDEXED_EARNINGS_RECORDS = 4096
+
+    def __init__(self,
+                 data_source_adapter: IDataSourceAdapter,
+                 earnings_per_share_index: EarningsPerShareIndex,
+                 min_quarters_to_index: int = 0,
+                 min_years_to_index: int = 0):
+        self._data_source_adapter = data_source_adapter
+        self._earnings_per_share_index = earnings_per_share_index
+
+        # longer histories than the evaluators need let later screens use longer windows without fetching again, both
+        # series of a symbol are fetched with the longest window any evaluator asked for so far
+        assert min_quarters_to_index >= 0 and min_years_to_index >= 0
+        self._number_of_periods_to_index = {
+            EarningsPerShareIndex.QUARTERLY: min_quarters_to_index,
+            EarningsPerShareIndex.YEARLY: min_years_to_index
+        }
+
+        # the evaluators of a symbol share one earnings record, which is indexed once
+        self._indexed_earnings_records = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        return str(self._data_source_adapter)
+
+    def get_all_symbols(self) -> [str]:
+        return self._data_source_adapter.get_all_symbols()
+
+    def get_quarterly_earnings_per_share(self, symbol: str, number_of_quarters: int) -> [float]:
+        return self.get_quarterly_earnings_per_share_batch([symbol], number_of_quarters)[symbol]
+
+    def get_yearly_earnings_per_share(self, symbol: str, number_of_years: int) -> [float]:
+        return self.get_yearly_earnings_per_share_batch([symbol], number_of_years)[symbol]
+
+    def get_quarterly_earnings_per_share_batch(self, symbols: [str], number_of_quarters: int) -> {str: [float]}:
+        earnings_records = self._get_indexed_earnings_records(symbols, EarningsPerShareIndex.QUARTERLY,
+                                                              number_of_quarters)
+        return {
+            symbol: i.get_quarterly_earnings_per_share(number_of_quarters)
+            for symbol, i in earnings_records.items()
+        }
+
+    def get_yearly_earnings_per_share_batch(self, symbols: [str], number_of_years: int) -> {str: [float]}:
+        earnings_records = self._get_indexed_earnings_records(symbols, EarningsPerShareIndex.YEARLY, number_of_years)
+        return {symbol: i.get_yearly_earnings_per_share(number_of_years) for symbol, i in earnings_records.items()}
+
+    def get_latest_earnings_report_dates(self, symbol: str) -> (str, str):
+        return self._data_source_adapter.get_latest_earnings_report_dates(symbol)
+
+    def get_last_used_data_source_name(self) -> str:
+        return self._data_source_adapter.get_last_used_data_source_name()
+
+    def _get_indexed_earnings_records(self, symbols: [str], period_type: str,
+                                      number_of_periods: int) -> {str: EarningsRecord}:
+        with self._lock:
+            self._number_of_periods_to_index[period_type] = max(self._number_of_periods_to_index[period_type],
+                                                                number_of_periods)
+            number_of_quarters = self._number_of_periods_to_index[EarningsPerShareIndex.QUARTERLY]
+            number_of_years = self._number_of_periods_to_index[EarningsPerShareIndex.YEARLY]
+
+        if len(symbols) == 1:
+            earnings_records = {
+                symbols[0]: self._data_source_adapter.get_earnings_record(symbols[0], number_of_quarters,
+                                                                          number_of_years)
+            }
+        else:
+            earnings_records = self._data_source_adapter.get_earnings_record_batch(symbols, number_of_quarters,
+                                                                                   number_of_years)
+
+        # both series are indexed whichever evaluator fetches first, so a symbol that the filter rejects early is
+        # indexed as fully as one that passes
+        data_source_name = self._data_source_adapter.get_last_used_data_source_name()
+        for symbol, earnings_record in earnings_records.items():
+            with self._lock:
+                if self._indexed_earnings_records.get(symbol) is earnings_record:
+                    continue
+
+                self._indexed_earnings_records[symbol] = earnings_record
+                self._indexed_earnings_records.move_to_end(symbol)
+                if len(self._indexed_earnings_records) > IndexingDataSourceAdapter.MAX_INDEXED_EARNINGS_RECORDS:
+                    self._indexed_earnings_records.popitem(last=False)
+
+            self._earnings_per_share_index.put_earnings_record(symbol, earnings_record, data_source_name)
+
+        return earnings_records
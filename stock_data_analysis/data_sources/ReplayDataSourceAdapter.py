@@ -0,0 +1,49 @@
+from . import AlphaVantageApi
+from . import AlphaVantageDataSourceAdapter
+from . import EarningsRecord
+from . import IDataSourceAdapter
+from . import IexApi
+from . import IexDataSourceAdapter
+from ..utilities import RateLimiter
+from ..utilities import ReplayHttpClient
+from ..utilities import ResponseArchive
+
+
+class ReplayDataSourceAdapter(IDataSourceAdapter):
+    REPLAY_TOKEN = 'replay'
+
+    def __init__(self, response_archive: ResponseArchive):
+        self._replay_http_client = ReplayHttpClient(response_archive)
+
+        # archived responses are parsed by the real API classes, only the transport and rate limits are replaced
+        self._iex_data_source_adapter = IexDataSourceAdapter(
+            IexApi(ReplayDataSourceAdapter.REPLAY_TOKEN, rate_limiter=RateLimiter(),
+                   http_client=self._replay_http_client))
+        self._alpha_vantage_data_source_adapter = AlphaVantageDataSourceAdapter(
+            AlphaVantageApi(ReplayDataSourceAdapter.REPLAY_TOKEN,
+                            rate_limiter=RateLimiter(),
+                            http_client=self._replay_http_client))
+
+    def __str__(self):
+        return self.__class__.__name__
+
+    def get_all_symbols(self) -> [str]:
+        return self._iex_data_source_adapter.get_all_symbols()
+
+    def stream_symbol_records(self):
+        return self._iex_data_source_adapter.stream_symbol_records()
+
+    def get_quarterly_earnings_per_share(self, symbol: str, number_of_quarters: int) -> [float]:
+        return self._alpha_vantage_data_source_adapter.get_quarterly_earnings_per_share(symbol, number_of_quarters)
+
+    def get_yearly_earnings_per_share(self, symbol: str, number_of_years: int) -> [float]:
+        return self._alpha_vantage_data_source_adapter.get_yearly_earnings_per_share(symbol, number_of_years)
+
+    def get_earnings_record(self, symbol: str, number_of_quarters: int, number_of_years: int) -> EarningsRecord:
+        return self._alpha_vantage_data_source_adapter.get_earnings_record(symbol, number_of_quarters, number_of_years)
+
+    def get_latest_earnings_report_dates(self, symbol: str) -> (str, str):
+        return self._alpha_vantage_data_source_adapter.get_latest_earnings_report_dates(symbol)
+
+    def get_replay_statistics(self) -> dict:
+        return self._replay_http_client.get_connection_statistics()
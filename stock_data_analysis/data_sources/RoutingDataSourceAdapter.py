@@ -0,0 +1,320 @@
+import collections
+import concurrent.futures
+import threading
+import time
+
+from . import EarningsRecord
+from . import IDataSourceAdapter
+from ..exceptions import BadRequestException
+from ..exceptions import DailyQuotaExceededException
+from ..exceptions import NotSupportedByApiException
+from ..exceptions import ServerErrorException
+from ..exceptions import TooManyRequestsException
+from ..utilities import Logger
+from ..utilities import MetricsRegistry
+from ..utilities import RateLimiter
+
+
+class RoutingDataSourceAdapter(IDataSourceAdapter):
+    FALLBACK_EXCEPTIONS = (TooManyRequestsException, BadRequestException, NotSupportedByApiException,
+                           DailyQuotaExceededException, ServerErrorException)
+    DEFAULT_THROTTLE_COOLDOWN_SECONDS = 60
+    DEFAULT_LATENCY_SMOOTHING = 0.2
+    MAX_SYMBOL_AFFINITIES = 4096
+
+    class _DataSource:
+        def __init__(self, data_source_adapter: IDataSourceAdapter, rate_limiter: RateLimiter):
+            self.data_source_adapter = data_source_adapter
+            self.rate_limiter = rate_limiter
+            self.name = str(data_source_adapter)
+            self.latency_seconds = None
+            self.throttled_until = 0.0
+            self.statistics = collections.Counter()
+
+        def has_headroom(self) -> bool:
+            if self.rate_limiter is None:
+                return True
+
+            remaining_daily_calls = self.rate_limiter.get_remaining_daily_calls()
+            return (remaining_daily_calls is None or remaining_daily_calls > 0) and \
+                self.rate_limiter.get_available_tokens() >= 1
+
+    def __init__(self,
+                 data_source_adapters: [IDataSourceAdapter],
+                 rate_limiters: [RateLimiter] = None,
+                 hedge_delay_seconds: float = None,
+                 throttle_cooldown_seconds: float = DEFAULT_THROTTLE_COOLDOWN_SECONDS,
+                 latency_smoothing: float = DEFAULT_LATENCY_SMOOTHING):
+        assert data_source_adapters
+        rate_limiters = rate_limiters if rate_limiters else [None] * len(data_source_adapters)
+        assert len(rate_limiters) == len(data_source_adapters)
+        self._data_sources = [
+            RoutingDataSourceAdapter._DataSource(data_source_adapter, rate_limiter)
+            for data_source_adapter, rate_limiter in zip(data_source_adapters, rate_limiters)
+        ]
+
+        assert hedge_delay_seconds is None or hedge_delay_seconds > 0
+        self._hedge_delay_seconds = hedge_delay_seconds
+        self._hedge_executor = concurrent.futures.ThreadPoolExecutor(
+            thread_name_prefix='data-source-hedge') if hedge_delay_seconds is not None else None
+
+        self._throttle_cooldown_seconds = throttle_cooldown_seconds
+        assert 0 < latency_smoothing <= 1
+        self._latency_smoothing = latency_smoothing
+
+        # a symbol keeps the source that last answered for it, so its series come from one source and share its cache
+        self._symbol_affinities = collections.OrderedDict()
+        self._thread_local = threading.local()
+        self._lock = threading.Lock()
+        self._metrics_registry = MetricsRegistry.get_default()
+        self._logger = Logger(self.__class__.__name__)
+
+    def __str__(self):
+        return '{}[{}]'.format(self.__class__.__name__, ', '.join(i.name for i in self._data_sources))
+
+    def get_all_symbols(self) -> [str]:
+        return self._route(None, lambda i: i.get_all_symbols(), [])
+
+    def get_quarterly_earnings_per_share(self, symbol: str, number_of_quarters: int) -> [float]:
+        return self._route(symbol, lambda i: i.get_quarterly_earnings_per_share(symbol, number_of_quarters), [])
+
+    def get_yearly_earnings_per_share(self, symbol: str, number_of_years: int) -> [float]:
+        return self._route(symbol, lambda i: i.get_yearly_earnings_per_share(symbol, number_of_years), [])
+
+    def get_quarterly_earnings_per_share_batch(self, symbols: [str], number_of_quarters: int) -> {str: [float]}:
+        return self._route_batch(
+            symbols,
+            lambda i, batch_symbols: i.get_quarterly_earnings_per_share_batch(batch_symbols, number_of_quarters), [])
+
+    def get_yearly_earnings_per_share_batch(self, symbols: [str], number_of_years: int) -> {str: [float]}:
+        return self._route_batch(
+            symbols, lambda i, batch_symbols: i.get_yearly_earnings_per_share_batch(batch_symbols, number_of_years),
+            [])
+
+    def get_earnings_record(self, symbol: str, number_of_quarters: int, number_of_years: int) -> EarningsRecord:
+        return self._route(symbol, lambda i: i.get_earnings_record(symbol, number_of_quarters, number_of_years),
+                           EarningsRecord())
+
+    def get_earnings_record_batch(self, symbols: [str], number_of_quarters: int,
+                                  number_of_years: int) -> {str: EarningsRecord}:
+        return self._route_batch(
+            symbols,
+            lambda i, batch_symbols: i.get_earnings_record_batch(batch_symbols, number_of_quarters, number_of_years),
+            EarningsRecord())
+
+    def get_latest_earnings_report_dates(self, symbol: str) -> (str, str):
+        return self._route(symbol, lambda i: i.get_latest_earnings_report_dates(symbol))
+
+    def get_last_used_data_source_name(self) -> str:
+        return getattr(self._thread_local, 'last_used_data_source_name', None)
+
+    def get_statistics(self) -> dict:
+        with self._lock:
+            return {
+                i.name: dict(i.statistics, latency_seconds=i.latency_seconds if i.latency_seconds else 0.0)
+                for i in self._data_sources
+            }
+
+    def close(self) -> None:
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+
+    def _route(self, symbol: str, call, empty_value=None):
+        data_sources = self._get_ordered_data_sources(symbol)
+
+        if self._hedge_delay_seconds is None or len(data_sources) == 1:
+            result = self._call_in_order(data_sources, call, empty_value)
+        else:
+            result = self._call_hedged(data_sources, call, empty_value)
+
+        data_source, value = result
+        self._thread_local.last_used_data_source_name = data_source.name
+        if symbol is not None and value:
+            self._set_symbol_affinity(symbol, data_source)
+
+        return value
+
+    def _route_batch(self, symbols: [str], call, empty_value=None) -> dict:
+        # symbols that prefer the same order of sources share one batch call, batches are not hedged because a hedge
+        # would repeat every symbol of the batch on another source
+        symbols_by_data_sources = collections.OrderedDict()
+        for symbol in symbols:
+            symbols_by_data_sources.setdefault(tuple(self._get_ordered_data_sources(symbol)), []).append(symbol)
+
+        values = {}
+        answered_symbols = collections.Counter()
+        for data_sources, batch_symbols in symbols_by_data_sources.items():
+            values.update(self._call_batch_in_order(data_sources, batch_symbols, call, answered_symbols, empty_value))
+
+        if answered_symbols:
+            # evaluators report one source per batch, the one that answered most of its symbols
+            self._thread_local.last_used_data_source_name = answered_symbols.most_common(1)[0][0].name
+        return {symbol: values[symbol] for symbol in symbols}
+
+    def _call_batch_in_order(self, data_sources: tuple, symbols: [str], call, answered_symbols: collections.Counter,
+                             empty_value=None) -> dict:
+        values = {}
+        remaining_symbols = symbols
+        fallback_exception = None
+
+        # like a single symbol, a symbol without earnings is asked from the next source and keeps the first empty result
+        for data_source in data_sources:
+            try:
+                batch_values = self._call_data_source(data_source, lambda i: call(i, remaining_symbols))
+            except BadRequestException:
+                continue
+            except RoutingDataSourceAdapter.FALLBACK_EXCEPTIONS as exception:
+                fallback_exception = exception
+                continue
+
+            for symbol in remaining_symbols:
+                value = batch_values.get(symbol)
+                if value:
+                    values[symbol] = value
+                    answered_symbols[data_source] += 1
+                    self._set_symbol_affinity(symbol, data_source)
+                elif symbol not in values:
+                    values[symbol] = value
+
+            remaining_symbols = [i for i in remaining_symbols if not values[i]]
+            if not remaining_symbols:
+                break
+
+        if len(values) < len(symbols):
+            if fallback_exception is not None:
+                raise fallback_exception
+
+            # symbols that every source rejects have no earnings, like in a single symbol call
+            for symbol in symbols:
+                values.setdefault(symbol, empty_value)
+
+        return values
+
+    def _set_symbol_affinity(self, symbol: str, data_source) -> None:
+        with self._lock:
+            self._symbol_affinities[symbol] = data_source
+            self._symbol_affinities.move_to_end(symbol)
+            if len(self._symbol_affinities) > RoutingDataSourceAdapter.MAX_SYMBOL_AFFINITIES:
+                self._symbol_affinities.popitem(last=False)
+
+    def _get_ordered_data_sources(self, symbol: str) -> list:
+        now = time.monotonic()
+        with self._lock:
+            affine_data_source = self._symbol_affinities.get(symbol)
+
+            # sources that are not cooling down from a throttle and have quota now go first, then the fastest one
+            return sorted(self._data_sources,
+                          key=lambda i: (i.throttled_until > now, not i.has_headroom(), i is not affine_data_source,
+                                         i.latency_seconds if i.latency_seconds is not None else 0.0))
+
+    def _call_in_order(self, data_sources: list, call, empty_value=None) -> tuple:
+        empty_result = None
+        rejecting_data_source = None
+        fallback_exception = None
+
+        for data_source in data_sources:
+            try:
+                value = self._call_data_source(data_source, call)
+            except BadRequestException:
+                rejecting_data_source = rejecting_data_source or data_source
+                continue
+            except RoutingDataSourceAdapter.FALLBACK_EXCEPTIONS as exception:
+                fallback_exception = exception
+                continue
+
+            if value:
+                return data_source, value
+
+            if empty_result is None:
+                empty_result = (data_source, value)
+
+        return self._get_unanswered_result(empty_result, rejecting_data_source, fallback_exception, empty_value)
+
+    def _call_hedged(self, data_sources: list, call, empty_value=None) -> tuple:
+        pending_futures = {}
+        remaining_data_sources = collections.deque(data_sources)
+        empty_result = None
+        rejecting_data_source = None
+        fallback_exception = None
+
+        def submit_next():
+            data_source = remaining_data_sources.popleft()
+            pending_futures[self._hedge_executor.submit(self._call_data_source, data_source, call)] = data_source
+
+        submit_next()
+        while pending_futures:
+            completed_futures, _ = concurrent.futures.wait(
+                pending_futures,
+                timeout=self._hedge_delay_seconds if remaining_data_sources else None,
+                return_when=concurrent.futures.FIRST_COMPLETED)
+
+            if not completed_futures:
+                self._metrics_registry.increment('data_source_hedged_calls_total',
+                                                 data_source=remaining_data_sources[0].name)
+                submit_next()
+                continue
+
+            for completed_future in completed_futures:
+                data_source = pending_futures.pop(completed_future)
+                try:
+                    value = completed_future.result()
+                except BadRequestException:
+                    rejecting_data_source = rejecting_data_source or data_source
+                    continue
+                except RoutingDataSourceAdapter.FALLBACK_EXCEPTIONS as exception:
+                    fallback_exception = exception
+                    continue
+
+                if value:
+                    # the slower calls finish in the background and only warm the response caches
+                    return data_source, value
+
+                if empty_result is None:
+                    empty_result = (data_source, value)
+
+            if not pending_futures and remaining_data_sources:
+                submit_next()
+
+        return self._get_unanswered_result(empty_result, rejecting_data_source, fallback_exception, empty_value)
+
+    @staticmethod
+    def _get_unanswered_result(empty_result: tuple, rejecting_data_source, fallback_exception: Exception,
+                               empty_value) -> tuple:
+        if empty_result is not None:
+            return empty_result
+
+        # a symbol that every source rejects, such as one no source covers, has no earnings instead of failing the scan
+        if fallback_exception is None:
+            return rejecting_data_source, empty_value
+
+        raise fallback_exception
+
+    def _call_data_source(self, data_source, call):
+        start_time = time.perf_counter()
+        try:
+            value = call(data_source.data_source_adapter)
+        except RoutingDataSourceAdapter.FALLBACK_EXCEPTIONS as exception:
+            if isinstance(exception, TooManyRequestsException):
+                with self._lock:
+                    data_source.throttled_until = time.monotonic() + self._throttle_cooldown_seconds
+
+            self._record_outcome(data_source, type(exception).__name__)
+            self._logger.log_info('{} failed with {}, falling back to the next data source', data_source.name,
+                                  type(exception).__name__)
+            raise
+
+        elapsed_seconds = time.perf_counter() - start_time
+        with self._lock:
+            if data_source.latency_seconds is None:
+                data_source.latency_seconds = elapsed_seconds
+            else:
+                data_source.latency_seconds += self._latency_smoothing * (elapsed_seconds - data_source.latency_seconds)
+
+        self._record_outcome(data_source, 'success' if value else 'empty')
+        return value
+
+    def _record_outcome(self, data_source, outcome: str) -> None:
+        with self._lock:
+            data_source.statistics[outcome] += 1
+
+        self._metrics_registry.increment('data_source_calls_total', data_source=data_source.name, outcome=outcome)
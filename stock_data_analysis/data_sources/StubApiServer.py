@@ -0,0 +1,112 @@
+import http.server
+import json
+import random
+import threading
+import time
+import urllib.parse
+
+from . import AlphaVantageApi
+from . import HttpStatusCodes
+from . import IexApi
+from ..utilities import Logger
+from ..utilities import ResponseArchive
+
+
+class StubApiServer:
+    ALPHA_VANTAGE_PATH = '/query'
+    # archive keys keep the URL path, so IEX recordings carry the version prefix of its base URI
+    IEX_BASE_PATH = urllib.parse.urlsplit(IexApi.SANDBOX_URI).path
+
+    class _RequestHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            self.server.stub_api_server.handle_request(self)
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            pass
+
+    def __init__(self,
+                 response_archive: ResponseArchive,
+                 host: str = '127.0.0.1',
+                 port: int = 0,
+                 latency_seconds: float = 0,
+                 latency_jitter_seconds: float = 0,
+                 too_many_requests_probability: float = 0,
+                 throttle_note_probability: float = 0,
+                 random_seed: int = None):
+        self._response_archive = response_archive
+        self._latency_seconds = latency_seconds
+        self._latency_jitter_seconds = latency_jitter_seconds
+
+        assert 0 <= too_many_requests_probability <= 1 and 0 <= throttle_note_probability <= 1
+        self._too_many_requests_probability = too_many_requests_probability
+        self._throttle_note_probability = throttle_note_probability
+
+        self._random = random.Random(random_seed)
+        self._random_lock = threading.Lock()
+        self._logger = Logger(self.__class__.__name__)
+
+        self._http_server = http.server.ThreadingHTTPServer((host, port), StubApiServer._RequestHandler)
+        self._http_server.daemon_threads = True
+        self._http_server.stub_api_server = self
+        self._server_thread = None
+
+    def get_base_uri(self) -> str:
+        host, port = self._http_server.server_address[:2]
+        return 'http://{}:{}'.format(host, port)
+
+    def get_iex_base_uri(self) -> str:
+        return self.get_base_uri() + StubApiServer.IEX_BASE_PATH
+
+    def start(self) -> None:
+        self._server_thread = threading.Thread(target=self._http_server.serve_forever,
+                                               name='stub-api-server',
+                                               daemon=True)
+        self._server_thread.start()
+        self._logger.log_info('serving {} archived responses at {}', len(self._response_archive.get_request_keys()),
+                              self.get_base_uri())
+
+    def stop(self) -> None:
+        self._http_server.shutdown()
+        self._http_server.server_close()
+        if self._server_thread is not None:
+            self._server_thread.join()
+
+    def serve_forever(self) -> None:
+        self._logger.log_info('serving {} archived responses at {}', len(self._response_archive.get_request_keys()),
+                              self.get_base_uri())
+        self._http_server.serve_forever()
+
+    def handle_request(self, request_handler: http.server.BaseHTTPRequestHandler) -> None:
+        with self._random_lock:
+            latency_seconds = max(0.0,
+                                  self._latency_seconds + self._random.uniform(-1, 1) * self._latency_jitter_seconds)
+            is_too_many_requests = self._random.random() < self._too_many_requests_probability
+            is_throttle_note = self._random.random() < self._throttle_note_probability
+
+        time.sleep(latency_seconds)
+
+        if is_too_many_requests:
+            self._send_response(request_handler, HttpStatusCodes.TOO_MANY_REQUESTS_STATUS_CODE, '')
+            return
+
+        if is_throttle_note and request_handler.path.startswith(StubApiServer.ALPHA_VANTAGE_PATH):
+            self._send_response(request_handler, 200, json.dumps(AlphaVantageApi.RATE_THROTTLED_RESPONSE))
+            return
+
+        archived_response = self._response_archive.get(request_handler.path)
+        if archived_response is None:
+            self._send_response(request_handler, HttpStatusCodes.BAD_REQUEST_STATUS_CODE, '')
+            return
+
+        self._send_response(request_handler, *archived_response)
+
+    @staticmethod
+    def _send_response(request_handler: http.server.BaseHTTPRequestHandler, status_code: int, body: str) -> None:
+        encoded_body = body.encode('utf-8')
+        request_handler.send_response(status_code)
+        request_handler.send_header('Content-Type', 'application/json')
+        request_handler.send_header('Content-Length', str(len(encoded_body)))
+        request_handler.end_headers()
+        request_handler.wfile.write(encoded_body)
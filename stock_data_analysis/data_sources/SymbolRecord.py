@@ -0,0 +1,17 @@
+class SymbolRecord:
+    __slots__ = ('symbol', 'type', 'exchange', 'is_enabled')
+
+    def __init__(self, symbol: str, symbol_type: str, exchange: str, is_enabled: bool):
+        self.symbol = symbol
+        self.type = symbol_type
+        self.exchange = exchange
+        self.is_enabled = is_enabled
+
+    @classmethod
+    def from_iex_reference_data(cls, reference_data: dict):
+        return cls(reference_data['symbol'], reference_data.get('type'), reference_data.get('exchange'),
+                   reference_data.get('isEnabled', True))
+
+    def __repr__(self):
+        return '{}[symbol={}, type={}, exchange={}, is_enabled={}]'.format(self.__class__.__name__, self.symbol,
+                                                                           self.type, self.exchange, self.is_enabled)
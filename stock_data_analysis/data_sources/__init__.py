@@ -1,6 +1,46 @@
+import importlib
+import sys
+import types
+
 from . import HttpStatusCodes
-from .IDataSourceAdapter import IDataSourceAdapter
-from .AlphaVantageDataSourceAdapter import AlphaVantageDataSourceAdapter
-from .AlphaVantageApi import AlphaVantageApi
-from .IexDataSourceAdapter import IexDataSourceAdapter
-from .IexApi import IexApi
+
+_EXPORTED_CLASS_NAMES = (
+    'IDataSourceAdapter',
+    'SymbolRecord',
+    'EarningsRecord',
+    'AlphaVantageDataSourceAdapter',
+    'AlphaVantageApi',
+    'IexDataSourceAdapter',
+    'IexApi',
+    'ReplayDataSourceAdapter',
+    'RoutingDataSourceAdapter',
+    'StubApiServer',
+    'EarningsPerShareIndex',
+    'IndexingDataSourceAdapter',
+    'EarningsPerShareIndexDataSourceAdapter',
+)
+
+
+class _LazyPackage(types.ModuleType):
+    def __setattr__(self, name: str, value) -> None:
+        # the import system binds an imported submodule to the package attribute of the same name, where another
+        # thread could read it before the class replaces it, so the class is bound in its place
+        if name in _EXPORTED_CLASS_NAMES and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyPackage
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTED_CLASS_NAMES:
+        raise AttributeError('module {} has no attribute {}'.format(__name__, name))
+
+    exported_class = getattr(importlib.import_module('.' + name, __name__), name)
+    globals()[name] = exported_class
+    return exported_class
+
+
+def __dir__() -> [str]:
+    return sorted(set(globals()) | set(_EXPORTED_CLASS_NAMES))
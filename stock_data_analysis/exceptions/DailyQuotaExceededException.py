@@ -0,0 +1,2 @@
+class DailyQuotaExceededException(Exception):
+    pass
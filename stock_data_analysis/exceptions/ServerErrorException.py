@@ -0,0 +1,4 @@
+class ServerErrorException(Exception):
+    def __init__(self, status_code: int = None):
+        super().__init__('server error status code {}'.format(status_code))
+        self.status_code = status_code
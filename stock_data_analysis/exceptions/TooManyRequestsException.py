@@ -1,2 +1,4 @@
 class TooManyRequestsException(Exception):
-    pass
+    def __init__(self, retry_after_seconds: float = None):
+        super().__init__()
+        self.retry_after_seconds = retry_after_seconds
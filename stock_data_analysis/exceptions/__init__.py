@@ -1,3 +1,5 @@
 from .BadRequestException import BadRequestException
 from .TooManyRequestsException import TooManyRequestsException
 from .NotSupportedByApiException import NotSupportedByApiException
+from .DailyQuotaExceededException import DailyQuotaExceededException
+from .ServerErrorException import ServerErrorException
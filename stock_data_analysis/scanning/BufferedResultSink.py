@@ -0,0 +1,120 @@
+import abc
+import os
+import shutil
+import threading
+import time
+
+from . import IResultSink
+from . import ScanResult
+
+
+class BufferedResultSink(IResultSink):
+    PARTIAL_FILE_SUFFIX = '.partial'
+
+    def __init__(self, file_name: str, append: bool = False, batch_size: int = 100, flush_interval_seconds: float = 5):
+        self._file_name = file_name
+        # readers only ever see a complete file, results are written under another name until the sink is closed
+        self._partial_file_name = file_name + BufferedResultSink.PARTIAL_FILE_SUFFIX
+
+        # without a batch size or flush interval results are only written when the owner flushes the sink
+        assert batch_size is None or batch_size > 0
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+
+        self._pending_scan_results = []
+        self._last_flush_time = time.monotonic()
+        self._is_closed = False
+        self._lock = threading.Lock()
+
+        folder_name = os.path.dirname(file_name)
+        if folder_name and not os.path.exists(folder_name):
+            os.makedirs(folder_name)
+
+        if append:
+            # an interrupted run leaves its partial file behind, a finished one its final file
+            if not os.path.exists(self._partial_file_name) and os.path.exists(file_name):
+                shutil.copyfile(file_name, self._partial_file_name)
+        elif os.path.exists(self._partial_file_name):
+            os.remove(self._partial_file_name)
+
+        self._open_file(self._partial_file_name, os.path.exists(self._partial_file_name))
+
+    def get_file_name(self) -> str:
+        return self._file_name
+
+    def write(self, scan_result: ScanResult) -> None:
+        with self._lock:
+            assert not self._is_closed
+            self._pending_scan_results.append(scan_result)
+
+            if (self._batch_size is not None and len(self._pending_scan_results) >= self._batch_size) or \
+                    (self._flush_interval_seconds is not None and
+                     time.monotonic() - self._last_flush_time >= self._flush_interval_seconds):
+                self._flush()
+
+    def append_file(self, file_name: str, excluded_symbols: set = None) -> [str]:
+        # merges a file written by a sink of the same format, such as the output of a shard, keeping the first result
+        # of every symbol
+        excluded_symbols = set(excluded_symbols) if excluded_symbols else set()
+        rows = []
+        for row in self._read_rows(file_name):
+            if row['symbol'] not in excluded_symbols:
+                excluded_symbols.add(row['symbol'])
+                rows.append(row)
+
+        with self._lock:
+            assert not self._is_closed
+            self._flush()
+            self._write_rows(rows)
+        return [i['symbol'] for i in rows]
+
+    def flush(self) -> None:
+        # owners flush before they record the results as done, so the results must be on disk and not only in the OS
+        with self._lock:
+            if self._is_closed:
+                return
+
+            self._flush()
+            self._sync_file()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._is_closed:
+                return
+
+            self._flush()
+            self._close_file()
+            os.replace(self._partial_file_name, self._file_name)
+            self._is_closed = True
+
+    def _flush(self) -> None:
+        self._last_flush_time = time.monotonic()
+        if not self._pending_scan_results:
+            return
+
+        self._write_rows([self._to_row(i) for i in self._pending_scan_results])
+        self._pending_scan_results = []
+
+    @abc.abstractmethod
+    def _open_file(self, file_name: str, is_appending: bool) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _to_row(self, scan_result: ScanResult) -> dict:
+        pass
+
+    @abc.abstractmethod
+    def _read_rows(self, file_name: str) -> [dict]:
+        pass
+
+    @abc.abstractmethod
+    def _write_rows(self, rows: [dict]) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _sync_file(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _close_file(self) -> None:
+        pass
@@ -0,0 +1,125 @@
+import concurrent.futures
+import heapq
+import itertools
+import time
+
+from ..exceptions import TooManyRequestsException
+from ..symbol_filters import SymbolFilter
+from ..utilities import Logger
+from ..utilities import MetricsRegistry
+from ..utilities import RetryExecutor
+
+
+class ConcurrentSymbolScanner:
+    DEFAULT_MAX_RESCHEDULES = 5
+
+    def __init__(self,
+                 symbol_filter: SymbolFilter,
+                 number_of_workers: int = 1,
+                 max_pending_symbols: int = None,
+                 batch_size: int = 1,
+                 max_reschedules: int = DEFAULT_MAX_RESCHEDULES,
+                 reschedule_retry_executor: RetryExecutor = None):
+        self._symbol_filter = symbol_filter
+
+        assert number_of_workers >= 1
+        self._number_of_workers = number_of_workers
+
+        # symbols of a batch are evaluated together so that data sources can fetch them in one request
+        assert batch_size >= 1
+        self._batch_size = batch_size
+
+        # bounds memory and lets the symbol source stay lazy instead of submitting the whole universe at once
+        self._max_pending_symbols = max_pending_symbols if max_pending_symbols else number_of_workers * batch_size * 2
+        assert self._max_pending_symbols >= number_of_workers * batch_size
+
+        # throttled symbols wait in a queue instead of sleeping in a worker, which keeps evaluating other symbols
+        assert max_reschedules >= 0
+        self._max_reschedules = max_reschedules
+        self._reschedule_retry_executor = reschedule_retry_executor if reschedule_retry_executor else RetryExecutor(
+            initial_backoff_seconds=5)
+
+        self._metrics_registry = MetricsRegistry.get_default()
+        self._logger = Logger(self.__class__.__name__)
+
+    def scan(self, symbols, on_result, with_details: bool = False) -> None:
+        symbol_iterator = iter(symbols)
+        pending_futures = {}
+        # (ready at, sequence number, symbols, reschedules so far), the sequence number keeps equal times comparable
+        rescheduled_batches = []
+        sequence_numbers = itertools.count()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._number_of_workers,
+                                                   thread_name_prefix='symbol-scanner') as executor:
+            try:
+                self._submit_symbols(executor, symbol_iterator, pending_futures, rescheduled_batches, with_details)
+
+                while pending_futures or rescheduled_batches:
+                    timeout = max(0.0, rescheduled_batches[0][0] - time.monotonic()) if rescheduled_batches else None
+                    if pending_futures:
+                        completed_futures, _ = concurrent.futures.wait(pending_futures,
+                                                                       timeout=timeout,
+                                                                       return_when=concurrent.futures.FIRST_COMPLETED)
+                    else:
+                        time.sleep(timeout)
+                        completed_futures = set()
+
+                    for completed_future in completed_futures:
+                        batch_symbols, reschedules = pending_futures.pop(completed_future)
+                        try:
+                            filter_results = completed_future.result()
+                        except TooManyRequestsException as exception:
+                            if reschedules >= self._max_reschedules:
+                                raise
+
+                            self._reschedule(rescheduled_batches, next(sequence_numbers), batch_symbols, reschedules,
+                                             exception)
+                            continue
+
+                        for symbol, filter_result in zip(batch_symbols, filter_results):
+                            if with_details:
+                                symbol_passed, symbol_evaluations = filter_result
+                                on_result(symbol, symbol_passed, symbol_evaluations)
+                            else:
+                                on_result(symbol, filter_result)
+
+                    self._submit_symbols(executor, symbol_iterator, pending_futures, rescheduled_batches, with_details)
+            finally:
+                for pending_future in pending_futures:
+                    pending_future.cancel()
+
+    def _reschedule(self, rescheduled_batches: list, sequence_number: int, batch_symbols: [str], reschedules: int,
+                    exception: TooManyRequestsException) -> None:
+        backoff_seconds = self._reschedule_retry_executor.get_backoff_seconds(reschedules, exception)
+        heapq.heappush(rescheduled_batches,
+                       (time.monotonic() + backoff_seconds, sequence_number, batch_symbols, reschedules + 1))
+        self._metrics_registry.increment('scan_rescheduled_symbols_total', len(batch_symbols))
+        self._logger.log_info('rescheduling throttled symbols {} in {:.1f} seconds', ', '.join(batch_symbols),
+                              backoff_seconds)
+
+    def _filter_batch(self, symbols: [str], with_details: bool) -> list:
+        if self._batch_size == 1:
+            symbol_filter = self._symbol_filter.filter_with_details if with_details else self._symbol_filter.filter
+            return [symbol_filter(symbols[0])]
+
+        filter_results = self._symbol_filter.filter_symbols_with_details(symbols)
+        return filter_results if with_details else [i[0] for i in filter_results]
+
+    def _submit_symbols(self, executor, symbol_iterator, pending_futures: dict, rescheduled_batches: list,
+                        with_details: bool) -> None:
+        pending_symbols = sum(len(i[0]) for i in pending_futures.values())
+
+        while pending_symbols < self._max_pending_symbols:
+            if rescheduled_batches and rescheduled_batches[0][0] <= time.monotonic():
+                _, _, batch_symbols, reschedules = heapq.heappop(rescheduled_batches)
+            else:
+                batch_symbols = list(itertools.islice(symbol_iterator, self._batch_size))
+                reschedules = 0
+
+            if not batch_symbols:
+                return
+
+            self._logger.log_info('processing symbols {}', ', '.join(batch_symbols))
+            pending_futures[executor.submit(self._filter_batch, batch_symbols, with_details)] = (batch_symbols,
+                                                                                                 reschedules)
+            pending_symbols += len(batch_symbols)
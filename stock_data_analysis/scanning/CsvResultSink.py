@@ -0,0 +1,44 @@
+import csv
+import json
+import os
+
+from . import BufferedResultSink
+from . import ScanResult
+
+
+class CsvResultSink(BufferedResultSink):
+    def __init__(self, file_name: str, evaluator_names: [str], **kwargs):
+        self._evaluator_names = list(evaluator_names)
+        self._field_names = ['symbol', 'passed', 'data_source_name']
+        for evaluator_name in self._evaluator_names:
+            self._field_names += ['{}.passed'.format(evaluator_name), '{}.growth'.format(evaluator_name)]
+
+        super().__init__(file_name, **kwargs)
+
+    def _open_file(self, file_name: str, is_appending: bool) -> None:
+        self._file = open(file_name, 'a' if is_appending else 'w', newline='')
+        self._csv_writer = csv.DictWriter(self._file, self._field_names)
+        if not is_appending:
+            self._csv_writer.writeheader()
+
+    def _to_row(self, scan_result: ScanResult) -> dict:
+        row = scan_result.to_flat_dict(self._evaluator_names)
+        for evaluator_name in self._evaluator_names:
+            growth_field_name = '{}.growth'.format(evaluator_name)
+            row[growth_field_name] = json.dumps(row[growth_field_name])
+        return row
+
+    def _read_rows(self, file_name: str) -> [dict]:
+        # rows are copied as read so that growth columns stay JSON encoded, a row torn by a crash misses fields
+        with open(file_name, newline='') as result_file:
+            return [i for i in csv.DictReader(result_file) if None not in i and None not in i.values()]
+
+    def _write_rows(self, rows: [dict]) -> None:
+        self._csv_writer.writerows(rows)
+        self._file.flush()
+
+    def _sync_file(self) -> None:
+        os.fsync(self._file.fileno())
+
+    def _close_file(self) -> None:
+        self._file.close()
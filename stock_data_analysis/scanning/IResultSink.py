@@ -0,0 +1,13 @@
+import abc
+
+from . import ScanResult
+
+
+class IResultSink(abc.ABC):
+    @abc.abstractmethod
+    def write(self, scan_result: ScanResult) -> None:
+        pass
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        pass
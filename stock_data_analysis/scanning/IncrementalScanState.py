@@ -0,0 +1,66 @@
+import os
+import sqlite3
+import threading
+import time
+
+
+class IncrementalScanState:
+    COMMIT_INTERVAL = 100
+
+    class SymbolState:
+        __slots__ = ('fiscal_date_ending', 'reported_date', 'configuration_fingerprint', 'verdict', 'evaluated_at')
+
+        def __init__(self, fiscal_date_ending: str, reported_date: str, configuration_fingerprint: str, verdict: bool,
+                     evaluated_at: float):
+            self.fiscal_date_ending = fiscal_date_ending
+            self.reported_date = reported_date
+            self.configuration_fingerprint = configuration_fingerprint
+            self.verdict = verdict
+            self.evaluated_at = evaluated_at
+
+    def __init__(self, database_file_name: str):
+        database_folder_name = os.path.dirname(database_file_name)
+        if database_folder_name and not os.path.exists(database_folder_name):
+            os.makedirs(database_folder_name)
+
+        self._uncommitted_updates = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database_file_name, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS symbol_states (symbol TEXT PRIMARY KEY, '
+                                 'fiscal_date_ending TEXT, reported_date TEXT, '
+                                 'configuration_fingerprint TEXT NOT NULL, verdict INTEGER NOT NULL, '
+                                 'evaluated_at REAL NOT NULL)')
+        self._connection.commit()
+
+    def get(self, symbol: str) -> SymbolState:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT fiscal_date_ending, reported_date, configuration_fingerprint, verdict, evaluated_at '
+                'FROM symbol_states WHERE symbol = ?', (symbol, )).fetchone()
+
+        if row is None:
+            return None
+
+        return IncrementalScanState.SymbolState(row[0], row[1], row[2], bool(row[3]), row[4])
+
+    def put(self, symbol: str, fiscal_date_ending: str, reported_date: str, configuration_fingerprint: str,
+            verdict: bool) -> None:
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO symbol_states (symbol, fiscal_date_ending, reported_date, '
+                'configuration_fingerprint, verdict, evaluated_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (symbol, fiscal_date_ending, reported_date, configuration_fingerprint, int(verdict), time.time()))
+
+            self._uncommitted_updates += 1
+            if self._uncommitted_updates >= IncrementalScanState.COMMIT_INTERVAL:
+                self._commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._commit()
+            self._connection.close()
+
+    def _commit(self) -> None:
+        self._connection.commit()
+        self._uncommitted_updates = 0
@@ -0,0 +1,115 @@
+import collections
+import datetime
+import threading
+
+from . import IncrementalScanState
+from ..data_sources import IDataSourceAdapter
+from ..symbol_filters import SymbolEvaluation
+from ..symbol_filters import SymbolFilter
+from ..utilities import Logger
+
+
+class IncrementalSymbolFilter:
+    # quarterly reports are roughly 91 days apart, so no new filing is expected for a while after the last one
+    DEFAULT_MIN_DAYS_BETWEEN_FILINGS = 80
+
+    def __init__(self,
+                 symbol_filter: SymbolFilter,
+                 data_source_adapter: IDataSourceAdapter,
+                 incremental_scan_state: IncrementalScanState,
+                 configuration_fingerprint: str,
+                 min_days_between_filings: int = DEFAULT_MIN_DAYS_BETWEEN_FILINGS):
+        self._symbol_filter = symbol_filter
+        self._data_source_adapter = data_source_adapter
+        self._incremental_scan_state = incremental_scan_state
+        self._configuration_fingerprint = configuration_fingerprint
+
+        assert min_days_between_filings >= 0
+        self._min_days_between_filings = min_days_between_filings
+
+        self._statistics = collections.Counter({'reused_without_fetch': 0, 'reused_after_fetch': 0, 'reevaluated': 0})
+        self._lock = threading.Lock()
+        self._logger = Logger(self.__class__.__name__)
+
+    def __str__(self):
+        return str(self._symbol_filter)
+
+    def filter(self, symbol: str) -> bool:
+        return self._filter(symbol, lambda: (self._symbol_filter.filter(symbol), []))[0]
+
+    def filter_with_details(self, symbol: str) -> (bool, [SymbolEvaluation]):
+        return self._filter(symbol, lambda: self._symbol_filter.filter_with_details(symbol))
+
+    def filter_symbols_with_details(self, symbols: [str]) -> [(bool, [SymbolEvaluation])]:
+        filter_results = {}
+        reevaluated_symbols = {}
+        for symbol in symbols:
+            reusable_verdict, latest_report_dates = self._get_reusable_verdict(symbol)
+            if reusable_verdict is None:
+                reevaluated_symbols[symbol] = latest_report_dates
+            else:
+                filter_results[symbol] = (reusable_verdict, [])
+
+        # only symbols with new filings reach the wrapped filter, still grouped into one batch
+        for symbol, filter_result in zip(reevaluated_symbols,
+                                         self._symbol_filter.filter_symbols_with_details(list(reevaluated_symbols))):
+            self._record_verdict(symbol, reevaluated_symbols[symbol], filter_result[0])
+            filter_results[symbol] = filter_result
+
+        return [filter_results[symbol] for symbol in symbols]
+
+    def get_statistics(self) -> dict:
+        with self._lock:
+            return dict(self._statistics)
+
+    def _filter(self, symbol: str, evaluate) -> (bool, [SymbolEvaluation]):
+        # verdicts reused from the state carry no evaluation details
+        reusable_verdict, latest_report_dates = self._get_reusable_verdict(symbol)
+        if reusable_verdict is not None:
+            return reusable_verdict, []
+
+        verdict, symbol_evaluations = evaluate()
+        self._record_verdict(symbol, latest_report_dates, verdict)
+        return verdict, symbol_evaluations
+
+    def _get_reusable_verdict(self, symbol: str) -> (bool, (str, str)):
+        symbol_state = self._incremental_scan_state.get(symbol)
+        is_configuration_unchanged = symbol_state is not None and \
+            symbol_state.configuration_fingerprint == self._configuration_fingerprint
+
+        if is_configuration_unchanged and not self._is_new_filing_due(symbol_state):
+            self._logger.log_debug('reusing verdict {} of symbol {} without fetching', symbol_state.verdict, symbol)
+            self._count('reused_without_fetch')
+            return symbol_state.verdict, None
+
+        latest_report_dates = self._data_source_adapter.get_latest_earnings_report_dates(symbol)
+        fiscal_date_ending, reported_date = latest_report_dates if latest_report_dates else (None, None)
+
+        if is_configuration_unchanged and fiscal_date_ending == symbol_state.fiscal_date_ending:
+            self._logger.log_debug('reusing verdict {} of symbol {} without new filings', symbol_state.verdict, symbol)
+            self._count('reused_after_fetch')
+            return symbol_state.verdict, None
+
+        return None, (fiscal_date_ending, reported_date)
+
+    def _record_verdict(self, symbol: str, latest_report_dates: (str, str), verdict: bool) -> None:
+        fiscal_date_ending, reported_date = latest_report_dates
+        self._incremental_scan_state.put(symbol, fiscal_date_ending, reported_date, self._configuration_fingerprint,
+                                         verdict)
+        self._count('reevaluated')
+
+    def _is_new_filing_due(self, symbol_state: IncrementalScanState.SymbolState) -> bool:
+        last_filing_date = symbol_state.reported_date or symbol_state.fiscal_date_ending
+        if not last_filing_date:
+            return True
+
+        try:
+            last_filing_date = datetime.date.fromisoformat(last_filing_date)
+        except ValueError:
+            return True
+
+        return (datetime.date.today() - last_filing_date).days >= self._min_days_between_filings
+
+    def _count(self, statistic_name: str) -> None:
+        with self._lock:
+            self._statistics[statistic_name] += 1
@@ -0,0 +1,45 @@
+import json
+import os
+
+from . import BufferedResultSink
+from . import ScanResult
+
+
+class JsonLinesResultSink(BufferedResultSink):
+    def _open_file(self, file_name: str, is_appending: bool) -> None:
+        is_torn = False
+        if is_appending:
+            with open(file_name, 'rb') as existing_file:
+                existing_file.seek(0, 2)
+                if existing_file.tell():
+                    existing_file.seek(-1, 2)
+                    is_torn = existing_file.read(1) != b'\n'
+
+        self._file = open(file_name, 'a' if is_appending else 'w')
+        if is_torn:
+            # terminate a line torn by a crash so that the next batch starts on its own line
+            self._file.write('\n')
+
+    def _to_row(self, scan_result: ScanResult) -> dict:
+        return scan_result.to_dict()
+
+    def _read_rows(self, file_name: str) -> [dict]:
+        rows = []
+        with open(file_name) as result_file:
+            for line in result_file:
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # a line torn by a crash belongs to a symbol that the journal has not recorded
+                    continue
+        return rows
+
+    def _write_rows(self, rows: [dict]) -> None:
+        self._file.write(''.join(json.dumps(i) + '\n' for i in rows))
+        self._file.flush()
+
+    def _sync_file(self) -> None:
+        os.fsync(self._file.fileno())
+
+    def _close_file(self) -> None:
+        self._file.close()
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+from ..utilities import Logger
+
+
+class LocalShardLauncher:
+    def __init__(self,
+                 script_file_name: str,
+                 arguments: [str],
+                 shard_count: int,
+                 shard_environments: [dict] = None,
+                 python_executable: str = sys.executable):
+        assert shard_count >= 1
+        assert shard_environments is None or len(shard_environments) == shard_count
+        self._script_file_name = script_file_name
+        self._arguments = list(arguments)
+        self._shard_count = shard_count
+        self._shard_environments = shard_environments if shard_environments else [{}] * shard_count
+        self._python_executable = python_executable
+        self._logger = Logger(self.__class__.__name__)
+
+    @staticmethod
+    def remove_options(arguments: [str], option_names: [str]) -> [str]:
+        remaining_arguments = []
+        is_removing_values = False
+
+        for argument in arguments:
+            if argument.startswith('--'):
+                is_removing_values = argument in option_names
+                if is_removing_values or argument.split('=', 1)[0] in option_names:
+                    continue
+            elif is_removing_values:
+                continue
+
+            remaining_arguments.append(argument)
+
+        return remaining_arguments
+
+    def launch(self, run_id: str) -> [int]:
+        processes = []
+        for shard_index in range(self._shard_count):
+            command = [self._python_executable, self._script_file_name] + self._arguments
+            command += ['--run-id', run_id, '--shard-index', str(shard_index), '--shard-count', str(self._shard_count)]
+            # tokens are handed over in the environment so that they do not show up in process listings
+            environment = dict(os.environ, **self._shard_environments[shard_index])
+
+            self._logger.log_info('starting shard {} of {}', shard_index, self._shard_count)
+            processes.append(subprocess.Popen(command, env=environment))
+
+        try:
+            return_codes = [i.wait() for i in processes]
+        except KeyboardInterrupt:
+            # the shards received the interrupt as well, give them the chance to flush their journals
+            return_codes = [i.wait() for i in processes]
+
+        for shard_index, return_code in enumerate(return_codes):
+            if return_code:
+                self._logger.log_warning('shard {} exited with code {}', shard_index, return_code)
+
+        return return_codes
@@ -0,0 +1,102 @@
+import json
+import os
+
+from . import BufferedResultSink
+from . import ScanResult
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+class ParquetResultSink(BufferedResultSink):
+    PARQUET_MAGIC_BYTES = b'PAR1'
+    # small row groups would defeat the columnar layout
+    ROW_GROUP_SIZE = 10000
+
+    def __init__(self, file_name: str, evaluator_names: [str], **kwargs):
+        if not ParquetResultSink.is_supported():
+            raise Exception('Writing Parquet results requires pyarrow')
+
+        self._evaluator_names = list(evaluator_names)
+        fields = [('symbol', pyarrow.string()), ('passed', pyarrow.bool_()), ('data_source_name', pyarrow.string())]
+        for evaluator_name in self._evaluator_names:
+            fields += [('{}.passed'.format(evaluator_name), pyarrow.bool_()),
+                       ('{}.growth'.format(evaluator_name), pyarrow.list_(pyarrow.float64()))]
+        self._schema = pyarrow.schema(fields)
+        self._spool_file = None
+
+        super().__init__(file_name, **kwargs)
+
+    @staticmethod
+    def is_supported() -> bool:
+        return pyarrow is not None
+
+    def _open_file(self, file_name: str, is_appending: bool) -> None:
+        # a Parquet file is unreadable until its footer is written on close, so rows are spooled as JSON lines that
+        # survive a crash and are converted to Parquet when the sink is closed
+        existing_rows = []
+        is_torn = False
+        if is_appending:
+            if self._is_parquet_file(file_name):
+                # the results of a finished run are read back from its complete file
+                existing_rows = self._read_rows(file_name)
+                is_appending = False
+            else:
+                with open(file_name, 'rb') as existing_file:
+                    existing_file.seek(0, 2)
+                    if existing_file.tell():
+                        existing_file.seek(-1, 2)
+                        is_torn = existing_file.read(1) != b'\n'
+
+        self._spool_file = open(file_name, 'a' if is_appending else 'w')
+        if is_torn:
+            self._spool_file.write('\n')
+        self._write_rows(existing_rows)
+
+    def _to_row(self, scan_result: ScanResult) -> dict:
+        return scan_result.to_flat_dict(self._evaluator_names)
+
+    def _read_rows(self, file_name: str) -> [dict]:
+        if self._is_parquet_file(file_name):
+            return pyarrow.parquet.read_table(file_name, schema=self._schema).to_pylist()
+
+        rows = []
+        with open(file_name) as spool_file:
+            for line in spool_file:
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # a line torn by a crash belongs to a symbol that the journal has not recorded
+                    continue
+        return rows
+
+    def _write_rows(self, rows: [dict]) -> None:
+        self._spool_file.write(''.join(json.dumps(i) + '\n' for i in rows))
+        self._spool_file.flush()
+
+    def _sync_file(self) -> None:
+        os.fsync(self._spool_file.fileno())
+
+    @staticmethod
+    def _is_parquet_file(file_name: str) -> bool:
+        with open(file_name, 'rb') as existing_file:
+            return existing_file.read(len(ParquetResultSink.PARQUET_MAGIC_BYTES)) == \
+                ParquetResultSink.PARQUET_MAGIC_BYTES
+
+    def _close_file(self) -> None:
+        spool_file_name = self._spool_file.name
+        self._spool_file.close()
+
+        parquet_file_name = spool_file_name + '.parquet'
+        parquet_writer = pyarrow.parquet.ParquetWriter(parquet_file_name, self._schema)
+        rows = self._read_rows(spool_file_name)
+        for i in range(0, len(rows), ParquetResultSink.ROW_GROUP_SIZE):
+            parquet_writer.write_table(
+                pyarrow.Table.from_pylist(rows[i:i + ParquetResultSink.ROW_GROUP_SIZE], self._schema))
+        parquet_writer.close()
+
+        # the base class publishes the partial file, which now holds the Parquet data
+        os.replace(parquet_file_name, spool_file_name)
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from ..utilities import Logger
+
+
+class ScanJournal:
+    def __init__(self,
+                 journal_file_name: str,
+                 inputs_fingerprint: str,
+                 batch_size: int = 100,
+                 flush_interval_seconds: float = 5,
+                 before_flush=None):
+        self._journal_file_name = journal_file_name
+        self._inputs_fingerprint = inputs_fingerprint
+
+        assert batch_size > 0
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        # lets the results of a symbol reach their output before the journal marks the symbol complete
+        self._before_flush = before_flush
+
+        self._pending_lines = []
+        self._last_flush_time = time.monotonic()
+        self._lock = threading.Lock()
+        self._logger = Logger(self.__class__.__name__)
+
+        journal_folder_name = os.path.dirname(journal_file_name)
+        if journal_folder_name and not os.path.exists(journal_folder_name):
+            os.makedirs(journal_folder_name)
+
+        self._records = self._load_records()
+        self._journal_file = open(journal_file_name, 'a')
+
+    @staticmethod
+    def create_fingerprint(*inputs) -> str:
+        return hashlib.sha256('\n'.join(str(i) for i in inputs).encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def read_results(journal_file_name: str, inputs_fingerprint: str) -> dict:
+        results = {}
+        with open(journal_file_name) as journal_file:
+            for line in journal_file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                if record['fingerprint'] == inputs_fingerprint:
+                    results[record['symbol']] = record['passed']
+
+        return results
+
+    def get_journal_file_name(self) -> str:
+        return self._journal_file_name
+
+    def is_completed(self, symbol: str) -> bool:
+        with self._lock:
+            record = self._records.get(symbol)
+
+        return record is not None and record['fingerprint'] == self._inputs_fingerprint
+
+    def get_completed_symbols(self) -> [str]:
+        with self._lock:
+            return [
+                symbol for symbol, record in self._records.items() if record['fingerprint'] == self._inputs_fingerprint
+            ]
+
+    def record(self, symbol: str, symbol_passed: bool) -> None:
+        record = {'symbol': symbol, 'passed': symbol_passed, 'fingerprint': self._inputs_fingerprint}
+
+        with self._lock:
+            self._records[symbol] = record
+            self._pending_lines.append(json.dumps(record) + '\n')
+
+            if len(self._pending_lines) >= self._batch_size or \
+                    time.monotonic() - self._last_flush_time >= self._flush_interval_seconds:
+                self._flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._journal_file.close()
+
+    def _flush(self) -> None:
+        self._last_flush_time = time.monotonic()
+        if not self._pending_lines:
+            return
+
+        if self._before_flush is not None:
+            self._before_flush()
+
+        # a single write per batch keeps appends from concurrent writers from interleaving within a line
+        self._journal_file.write(''.join(self._pending_lines))
+        self._journal_file.flush()
+        os.fsync(self._journal_file.fileno())
+        self._pending_lines = []
+
+    def _load_records(self) -> dict:
+        records = {}
+        if not os.path.exists(self._journal_file_name):
+            return records
+
+        with open(self._journal_file_name, 'r+') as journal_file:
+            content = journal_file.read()
+            for line in content.splitlines():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    self._logger.log_warning('skipping torn journal line {}', line)
+                    continue
+
+                records[record['symbol']] = record
+
+            # terminate a line torn by a crash so that the next batch starts on its own line
+            if content and not content.endswith('\n'):
+                journal_file.write('\n')
+
+        self._logger.log_info('loaded {} records from journal {}', len(records), self._journal_file_name)
+        return records
@@ -0,0 +1,58 @@
+import threading
+import time
+
+from ..utilities import Logger
+from ..utilities import MetricsRegistry
+
+
+class ScanProgressReporter:
+    def __init__(self, report_interval_seconds: float = 30, total_symbols: int = None):
+        self._report_interval_seconds = report_interval_seconds
+        self._total_symbols = total_symbols
+        self._processed_symbols = 0
+        self._passed_symbols = 0
+        self._start_time = time.monotonic()
+        self._last_report_time = self._start_time
+        self._lock = threading.Lock()
+        self._metrics_registry = MetricsRegistry.get_default()
+        self._logger = Logger(self.__class__.__name__)
+
+    def record_result(self, symbol_passed: bool) -> None:
+        with self._lock:
+            self._processed_symbols += 1
+            self._metrics_registry.increment('scan_processed_symbols_total')
+            if symbol_passed:
+                self._passed_symbols += 1
+                self._metrics_registry.increment('scan_passed_symbols_total')
+
+            self._metrics_registry.set_gauge('scan_symbols_per_second', self.get_symbols_per_second())
+
+            self._report_if_due()
+
+    def get_symbols_per_second(self) -> float:
+        elapsed_seconds = time.monotonic() - self._start_time
+        return self._processed_symbols / elapsed_seconds if elapsed_seconds > 0 else 0.0
+
+    def get_summary(self) -> dict:
+        with self._lock:
+            return {
+                'processed_symbols': self._processed_symbols,
+                'passed_symbols': self._passed_symbols,
+                'elapsed_seconds': time.monotonic() - self._start_time,
+                'symbols_per_second': self.get_symbols_per_second()
+            }
+
+    def report(self) -> None:
+        with self._lock:
+            self._report()
+
+    def _report_if_due(self) -> None:
+        if time.monotonic() - self._last_report_time >= self._report_interval_seconds:
+            self._report()
+
+    def _report(self) -> None:
+        self._last_report_time = time.monotonic()
+        progress = '{}/{}'.format(self._processed_symbols,
+                                  self._total_symbols) if self._total_symbols else str(self._processed_symbols)
+        self._logger.log_info('processed {} symbols, {} passed, {:.2f} symbols/sec', progress, self._passed_symbols,
+                              self.get_symbols_per_second())
@@ -0,0 +1,33 @@
+from ..symbol_filters import SymbolEvaluation
+
+
+class ScanResult:
+    __slots__ = ('symbol', 'passed', 'symbol_evaluations')
+
+    def __init__(self, symbol: str, passed: bool, symbol_evaluations: [SymbolEvaluation] = None):
+        self.symbol = symbol
+        self.passed = passed
+        self.symbol_evaluations = symbol_evaluations if symbol_evaluations is not None else []
+
+    def get_data_source_name(self) -> str:
+        return next((i.data_source_name for i in self.symbol_evaluations if i.data_source_name), None)
+
+    def to_dict(self) -> dict:
+        return {
+            'symbol': self.symbol,
+            'passed': self.passed,
+            'data_source_name': self.get_data_source_name(),
+            'evaluations': [i.to_dict() for i in self.symbol_evaluations]
+        }
+
+    def to_flat_dict(self, evaluator_names: [str]) -> dict:
+        # evaluators skipped after an earlier rejection have no verdict
+        symbol_evaluations = {i.evaluator_name: i for i in self.symbol_evaluations}
+        flat_dict = {'symbol': self.symbol, 'passed': self.passed, 'data_source_name': self.get_data_source_name()}
+
+        for evaluator_name in evaluator_names:
+            symbol_evaluation = symbol_evaluations.get(evaluator_name)
+            flat_dict['{}.passed'.format(evaluator_name)] = symbol_evaluation.passed if symbol_evaluation else None
+            flat_dict['{}.growth'.format(evaluator_name)] = symbol_evaluation.growth if symbol_evaluation else []
+
+        return flat_dict
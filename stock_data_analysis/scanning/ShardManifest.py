@@ -0,0 +1,35 @@
+import json
+import os
+
+
+class ShardManifest:
+    __slots__ = ('run_id', 'shard_index', 'shard_count', 'configuration_fingerprint', 'journal_file_name',
+                 'assigned_symbols', 'is_complete')
+
+    def __init__(self,
+                 run_id: str,
+                 shard_index: int,
+                 shard_count: int,
+                 configuration_fingerprint: str,
+                 journal_file_name: str,
+                 assigned_symbols: [str] = None,
+                 is_complete: bool = False):
+        self.run_id = run_id
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.configuration_fingerprint = configuration_fingerprint
+        self.journal_file_name = journal_file_name
+        self.assigned_symbols = assigned_symbols if assigned_symbols is not None else []
+        self.is_complete = is_complete
+
+    @classmethod
+    def read(cls, manifest_file_name: str):
+        with open(manifest_file_name) as manifest_file:
+            return cls(**json.load(manifest_file))
+
+    def write(self, manifest_file_name: str) -> None:
+        temporary_file_name = '{}.tmp'.format(manifest_file_name)
+        with open(temporary_file_name, 'w') as temporary_file:
+            json.dump({i: getattr(self, i) for i in ShardManifest.__slots__}, temporary_file)
+
+        os.replace(temporary_file_name, manifest_file_name)
@@ -0,0 +1,24 @@
+import zlib
+
+
+class ShardPartitioner:
+    def __init__(self, shard_count: int):
+        assert shard_count >= 1
+        self._shard_count = shard_count
+
+    def get_shard_count(self) -> int:
+        return self._shard_count
+
+    def get_shard_index(self, symbol: str) -> int:
+        # the built-in hash is salted per process, a checksum assigns a symbol to the same shard on every machine
+        return zlib.crc32(symbol.encode('utf-8')) % self._shard_count
+
+    def get_shard_name(self, shard_index: int) -> str:
+        assert 0 <= shard_index < self._shard_count
+        return 'shard-{}-of-{}'.format(shard_index, self._shard_count)
+
+    def filter_symbols(self, symbols, shard_index: int):
+        assert 0 <= shard_index < self._shard_count
+        for symbol in symbols:
+            if self.get_shard_index(symbol) == shard_index:
+                yield symbol
@@ -0,0 +1,59 @@
+import collections
+import os
+
+from . import ScanJournal
+from . import ShardManifest
+from . import ShardPartitioner
+from ..utilities import Logger
+
+
+class ShardResultMerger:
+    def __init__(self):
+        self._logger = Logger(self.__class__.__name__)
+
+    def merge(self, manifest_file_names: [str]) -> dict:
+        assert manifest_file_names
+        manifests = [ShardManifest.read(i) for i in manifest_file_names]
+
+        shard_counts = {i.shard_count for i in manifests}
+        if len(shard_counts) != 1:
+            raise Exception('Shards were partitioned into different shard counts {}'.format(sorted(shard_counts)))
+        shard_count = shard_counts.pop()
+        shard_partitioner = ShardPartitioner(shard_count)
+
+        shard_indexes = collections.Counter(i.shard_index for i in manifests)
+        expected_symbols = set()
+        evaluating_shards = collections.defaultdict(list)
+        misassigned_symbols = set()
+        results = {}
+
+        for manifest_file_name, manifest in zip(manifest_file_names, manifests):
+            # journals are looked up next to their manifest so that shards can be collected from several machines
+            journal_file_name = os.path.join(os.path.dirname(manifest_file_name),
+                                             os.path.basename(manifest.journal_file_name))
+            shard_results = ScanJournal.read_results(journal_file_name, manifest.configuration_fingerprint) \
+                if os.path.exists(journal_file_name) else {}
+            self._logger.log_info('read {} results of {} assigned symbols from {}', len(shard_results),
+                                  len(manifest.assigned_symbols), journal_file_name)
+
+            expected_symbols.update(manifest.assigned_symbols)
+            for symbol, symbol_passed in shard_results.items():
+                evaluating_shards[symbol].append(manifest.shard_index)
+                results[symbol] = results.get(symbol, False) or symbol_passed
+                if shard_partitioner.get_shard_index(symbol) != manifest.shard_index:
+                    misassigned_symbols.add(symbol)
+
+        return {
+            'run_ids': sorted({i.run_id for i in manifests}),
+            'shard_count': shard_count,
+            'missing_shards': [i for i in range(shard_count) if i not in shard_indexes],
+            'duplicated_shards': sorted(i for i, count in shard_indexes.items() if count > 1),
+            'incomplete_shards': sorted(i.shard_index for i in manifests if not i.is_complete),
+            'configuration_fingerprints': sorted({i.configuration_fingerprint for i in manifests}),
+            'expected_symbols': len(expected_symbols),
+            'evaluated_symbols': len(results),
+            'missing_symbols': sorted(expected_symbols.difference(results)),
+            'duplicated_symbols': sorted(symbol for symbol, shards in evaluating_shards.items() if len(shards) > 1),
+            'misassigned_symbols': sorted(misassigned_symbols),
+            'passed_symbols': sorted(symbol for symbol, symbol_passed in results.items() if symbol_passed)
+        }
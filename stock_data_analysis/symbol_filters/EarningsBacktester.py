@@ -0,0 +1,108 @@
+import numpy
+
+from . import EarningsPerShareMatrix
+from . import ISymbolEvaluator
+from ..data_sources import EarningsRecord
+from ..utilities import Logger
+
+
+class EarningsBacktester:
+    # periods without a reported date are assumed known once the filing deadline after the period end has passed
+    DEFAULT_REPORTING_LAG_DAYS = 90
+
+    def __init__(self,
+                 quarterly_evaluators: [ISymbolEvaluator],
+                 yearly_evaluators: [ISymbolEvaluator],
+                 reporting_lag_days: int = DEFAULT_REPORTING_LAG_DAYS):
+        assert quarterly_evaluators or yearly_evaluators
+        # evaluators are applied through evaluate_earnings_per_share_matrix, the same rules as a live batch scan
+        self._quarterly_evaluators = list(quarterly_evaluators)
+        self._yearly_evaluators = list(yearly_evaluators)
+
+        assert reporting_lag_days >= 0
+        self._reporting_lag = numpy.timedelta64(reporting_lag_days, 'D')
+        self._logger = Logger(self.__class__.__name__)
+
+    @staticmethod
+    def get_quarter_end_dates(start_date: str, end_date: str) -> [str]:
+        months = numpy.arange(numpy.datetime64(start_date, 'M'), numpy.datetime64(end_date, 'M') + 1)
+        quarter_end_months = months[months.astype(int) % 3 == 2]
+        quarter_end_dates = (quarter_end_months + 1).astype('datetime64[D]') - 1
+        quarter_end_dates = quarter_end_dates[(quarter_end_dates >= numpy.datetime64(start_date, 'D')) &
+                                              (quarter_end_dates <= numpy.datetime64(end_date, 'D'))]
+        return [str(i) for i in quarter_end_dates]
+
+    def backtest(self, earnings_records: {str: EarningsRecord}, as_of_dates: [str]) -> {str: [str]}:
+        symbols = list(earnings_records)
+        as_of_dates = sorted(as_of_dates)
+
+        evaluations = [(i, self._get_quarterly_history(earnings_records, symbols)) for i in self._quarterly_evaluators]
+        evaluations += [(i, self._get_yearly_history(earnings_records, symbols)) for i in self._yearly_evaluators]
+
+        passed_symbols_by_date = {}
+        for as_of_date in as_of_dates:
+            passed = numpy.ones(len(symbols), dtype=bool)
+            for evaluator, (earnings_per_share, report_dates) in evaluations:
+                passed &= self._evaluate_as_of(evaluator, symbols, earnings_per_share, report_dates,
+                                               numpy.datetime64(as_of_date, 'D'))
+
+            passed_symbols_by_date[as_of_date] = [symbol for symbol, i in zip(symbols, passed) if i]
+            self._logger.log_info('{} of {} symbols passed as of {}', len(passed_symbols_by_date[as_of_date]),
+                                  len(symbols), as_of_date)
+
+        return passed_symbols_by_date
+
+    def _evaluate_as_of(self, evaluator: ISymbolEvaluator, symbols: [str], earnings_per_share: numpy.ndarray,
+                        report_dates: numpy.ndarray, as_of_date: numpy.datetime64) -> numpy.ndarray:
+        number_of_periods_needed = evaluator.get_number_of_periods_needed()
+        # report dates only grow along a row, so the periods known at a date are a prefix of the history
+        known_periods = numpy.count_nonzero(report_dates <= as_of_date, axis=1)
+
+        # the leading NaN padding lets a window end before the first period, like a history that is too short
+        padded_earnings_per_share = numpy.hstack(
+            (numpy.full((len(symbols), number_of_periods_needed), numpy.nan), earnings_per_share))
+        windows = numpy.lib.stride_tricks.sliding_window_view(padded_earnings_per_share, number_of_periods_needed,
+                                                              axis=1)
+        latest_windows = windows[numpy.arange(len(symbols)), known_periods]
+
+        return evaluator.evaluate_earnings_per_share_matrix(EarningsPerShareMatrix(symbols, latest_windows))
+
+    def _get_quarterly_history(self, earnings_records: {str: EarningsRecord}, symbols: [str]) -> tuple:
+        return self._to_history_arrays(symbols, [earnings_records[i].quarterly_earnings_per_share for i in symbols], [
+            self._get_report_dates(earnings_records[i].quarterly_period_ends,
+                                   earnings_records[i].quarterly_reported_dates) for i in symbols
+        ])
+
+    def _get_yearly_history(self, earnings_records: {str: EarningsRecord}, symbols: [str]) -> tuple:
+        report_dates = []
+        for symbol in symbols:
+            earnings_record = earnings_records[symbol]
+            # a fiscal year is reported together with the quarter that ends it
+            reported_dates_by_period_end = dict(
+                zip(earnings_record.quarterly_period_ends, earnings_record.quarterly_reported_dates))
+            yearly_reported_dates = [reported_dates_by_period_end.get(i) for i in earnings_record.yearly_period_ends]
+            report_dates.append(self._get_report_dates(earnings_record.yearly_period_ends, yearly_reported_dates))
+
+        return self._to_history_arrays(symbols, [earnings_records[i].yearly_earnings_per_share for i in symbols],
+                                       report_dates)
+
+    def _get_report_dates(self, period_ends: [str], reported_dates: [str]) -> numpy.ndarray:
+        report_dates = numpy.array([i if i else None for i in reported_dates], dtype='datetime64[D]')
+        estimated_report_dates = numpy.array([i if i else None for i in period_ends],
+                                             dtype='datetime64[D]') + self._reporting_lag
+        report_dates = numpy.where(numpy.isnat(report_dates), estimated_report_dates, report_dates)
+        # a period of unknown date keeps itself and every later period out of the backtest
+        return numpy.maximum.accumulate(report_dates) if len(report_dates) else report_dates
+
+    @staticmethod
+    def _to_history_arrays(symbols: [str], earnings_per_share_series: list, report_date_series: list) -> tuple:
+        number_of_periods = max((len(i) for i in earnings_per_share_series), default=0)
+        earnings_per_share = numpy.full((len(symbols), number_of_periods), numpy.nan)
+        report_dates = numpy.full((len(symbols), number_of_periods), numpy.datetime64('NaT'), dtype='datetime64[D]')
+
+        # rows hold each history oldest first from the first column, periods after its end are never known
+        for row, (series, series_report_dates) in enumerate(zip(earnings_per_share_series, report_date_series)):
+            earnings_per_share[row, :len(series)] = numpy.frombuffer(series, dtype=float) if len(series) else []
+            report_dates[row, :len(series)] = series_report_dates
+
+        return earnings_per_share, report_dates
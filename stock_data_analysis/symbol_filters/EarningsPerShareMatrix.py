@@ -0,0 +1,40 @@
+import numpy
+
+
+class EarningsPerShareMatrix:
+    def __init__(self, symbols: [str], earnings_per_share: numpy.ndarray):
+        assert earnings_per_share.ndim == 2 and earnings_per_share.shape[0] == len(symbols)
+        self._symbols = list(symbols)
+        self._earnings_per_share = earnings_per_share
+
+    @classmethod
+    def from_earnings_per_share_series(cls, earnings_per_share_by_symbol: dict, number_of_periods: int = None):
+        symbols = list(earnings_per_share_by_symbol)
+        if number_of_periods is None:
+            number_of_periods = max((len(i) for i in earnings_per_share_by_symbol.values()), default=0)
+
+        # rows are aligned on the most recent period in the last column, missing older periods are NaN
+        earnings_per_share = numpy.full((len(symbols), number_of_periods), numpy.nan)
+        for row, symbol in enumerate(symbols):
+            series = earnings_per_share_by_symbol[symbol][-number_of_periods:] if number_of_periods else []
+            if series:
+                earnings_per_share[row, number_of_periods - len(series):] = series
+
+        return cls(symbols, earnings_per_share)
+
+    def get_symbols(self) -> [str]:
+        return self._symbols
+
+    def get_earnings_per_share(self) -> numpy.ndarray:
+        return self._earnings_per_share
+
+    def get_number_of_periods(self) -> int:
+        return self._earnings_per_share.shape[1]
+
+    def get_history_lengths(self) -> numpy.ndarray:
+        # number of consecutive known periods counting back from the most recent one
+        known_periods = ~numpy.isnan(self._earnings_per_share[:, ::-1])
+        return numpy.cumprod(known_periods, axis=1).sum(axis=1)
+
+    def get_symbols_by_mask(self, mask: numpy.ndarray) -> [str]:
+        return [symbol for symbol, selected in zip(self._symbols, mask) if selected]
@@ -0,0 +1,37 @@
+class EvaluatorStatistics:
+    def __init__(self):
+        self._evaluations = 0
+        self._rejections = 0
+        self._total_seconds = 0.0
+        self._api_calls = 0
+
+    def record(self, evaluations: int, rejections: int, seconds: float, api_calls: int) -> None:
+        self._evaluations += evaluations
+        self._rejections += rejections
+        self._total_seconds += seconds
+        self._api_calls += api_calls
+
+    def get_evaluations(self) -> int:
+        return self._evaluations
+
+    def get_rejection_rate(self) -> float:
+        # add-one smoothing keeps an evaluator that has not rejected anything yet from looking free
+        return (self._rejections + 1) / (self._evaluations + 2)
+
+    def get_cost_per_evaluation(self, api_call_cost_seconds: float) -> float:
+        if not self._evaluations:
+            return 0.0
+
+        return (self._total_seconds + self._api_calls * api_call_cost_seconds) / self._evaluations
+
+    def get_ordering_score(self, api_call_cost_seconds: float) -> float:
+        # running conjunctive checks by ascending cost / rejection probability minimizes the expected cost per symbol
+        return self.get_cost_per_evaluation(api_call_cost_seconds) / self.get_rejection_rate()
+
+    def to_dict(self) -> dict:
+        return {
+            'evaluations': self._evaluations,
+            'rejections': self._rejections,
+            'total_seconds': self._total_seconds,
+            'api_calls': self._api_calls
+        }
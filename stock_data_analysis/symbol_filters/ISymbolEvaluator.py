@@ -1,7 +1,18 @@
 import abc
 
+from . import SymbolEvaluation
+
 
 class ISymbolEvaluator(abc.ABC):
     @abc.abstractmethod
     def evaluate(self, symbol: str) -> bool:
         pass
+
+    def evaluate_batch(self, symbols: [str]) -> [bool]:
+        return [self.evaluate(symbol) for symbol in symbols]
+
+    def evaluate_with_details(self, symbol: str) -> SymbolEvaluation:
+        return SymbolEvaluation(self.__class__.__name__, self.evaluate(symbol))
+
+    def evaluate_batch_with_details(self, symbols: [str]) -> [SymbolEvaluation]:
+        return [self.evaluate_with_details(symbol) for symbol in symbols]
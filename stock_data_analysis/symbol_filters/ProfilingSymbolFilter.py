@@ -0,0 +1,66 @@
+import cProfile
+import io
+import pstats
+import random
+import threading
+
+from . import SymbolEvaluation
+from . import SymbolFilter
+from ..utilities import Logger
+
+
+class ProfilingSymbolFilter:
+    def __init__(self, symbol_filter: SymbolFilter, sample_rate: float = 1.0, random_seed: int = None):
+        assert 0 < sample_rate <= 1
+        self._symbol_filter = symbol_filter
+        self._sample_rate = sample_rate
+        self._random = random.Random(random_seed)
+
+        self._profile = cProfile.Profile()
+        # only one profiler can be active per interpreter, so concurrent workers take turns being profiled
+        self._profile_lock = threading.Lock()
+        self._profiled_calls = 0
+        self._logger = Logger(self.__class__.__name__)
+
+    def __str__(self):
+        return str(self._symbol_filter)
+
+    def filter(self, symbol: str) -> bool:
+        return self._call_profiled(self._symbol_filter.filter, symbol)
+
+    def filter_with_details(self, symbol: str) -> (bool, [SymbolEvaluation]):
+        return self._call_profiled(self._symbol_filter.filter_with_details, symbol)
+
+    def filter_symbols(self, symbols: list[str]) -> list[str]:  # pylint: disable=unsubscriptable-object
+        return self._call_profiled(self._symbol_filter.filter_symbols, symbols)
+
+    def filter_symbols_with_details(self, symbols: [str]) -> [(bool, [SymbolEvaluation])]:
+        return self._call_profiled(self._symbol_filter.filter_symbols_with_details, symbols)
+
+    def get_profiled_calls(self) -> int:
+        return self._profiled_calls
+
+    def get_statistics_text(self, sort_key: str = 'cumulative', number_of_functions: int = 30) -> str:
+        statistics_stream = io.StringIO()
+        with self._profile_lock:
+            if self._profiled_calls:
+                pstats.Stats(self._profile, stream=statistics_stream).sort_stats(sort_key).print_stats(
+                    number_of_functions)
+
+        return statistics_stream.getvalue()
+
+    def dump_statistics(self, statistics_file_name: str) -> None:
+        with self._profile_lock:
+            self._profile.dump_stats(statistics_file_name)
+
+        self._logger.log_info('wrote profile of {} filter calls to {}', self._profiled_calls, statistics_file_name)
+
+    def _call_profiled(self, function, argument):
+        if self._random.random() >= self._sample_rate or not self._profile_lock.acquire(blocking=False):
+            return function(argument)
+
+        try:
+            self._profiled_calls += 1
+            return self._profile.runcall(function, argument)
+        finally:
+            self._profile_lock.release()
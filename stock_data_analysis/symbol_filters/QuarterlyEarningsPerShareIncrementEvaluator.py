@@ -1,6 +1,10 @@
 import math
 
+import numpy
+
+from . import EarningsPerShareMatrix
 from . import ISymbolEvaluator
+from . import SymbolEvaluation
 from ..data_sources import IDataSourceAdapter
 from ..utilities import Logger
 
@@ -31,29 +35,85 @@ class QuarterlyEarningsPerShareIncrementEvaluator(ISymbolEvaluator):
             self.__class__.__name__, self._data_source_adapter.__class__.__name__,
             self._quarterly_earnings_per_share_increment_threshold, self._number_of_quarters_to_check)
 
+    def get_number_of_periods_needed(self) -> int:
+        return self._number_of_quarters_needed
+
+    def evaluate_earnings_per_share_matrix(self, earnings_per_share_matrix: EarningsPerShareMatrix) -> numpy.ndarray:
+        earnings_per_share = earnings_per_share_matrix.get_earnings_per_share()
+        number_of_periods = earnings_per_share_matrix.get_number_of_periods()
+
+        evaluation_result = earnings_per_share_matrix.get_history_lengths() >= self._number_of_quarters_needed
+        if number_of_periods < self._number_of_quarters_needed:
+            return evaluation_result
+
+        current = earnings_per_share[:, number_of_periods - self._number_of_quarters_to_check:]
+        previous = earnings_per_share[:, number_of_periods - self._number_of_quarters_to_check -
+                                      QUARTERS_IN_A_YEAR:number_of_periods - QUARTERS_IN_A_YEAR]
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            growth = (current - previous) / previous
+
+        # negated comparison keeps the scalar path's handling of NaN growth
+        below_threshold = growth < self._quarterly_earnings_per_share_increment_threshold
+        evaluation_result &= numpy.all((previous != 0) & ~below_threshold, axis=1)
+
+        self._logger.log_info('{} approved {} of {} symbols', self, numpy.count_nonzero(evaluation_result),
+                              len(evaluation_result))
+        return evaluation_result
+
+    def evaluate_batch(self, symbols: [str]) -> [bool]:
+        earnings_per_share_by_symbol = self._data_source_adapter.get_quarterly_earnings_per_share_batch(
+            symbols, self._number_of_quarters_needed)
+        earnings_per_share_matrix = EarningsPerShareMatrix.from_earnings_per_share_series(
+            earnings_per_share_by_symbol, self._number_of_quarters_needed)
+
+        evaluation_results = dict(
+            zip(earnings_per_share_matrix.get_symbols(),
+                self.evaluate_earnings_per_share_matrix(earnings_per_share_matrix).tolist()))
+        return [evaluation_results[symbol] for symbol in symbols]
+
     def evaluate(self, symbol: str) -> bool:
+        return self.evaluate_with_details(symbol).passed
+
+    def evaluate_with_details(self, symbol: str) -> SymbolEvaluation:
         quarterly_earnings_per_share = self._data_source_adapter.get_quarterly_earnings_per_share(
             symbol, self._number_of_quarters_needed)
+        return self._evaluate_earnings_per_share(symbol, quarterly_earnings_per_share,
+                                                 self._data_source_adapter.get_last_used_data_source_name())
 
+    def evaluate_batch_with_details(self, symbols: [str]) -> [SymbolEvaluation]:
+        earnings_per_share_by_symbol = self._data_source_adapter.get_quarterly_earnings_per_share_batch(
+            symbols, self._number_of_quarters_needed)
+        data_source_name = self._data_source_adapter.get_last_used_data_source_name()
+
+        return [
+            self._evaluate_earnings_per_share(symbol, earnings_per_share_by_symbol[symbol], data_source_name)
+            for symbol in symbols
+        ]
+
+    def _evaluate_earnings_per_share(self, symbol: str, quarterly_earnings_per_share: [float],
+                                     data_source_name: str) -> SymbolEvaluation:
         if len(quarterly_earnings_per_share) < self._number_of_quarters_needed:
-            self._logger.log_info('{} disapproved symbol {} with only {} quarter earnings per share data points'.format(
-                str(self), symbol, len(quarterly_earnings_per_share)))
-            return False
+            self._logger.log_info('{} disapproved symbol {} with only {} quarter earnings per share data points', self,
+                                  symbol, len(quarterly_earnings_per_share))
+            return SymbolEvaluation(self.__class__.__name__, False, quarterly_earnings_per_share, [], data_source_name)
 
-        for i in range(0, self._number_of_quarters_to_check):
+        growth = []
+        for i in reversed(range(0, self._number_of_quarters_to_check)):
             current = quarterly_earnings_per_share[-1 - i]
             previous = quarterly_earnings_per_share[-1 - i - QUARTERS_IN_A_YEAR]
+            growth.append((current - previous) / previous if previous != 0 else None)
 
-            if previous == 0:
-                self._logger.log_info('{} disapproved symbol {} with 0 earnings per share in history'.format(
-                    str(self), symbol))
-                return False
-
-            if (current - previous) / previous < self._quarterly_earnings_per_share_increment_threshold:
-                self._logger.log_info(
-                    '{0} disapproved symbol {1} with growth ({2} - {3}) / {3} = {4} less than threshold'.format(
-                        str(self), symbol, current, previous, (current - previous) / previous))
-                return False
+        if any(i is None for i in growth):
+            self._logger.log_info('{} disapproved symbol {} with 0 earnings per share in history', self, symbol)
+            evaluation_result = False
+        elif any(i < self._quarterly_earnings_per_share_increment_threshold for i in growth):
+            self._logger.log_info('{} disapproved symbol {} with year over year growth {} less than threshold', self,
+                                  symbol, growth)
+            evaluation_result = False
+        else:
+            self._logger.log_info('{} approved symbol {}', self, symbol)
+            evaluation_result = True
 
-        self._logger.log_info('{} disapproved symbol {}'.format(str(self), symbol))
-        return True
+        return SymbolEvaluation(self.__class__.__name__, evaluation_result, quarterly_earnings_per_share, growth,
+                                data_source_name)
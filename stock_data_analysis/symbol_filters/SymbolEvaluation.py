@@ -0,0 +1,22 @@
+class SymbolEvaluation:
+    __slots__ = ('evaluator_name', 'passed', 'earnings_per_share', 'growth', 'data_source_name')
+
+    def __init__(self,
+                 evaluator_name: str,
+                 passed: bool,
+                 earnings_per_share: [float] = None,
+                 growth: [float] = None,
+                 data_source_name: str = None):
+        self.evaluator_name = evaluator_name
+        self.passed = passed
+        self.earnings_per_share = earnings_per_share if earnings_per_share is not None else []
+        # growth of periods with zero earnings per share in the preceding period is undefined and kept as None
+        self.growth = growth if growth is not None else []
+        self.data_source_name = data_source_name
+
+    def to_dict(self) -> dict:
+        return {i: getattr(self, i) for i in SymbolEvaluation.__slots__}
+
+    def __repr__(self):
+        return '{}[evaluator_name={}, passed={}, growth={}, data_source_name={}]'.format(
+            self.__class__.__name__, self.evaluator_name, self.passed, self.growth, self.data_source_name)
@@ -1,28 +1,144 @@
+import threading
+import time
+
+from . import EvaluatorStatistics
 from . import ISymbolEvaluator
+from . import SymbolEvaluation
+from ..utilities import Logger
+from ..utilities import MetricsRegistry
 
 
 class SymbolFilter:
-    def __init__(self, initial_filters: [ISymbolEvaluator]):
-        self._symbol_evaluators = initial_filters
+    # an Alpha Vantage call is worth 12 seconds of the 5 calls per minute quota
+    DEFAULT_API_CALL_COST_SECONDS = 12.0
+
+    def __init__(self,
+                 initial_filters: [ISymbolEvaluator],
+                 adaptive_ordering: bool = False,
+                 api_call_counter=None,
+                 api_call_cost_seconds: float = DEFAULT_API_CALL_COST_SECONDS,
+                 reordering_interval: int = 100,
+                 min_evaluations_before_reordering: int = 20):
+        self._symbol_evaluators = list(initial_filters)
+        self._evaluator_statistics = {id(i): EvaluatorStatistics() for i in self._symbol_evaluators}
+
+        self._adaptive_ordering = adaptive_ordering
+        self._api_call_counter = api_call_counter
+        self._api_call_cost_seconds = api_call_cost_seconds
+        self._reordering_interval = reordering_interval
+        self._min_evaluations_before_reordering = min_evaluations_before_reordering
+        self._evaluations_since_reordering = 0
+
+        self._lock = threading.Lock()
+        self._metrics_registry = MetricsRegistry.get_default()
+        self._logger = Logger(self.__class__.__name__)
+
+    def __str__(self):
+        # evaluation order does not change which symbols pass, so it is left out of the description
+        return '{}[{}]'.format(self.__class__.__name__, ', '.join(sorted(str(i) for i in self._symbol_evaluators)))
 
     def add_evaluator(self, evaluator: ISymbolEvaluator) -> None:
-        self._symbol_evaluators.append(evaluator)
+        with self._lock:
+            self._evaluator_statistics[id(evaluator)] = EvaluatorStatistics()
+            self._symbol_evaluators = self._symbol_evaluators + [evaluator]
+
+    def get_evaluators(self) -> [ISymbolEvaluator]:
+        return list(self._symbol_evaluators)
+
+    def get_evaluator_statistics(self) -> dict:
+        with self._lock:
+            return {str(i): self._evaluator_statistics[id(i)].to_dict() for i in self._symbol_evaluators}
 
     def filter_symbols(self, symbols: list[str]) -> list[str]:  # pylint: disable=unsubscriptable-object
-        filtered_symbols = []
+        filtered_symbols = list(symbols)
 
-        for symbol in symbols:
-            for evaluator in self._symbol_evaluators:
-                if not evaluator.evaluate(symbol):
-                    continue
+        for evaluator in self._symbol_evaluators:
+            if not filtered_symbols:
+                break
 
-            filtered_symbols.append(symbol)
+            evaluation_results = self._evaluate(evaluator, filtered_symbols)
+            filtered_symbols = [
+                symbol for symbol, evaluation_result in zip(filtered_symbols, evaluation_results) if evaluation_result
+            ]
 
         return filtered_symbols
 
+    def filter_symbols_with_details(self, symbols: [str]) -> [(bool, [SymbolEvaluation])]:
+        symbol_evaluations = {symbol: [] for symbol in symbols}
+        remaining_symbols = list(symbols)
+
+        for evaluator in self._symbol_evaluators:
+            if not remaining_symbols:
+                break
+
+            evaluations = self._evaluate(evaluator, remaining_symbols, with_details=True)
+            for symbol, symbol_evaluation in zip(remaining_symbols, evaluations):
+                symbol_evaluations[symbol].append(symbol_evaluation)
+            remaining_symbols = [symbol for symbol, i in zip(remaining_symbols, evaluations) if i.passed]
+
+        return [(all(i.passed for i in symbol_evaluations[symbol]), symbol_evaluations[symbol]) for symbol in symbols]
+
     def filter(self, symbol: str) -> bool:
         for evaluator in self._symbol_evaluators:
-            if not evaluator.evaluate(symbol):
+            if not self._evaluate(evaluator, [symbol])[0]:
                 return False
 
         return True
+
+    def filter_with_details(self, symbol: str) -> (bool, [SymbolEvaluation]):
+        symbol_evaluations = []
+        for evaluator in self._symbol_evaluators:
+            symbol_evaluation = self._evaluate(evaluator, [symbol], with_details=True)[0]
+            symbol_evaluations.append(symbol_evaluation)
+            if not symbol_evaluation.passed:
+                return False, symbol_evaluations
+
+        return True, symbol_evaluations
+
+    def _evaluate(self, evaluator: ISymbolEvaluator, symbols: [str], with_details: bool = False) -> list:
+        api_calls_before = self._api_call_counter() if self._api_call_counter else 0
+        start_time = time.perf_counter()
+
+        symbol_evaluations = None
+        if with_details:
+            symbol_evaluations = [evaluator.evaluate_with_details(symbols[0])] if len(symbols) == 1 else \
+                evaluator.evaluate_batch_with_details(symbols)
+            evaluation_results = [i.passed for i in symbol_evaluations]
+        elif len(symbols) == 1:
+            evaluation_results = [evaluator.evaluate(symbols[0])]
+        else:
+            evaluation_results = evaluator.evaluate_batch(symbols)
+
+        elapsed_seconds = time.perf_counter() - start_time
+        api_calls = self._api_call_counter() - api_calls_before if self._api_call_counter else 0
+        rejections = len(symbols) - sum(1 for i in evaluation_results if i)
+
+        evaluator_name = str(evaluator)
+        self._metrics_registry.observe('evaluator_seconds', elapsed_seconds, evaluator=evaluator_name)
+        self._metrics_registry.increment('evaluator_evaluations_total', len(symbols), evaluator=evaluator_name)
+        self._metrics_registry.increment('evaluator_rejections_total', rejections, evaluator=evaluator_name)
+        self._metrics_registry.increment('evaluator_api_calls_total', api_calls, evaluator=evaluator_name)
+
+        with self._lock:
+            self._evaluator_statistics[id(evaluator)].record(len(symbols), rejections, elapsed_seconds, api_calls)
+
+            self._evaluations_since_reordering += len(symbols)
+            if self._adaptive_ordering and self._evaluations_since_reordering >= self._reordering_interval:
+                self._evaluations_since_reordering = 0
+                self._reorder_evaluators()
+
+        return symbol_evaluations if with_details else evaluation_results
+
+    def _reorder_evaluators(self) -> None:
+        if any(self._evaluator_statistics[id(i)].get_evaluations() < self._min_evaluations_before_reordering
+               for i in self._symbol_evaluators):
+            return
+
+        reordered_evaluators = sorted(
+            self._symbol_evaluators,
+            key=lambda i: self._evaluator_statistics[id(i)].get_ordering_score(self._api_call_cost_seconds))
+
+        if reordered_evaluators != self._symbol_evaluators:
+            self._logger.log_info('reordered evaluators to {}', [str(i) for i in reordered_evaluators])
+            # readers iterate over the previous list, so it is replaced rather than sorted in place
+            self._symbol_evaluators = reordered_evaluators
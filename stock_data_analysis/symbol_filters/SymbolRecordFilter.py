@@ -0,0 +1,34 @@
+from ..data_sources import SymbolRecord
+from ..utilities import Logger
+
+
+class SymbolRecordFilter:
+    def __init__(self, allowed_types: [str] = None, allowed_exchanges: [str] = None, enabled_only: bool = True):
+        self._allowed_types = set(allowed_types) if allowed_types else None
+        self._allowed_exchanges = set(allowed_exchanges) if allowed_exchanges else None
+        self._enabled_only = enabled_only
+        self._accepted_symbols = 0
+        self._rejected_symbols = 0
+        self._logger = Logger(self.__class__.__name__)
+
+    def __str__(self):
+        return '{}[allowed_types={}, allowed_exchanges={}, enabled_only={}]'.format(
+            self.__class__.__name__, sorted(self._allowed_types) if self._allowed_types else None,
+            sorted(self._allowed_exchanges) if self._allowed_exchanges else None, self._enabled_only)
+
+    def accepts(self, symbol_record: SymbolRecord) -> bool:
+        return (not self._enabled_only or symbol_record.is_enabled) and \
+            (self._allowed_types is None or symbol_record.type in self._allowed_types) and \
+            (self._allowed_exchanges is None or symbol_record.exchange in self._allowed_exchanges)
+
+    def filter_symbols(self, symbol_records):
+        for symbol_record in symbol_records:
+            if self.accepts(symbol_record):
+                self._accepted_symbols += 1
+                yield symbol_record.symbol
+            else:
+                self._rejected_symbols += 1
+                self._logger.log_debug('{} rejected {}', self, symbol_record)
+
+    def get_statistics(self) -> dict:
+        return {'accepted_symbols': self._accepted_symbols, 'rejected_symbols': self._rejected_symbols}
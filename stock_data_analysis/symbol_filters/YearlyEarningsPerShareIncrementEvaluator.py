@@ -1,5 +1,9 @@
-from .ISymbolEvaluator import ISymbolEvaluator
-from ..data_sources.IDataSourceAdapter import IDataSourceAdapter
+import numpy
+
+from . import EarningsPerShareMatrix
+from . import ISymbolEvaluator
+from . import SymbolEvaluation
+from ..data_sources import IDataSourceAdapter
 from ..utilities import Logger
 
 
@@ -23,22 +27,76 @@ class YearlyEarningsPerShareIncrementEvaluator(ISymbolEvaluator):
             self.__class__.__name__, self._data_source_adapter.__class__.__name__,
             self._yearly_earnings_per_share_increment_threshold, self._number_of_years_to_check)
 
+    def get_number_of_periods_needed(self) -> int:
+        return self._number_of_years_to_check
+
+    def evaluate_earnings_per_share_matrix(self, earnings_per_share_matrix: EarningsPerShareMatrix) -> numpy.ndarray:
+        earnings_per_share = earnings_per_share_matrix.get_earnings_per_share()
+        number_of_periods = earnings_per_share_matrix.get_number_of_periods()
+
+        evaluation_result = earnings_per_share_matrix.get_history_lengths() >= self._number_of_years_to_check
+        if number_of_periods < self._number_of_years_to_check:
+            return evaluation_result
+
+        window = earnings_per_share[:, number_of_periods - self._number_of_years_to_check:]
+        previous = window[:, :-1]
+        current = window[:, 1:]
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            growth = (current - previous) / previous
+
+        evaluation_result &= numpy.all((previous != 0) & (growth > self._yearly_earnings_per_share_increment_threshold),
+                                       axis=1)
+
+        self._logger.log_info('{} approved {} of {} symbols', self, numpy.count_nonzero(evaluation_result),
+                              len(evaluation_result))
+        return evaluation_result
+
+    def evaluate_batch(self, symbols: [str]) -> [bool]:
+        earnings_per_share_by_symbol = self._data_source_adapter.get_yearly_earnings_per_share_batch(
+            symbols, self._number_of_years_to_check)
+        earnings_per_share_matrix = EarningsPerShareMatrix.from_earnings_per_share_series(
+            earnings_per_share_by_symbol, self._number_of_years_to_check)
+
+        evaluation_results = dict(
+            zip(earnings_per_share_matrix.get_symbols(),
+                self.evaluate_earnings_per_share_matrix(earnings_per_share_matrix).tolist()))
+        return [evaluation_results[symbol] for symbol in symbols]
+
     def evaluate(self, symbol: str) -> bool:
+        return self.evaluate_with_details(symbol).passed
+
+    def evaluate_with_details(self, symbol: str) -> SymbolEvaluation:
         yearly_earnings_per_share = self._data_source_adapter.get_yearly_earnings_per_share(
             symbol, self._number_of_years_to_check)
+        return self._evaluate_earnings_per_share(symbol, yearly_earnings_per_share,
+                                                 self._data_source_adapter.get_last_used_data_source_name())
+
+    def evaluate_batch_with_details(self, symbols: [str]) -> [SymbolEvaluation]:
+        earnings_per_share_by_symbol = self._data_source_adapter.get_yearly_earnings_per_share_batch(
+            symbols, self._number_of_years_to_check)
+        data_source_name = self._data_source_adapter.get_last_used_data_source_name()
+
+        return [
+            self._evaluate_earnings_per_share(symbol, earnings_per_share_by_symbol[symbol], data_source_name)
+            for symbol in symbols
+        ]
 
+    def _evaluate_earnings_per_share(self, symbol: str, yearly_earnings_per_share: [float],
+                                     data_source_name: str) -> SymbolEvaluation:
         if len(yearly_earnings_per_share) < self._number_of_years_to_check:
-            self._logger.log_info('{} disapproved symbol {} with only {} yearly earnings per share data points'.format(
-                str(self), symbol, len(yearly_earnings_per_share)))
-            return False
-
-        evaluation_result = all(
-            previous_quarterly_earnings_per_share != 0 and
-            (current_quarterly_earnings_per_share - previous_quarterly_earnings_per_share) /
-            previous_quarterly_earnings_per_share > self._yearly_earnings_per_share_increment_threshold
-            for previous_quarterly_earnings_per_share, current_quarterly_earnings_per_share in zip(
-                yearly_earnings_per_share, yearly_earnings_per_share[1:]))
-
-        self._logger.log_info('{} symbol {} with yearly earnings per share history {} evaluated to {}'.format(
-            str(self), symbol, yearly_earnings_per_share, evaluation_result))
-        return evaluation_result
+            self._logger.log_info('{} disapproved symbol {} with only {} yearly earnings per share data points', self,
+                                  symbol, len(yearly_earnings_per_share))
+            return SymbolEvaluation(self.__class__.__name__, False, yearly_earnings_per_share, [], data_source_name)
+
+        growth = []
+        for previous, current in zip(yearly_earnings_per_share, yearly_earnings_per_share[1:]):
+            growth.append((current - previous) / previous if previous != 0 else None)
+
+        evaluation_result = all(i is not None and i > self._yearly_earnings_per_share_increment_threshold
+                                for i in growth)
+
+        self._logger.log_info('{} symbol {} with yearly earnings per share history {} evaluated to {}', self, symbol,
+                              yearly_earnings_per_share, evaluation_result)
+        return SymbolEvaluation(self.__class__.__name__, evaluation_result, yearly_earnings_per_share, growth,
+                                data_source_name)
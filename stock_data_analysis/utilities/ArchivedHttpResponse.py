@@ -0,0 +1,17 @@
+class ArchivedHttpResponse:
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+        self.headers = {}
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode('utf-8')
+
+    def iter_content(self, chunk_size: int = 1):
+        content = self.content
+        for i in range(0, len(content), chunk_size):
+            yield content[i:i + chunk_size]
+
+    def close(self) -> None:
+        pass
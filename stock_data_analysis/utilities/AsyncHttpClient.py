@@ -0,0 +1,21 @@
+import asyncio
+import concurrent.futures
+
+from . import HttpClient
+
+
+class AsyncHttpClient:
+    def __init__(self, http_client: HttpClient = None, max_concurrent_requests: int = HttpClient.DEFAULT_POOL_SIZE):
+        # requests has no event loop support, so blocking calls share the pooled session from a bounded executor
+        self._http_client = http_client if http_client else HttpClient.get_default()
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent_requests,
+                                                               thread_name_prefix='async-http-client')
+
+    async def get(self, url: str, stream: bool = False):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._http_client.get, url, stream)
+
+    def get_connection_statistics(self) -> dict:
+        return self._http_client.get_connection_statistics()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,85 @@
+import threading
+import urllib.parse
+
+import requests
+import requests.adapters
+
+
+class HttpClient:
+    DEFAULT_CONNECT_TIMEOUT_SECONDS = 10
+    DEFAULT_READ_TIMEOUT_SECONDS = 60
+    DEFAULT_POOL_SIZE = 10
+
+    _default_http_client = None
+    _default_http_client_lock = threading.Lock()
+
+    class _PoolTrackingHttpAdapter(requests.adapters.HTTPAdapter):
+        def __init__(self, pool_size: int):
+            super().__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.connection_pools = {}
+            self._lock = threading.Lock()
+
+        def get_connection_with_tls_context(self, request, *args, **kwargs):  # pylint: disable=arguments-differ
+            connection_pool = super().get_connection_with_tls_context(request, *args, **kwargs)
+            self._track_connection_pool(request.url, connection_pool)
+            return connection_pool
+
+        def get_connection(self, url, *args, **kwargs):  # pylint: disable=arguments-differ
+            connection_pool = super().get_connection(url, *args, **kwargs)
+            self._track_connection_pool(url, connection_pool)
+            return connection_pool
+
+        def _track_connection_pool(self, url: str, connection_pool) -> None:
+            host = urllib.parse.urlsplit(url).netloc
+            with self._lock:
+                self.connection_pools[host] = connection_pool
+
+    def __init__(self,
+                 connect_timeout_seconds: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+                 read_timeout_seconds: float = DEFAULT_READ_TIMEOUT_SECONDS,
+                 pool_size: int = DEFAULT_POOL_SIZE):
+        assert connect_timeout_seconds > 0 and read_timeout_seconds > 0
+        self._timeout = (connect_timeout_seconds, read_timeout_seconds)
+
+        self._thread_local = threading.local()
+
+        self._http_adapter = HttpClient._PoolTrackingHttpAdapter(pool_size)
+        self._session = requests.Session()
+        self._session.headers.update({'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'})
+        self._session.mount('https://', self._http_adapter)
+        self._session.mount('http://', self._http_adapter)
+
+    @classmethod
+    def get_default(cls):
+        with cls._default_http_client_lock:
+            if cls._default_http_client is None:
+                cls._default_http_client = cls()
+
+            return cls._default_http_client
+
+    @classmethod
+    def set_default(cls, http_client) -> None:
+        with cls._default_http_client_lock:
+            cls._default_http_client = http_client
+
+    def get(self, url: str, stream: bool = False) -> requests.Response:
+        self._thread_local.request_count = self.get_thread_request_count() + 1
+        return self._session.get(url, timeout=self._timeout, stream=stream)
+
+    def get_thread_request_count(self) -> int:
+        return getattr(self._thread_local, 'request_count', 0)
+
+    def get_connection_statistics(self) -> dict:
+        connection_statistics = {}
+
+        for host, connection_pool in list(self._http_adapter.connection_pools.items()):
+            connection_statistics[host] = {
+                'requests': connection_pool.num_requests,
+                'new_connections': connection_pool.num_connections,
+                'reused_connections': max(0, connection_pool.num_requests - connection_pool.num_connections)
+            }
+
+        return connection_statistics
+
+    def close(self) -> None:
+        self._session.close()
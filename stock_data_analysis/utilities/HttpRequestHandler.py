@@ -1,10 +1,31 @@
 import requests
 
+from . import HttpClient
 from . import RetryExecutor
+from ..exceptions import ServerErrorException
+from ..exceptions import TooManyRequestsException
 
 
 class HttpRequestHandler:
+    MAX_TRANSIENT_ERROR_RETRIES = 5
+
+    @staticmethod
+    def get(url: str, http_client: HttpClient = None, stream: bool = False):
+        # retries are left to execute_with_retry around the whole API call, so that they do not multiply across layers
+        http_client = http_client if http_client else HttpClient.get_default()
+        return http_client.get(url, stream)
+
     @staticmethod
-    def get(url: str):
-        return RetryExecutor().execute_with_exponential_backoff_retry(
-            lambda: requests.get(url), lambda exception: isinstance(exception, requests.exceptions.ConnectionError))
+    def is_transient_error(exception: Exception) -> bool:
+        return isinstance(exception,
+                          (requests.exceptions.ConnectionError, requests.exceptions.Timeout, ServerErrorException))
+
+    @staticmethod
+    def execute_with_retry(execute_api_call, max_throttle_retries: int, deadline_seconds: float = None):
+        retry_executor = RetryExecutor(max_retries=HttpRequestHandler.MAX_TRANSIENT_ERROR_RETRIES,
+                                       max_retries_by_exception_type={TooManyRequestsException: max_throttle_retries},
+                                       deadline_seconds=deadline_seconds)
+
+        return retry_executor.execute_with_exponential_backoff_retry(
+            execute_api_call, lambda exception: isinstance(exception, TooManyRequestsException) or
+            HttpRequestHandler.is_transient_error(exception))
@@ -0,0 +1,60 @@
+import codecs
+import json
+
+
+class JsonArrayStreamParser:
+    WHITESPACE_AND_SEPARATORS = ' \t\r\n,'
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+
+    def parse(self, chunks):
+        chunk_iterator = iter(chunks)
+        # multi-byte characters may be split across chunks
+        utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+        buffer = ''
+        position = 0
+        array_started = False
+        more_chunks = True
+
+        while True:
+            while position < len(buffer) and buffer[position] in JsonArrayStreamParser.WHITESPACE_AND_SEPARATORS:
+                position += 1
+
+            if position < len(buffer):
+                if not array_started:
+                    if buffer[position] != '[':
+                        raise ValueError('expected a JSON array but found {}'.format(buffer[position:position + 20]))
+                    array_started = True
+                    position += 1
+                    continue
+
+                if buffer[position] == ']':
+                    return
+
+                try:
+                    element, end_position = self._decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    element, end_position = None, None
+
+                # a scalar ending with the buffer may continue in the next chunk
+                if end_position is not None and (end_position < len(buffer) or isinstance(element, (dict, list))
+                                                 or not more_chunks):
+                    yield element
+                    position = end_position
+                    continue
+
+                if not more_chunks:
+                    raise ValueError('truncated JSON array element {}'.format(buffer[position:position + 20]))
+            elif not more_chunks:
+                raise ValueError('JSON array is not terminated')
+
+            # drop parsed elements so that the buffer only holds the element being read
+            buffer = buffer[position:]
+            position = 0
+
+            chunk = next(chunk_iterator, None)
+            if chunk is None:
+                more_chunks = False
+            else:
+                buffer += utf8_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
@@ -1,48 +1,150 @@
+import atexit
 import logging
-import datetime
+import logging.handlers
 import os
+import queue
 import sys
+import threading
 
-log_folder_name = 'logs'
-if not os.path.exists(log_folder_name):
-    os.mkdir(log_folder_name)
+from . import JsonLogFormatter
 
-log_file_name = os.path.join(log_folder_name, '{}.log'.format(datetime.datetime.now().strftime('%Y-%m-%dT%H-%M-%S')))
-if not os.path.exists(log_file_name):
-    with open(log_file_name, 'w'):
-        pass
-
-# set up root logger, as other loggers automatically inherit from it
-# https://stackoverflow.com/questions/47422689/python-logging-how-to-inherit-root-logger-level-handler
 LOG_FORMATTER = logging.Formatter('%(asctime)s %(name)s: %(message)s')
-
-root_logger = logging.getLogger()
-file_handler = logging.FileHandler(log_file_name)
-file_handler.setFormatter(LOG_FORMATTER)
-root_logger.addHandler(file_handler)
+IMMUTABLE_ARG_TYPES = (str, bytes, int, float, complex, bool, type(None))
 
 
 class Logger:
+    class _BraceFormattedMessage:
+        __slots__ = ('_message', '_args')
+
+        def __init__(self, message: str, args: tuple):
+            self._message = message
+            self._args = args
+
+        def __str__(self):
+            return self._message.format(*self._args)
+
+        def has_immutable_args(self) -> bool:
+            return all(Logger._BraceFormattedMessage._is_immutable(i) for i in self._args)
+
+        @staticmethod
+        def _is_immutable(arg) -> bool:
+            if isinstance(arg, (tuple, frozenset)):
+                return all(Logger._BraceFormattedMessage._is_immutable(i) for i in arg)
+
+            return isinstance(arg, IMMUTABLE_ARG_TYPES)
+
+    class _DeferredFormattingQueueHandler(logging.handlers.QueueHandler):
+        def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+            # leave message formatting to the background writer instead of the thread that logged it, unless an
+            # argument may still change, such as a dict or a list that the logging thread keeps updating
+            if isinstance(record.msg, Logger._BraceFormattedMessage) and not record.msg.has_immutable_args():
+                record.msg = str(record.msg)
+
+            return record
+
+    class _ConsoleLoggerFilter(logging.Filter):
+        def __init__(self):
+            super().__init__()
+            self.excluded_logger_names = set()
+
+        def filter(self, record: logging.LogRecord) -> bool:
+            return record.name not in self.excluded_logger_names
+
+    _configuration_lock = threading.Lock()
+    _queue_listener = None
+    _queue_handler = None
+    _log_file_name = None
+    _console_logger_filter = _ConsoleLoggerFilter()
+
     def __init__(self, logger_name: str, print_to_console: bool = True):
         self._logger = logging.getLogger(logger_name)
-        self._logger.setLevel(logging.DEBUG)
 
-        if print_to_console:
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setFormatter(LOG_FORMATTER)
-            self._logger.addHandler(console_handler)
+        if not print_to_console:
+            Logger._console_logger_filter.excluded_logger_names.add(logger_name)
+
+    @classmethod
+    def configure(cls,
+                  log_file_name: str = None,
+                  print_to_console: bool = True,
+                  level: int = logging.DEBUG,
+                  json_format: bool = False) -> None:
+        with cls._configuration_lock:
+            cls._stop_queue_listener()
+            cls._log_file_name = log_file_name
+
+            formatter = JsonLogFormatter() if json_format else LOG_FORMATTER
+            handlers = []
+
+            if log_file_name:
+                log_folder_name = os.path.dirname(log_file_name)
+                if log_folder_name and not os.path.exists(log_folder_name):
+                    os.makedirs(log_folder_name)
+
+                file_handler = logging.FileHandler(log_file_name)
+                file_handler.setFormatter(formatter)
+                handlers.append(file_handler)
+
+            if print_to_console:
+                console_handler = logging.StreamHandler(sys.stdout)
+                console_handler.setFormatter(formatter)
+                console_handler.addFilter(cls._console_logger_filter)
+                handlers.append(console_handler)
+
+            # handlers are registered once on the root logger, other loggers inherit them
+            # https://stackoverflow.com/questions/47422689/python-logging-how-to-inherit-root-logger-level-handler
+            cls._queue_handler = Logger._DeferredFormattingQueueHandler(queue.SimpleQueue())
+            cls._queue_listener = logging.handlers.QueueListener(cls._queue_handler.queue,
+                                                                 *handlers,
+                                                                 respect_handler_level=True)
+
+            root_logger = logging.getLogger()
+            root_logger.setLevel(level)
+            root_logger.addHandler(cls._queue_handler)
+            cls._queue_listener.start()
+
+    @classmethod
+    def get_log_file_name(cls) -> str:
+        return cls._log_file_name
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls._configuration_lock:
+            cls._stop_queue_listener()
+
+    @classmethod
+    def _stop_queue_listener(cls) -> None:
+        if cls._queue_listener is None:
+            return
+
+        logging.getLogger().removeHandler(cls._queue_handler)
+        cls._queue_listener.stop()
+        for handler in cls._queue_listener.handlers:
+            handler.close()
+
+        cls._queue_listener = None
+        cls._queue_handler = None
+
+    def is_enabled_for(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level)
+
+    def log_debug(self, message: str, *args) -> None:
+        self._log(logging.DEBUG, message, args)
+
+    def log_info(self, message: str, *args) -> None:
+        self._log(logging.INFO, message, args)
+
+    def log_warning(self, message: str, *args) -> None:
+        self._log(logging.WARNING, message, args)
 
-    def log_debug(self, message: str) -> None:
-        self._logger.debug(message)
+    def log_error(self, message: str, *args) -> None:
+        self._log(logging.ERROR, message, args)
 
-    def log_info(self, message: str) -> None:
-        self._logger.info(message)
+    def log_critical(self, message: str, *args) -> None:
+        self._log(logging.CRITICAL, message, args)
 
-    def log_warning(self, message: str) -> None:
-        self._logger.warning(message)
+    def _log(self, level: int, message: str, args: tuple) -> None:
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, Logger._BraceFormattedMessage(message, args) if args else message)
 
-    def log_error(self, message: str) -> None:
-        self._logger.error(message)
 
-    def log_critical(self, message: str) -> None:
-        self._logger.critical(message)
+atexit.register(Logger.shutdown)
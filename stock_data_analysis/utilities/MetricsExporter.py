@@ -0,0 +1,105 @@
+import http.server
+import json
+import os
+import threading
+
+from . import Logger
+from . import MetricsRegistry
+
+
+class MetricsExporter:
+    METRICS_PATH = '/metrics'
+    PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    class _RequestHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):  # pylint: disable=invalid-name
+            if self.path.split('?')[0] != MetricsExporter.METRICS_PATH:
+                self.send_error(404)
+                return
+
+            body = self.server.metrics_registry.to_prometheus_text().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', MetricsExporter.PROMETHEUS_CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            pass
+
+    def __init__(self,
+                 metrics_registry: MetricsRegistry = None,
+                 prometheus_file_name: str = None,
+                 port: int = None,
+                 host: str = '127.0.0.1',
+                 write_interval_seconds: float = 15):
+        assert write_interval_seconds > 0
+        self._metrics_registry = metrics_registry if metrics_registry else MetricsRegistry.get_default()
+        self._prometheus_file_name = prometheus_file_name
+        self._write_interval_seconds = write_interval_seconds
+
+        self._http_server = None
+        if port is not None:
+            self._http_server = http.server.ThreadingHTTPServer((host, port), MetricsExporter._RequestHandler)
+            self._http_server.daemon_threads = True
+            self._http_server.metrics_registry = self._metrics_registry
+
+        self._threads = []
+        self._stopped = threading.Event()
+        self._logger = Logger(self.__class__.__name__)
+
+    def get_uri(self) -> str:
+        if self._http_server is None:
+            return None
+
+        host, port = self._http_server.server_address[:2]
+        return 'http://{}:{}{}'.format(host, port, MetricsExporter.METRICS_PATH)
+
+    def start(self) -> None:
+        if self._http_server is not None:
+            self._start_thread(self._http_server.serve_forever, 'metrics-http-server')
+            self._logger.log_info('serving metrics at {}', self.get_uri())
+
+        if self._prometheus_file_name is not None:
+            self._start_thread(self._write_periodically, 'metrics-file-writer')
+            self._logger.log_info('writing metrics to {} every {} seconds', self._prometheus_file_name,
+                                  self._write_interval_seconds)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+
+        for thread in self._threads:
+            thread.join()
+
+        if self._prometheus_file_name is not None:
+            self.write_prometheus_file()
+
+    def write_prometheus_file(self) -> None:
+        MetricsExporter._write_atomically(self._prometheus_file_name, self._metrics_registry.to_prometheus_text())
+
+    def write_json_summary(self, json_file_name: str) -> None:
+        MetricsExporter._write_atomically(json_file_name, json.dumps(self._metrics_registry.to_dict(), indent=2))
+
+    def _start_thread(self, target, name: str) -> None:
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _write_periodically(self) -> None:
+        while not self._stopped.wait(self._write_interval_seconds):
+            try:
+                self.write_prometheus_file()
+            except OSError as exception:
+                self._logger.log_warning('unable to write metrics to {}: {}', self._prometheus_file_name, exception)
+
+    @staticmethod
+    def _write_atomically(file_name: str, text: str) -> None:
+        # scrapers such as the node exporter textfile collector must never read a partially written file
+        temporary_file_name = '{}.tmp'.format(file_name)
+        with open(temporary_file_name, 'w') as temporary_file:
+            temporary_file.write(text)
+
+        os.replace(temporary_file_name, file_name)
@@ -0,0 +1,174 @@
+import bisect
+import contextlib
+import math
+import threading
+import time
+
+
+class MetricsRegistry:
+    NAME_PREFIX = 'stock_data_analysis_'
+    # API calls range from cached milliseconds to retries backing off for minutes
+    DEFAULT_BUCKETS_SECONDS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+    _default_metrics_registry = None
+    _default_metrics_registry_lock = threading.Lock()
+
+    class _Histogram:
+        def __init__(self, buckets: tuple):
+            self.buckets = buckets
+            self.bucket_counts = [0] * (len(buckets) + 1)
+            self.count = 0
+            self.sum = 0.0
+            self.min = math.inf
+            self.max = -math.inf
+
+        def observe(self, value: float) -> None:
+            self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+
+        def get_quantile(self, quantile: float) -> float:
+            # upper bound of the bucket holding the quantile, the observed maximum for the overflow bucket
+            rank = quantile * self.count
+            cumulative_count = 0
+            for bucket, bucket_count in zip(self.buckets, self.bucket_counts):
+                cumulative_count += bucket_count
+                if cumulative_count >= rank:
+                    return min(bucket, self.max)
+
+            return self.max
+
+        def to_dict(self) -> dict:
+            return {
+                'count': self.count,
+                'sum': self.sum,
+                'mean': self.sum / self.count if self.count else 0.0,
+                'min': self.min if self.count else 0.0,
+                'max': self.max if self.count else 0.0,
+                'p50': self.get_quantile(0.5),
+                'p90': self.get_quantile(0.9),
+                'p99': self.get_quantile(0.99)
+            }
+
+    def __init__(self, buckets_seconds: tuple = DEFAULT_BUCKETS_SECONDS):
+        assert list(buckets_seconds) == sorted(buckets_seconds)
+        self._buckets_seconds = tuple(buckets_seconds)
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_default(cls):
+        with cls._default_metrics_registry_lock:
+            if cls._default_metrics_registry is None:
+                cls._default_metrics_registry = cls()
+
+            return cls._default_metrics_registry
+
+    @classmethod
+    def set_default(cls, metrics_registry) -> None:
+        with cls._default_metrics_registry_lock:
+            cls._default_metrics_registry = metrics_registry
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        key = MetricsRegistry._create_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        key = MetricsRegistry._create_key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = MetricsRegistry._create_key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = MetricsRegistry._Histogram(self._buckets_seconds)
+
+            histogram.observe(value)
+
+    @contextlib.contextmanager
+    def time(self, name: str, **labels):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start_time, **labels)
+
+    def get_counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(MetricsRegistry._create_key(name, labels), 0)
+
+    def get_histogram(self, name: str, **labels) -> dict:
+        with self._lock:
+            histogram = self._histograms.get(MetricsRegistry._create_key(name, labels))
+            return histogram.to_dict() if histogram else None
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                'counters': [MetricsRegistry._to_sample(key, value) for key, value in sorted(self._counters.items())],
+                'gauges': [MetricsRegistry._to_sample(key, value) for key, value in sorted(self._gauges.items())],
+                'histograms': [
+                    MetricsRegistry._to_sample(key, histogram.to_dict())
+                    for key, histogram in sorted(self._histograms.items(), key=lambda i: i[0])
+                ]
+            }
+
+    def to_prometheus_text(self) -> str:
+        lines = []
+        with self._lock:
+            MetricsRegistry._append_samples(lines, 'counter', sorted(self._counters.items()))
+            MetricsRegistry._append_samples(lines, 'gauge', sorted(self._gauges.items()))
+
+            previous_name = None
+            for (name, labels), histogram in sorted(self._histograms.items(), key=lambda i: i[0]):
+                prefixed_name = MetricsRegistry.NAME_PREFIX + name
+                if name != previous_name:
+                    lines.append('# TYPE {} histogram'.format(prefixed_name))
+                    previous_name = name
+
+                cumulative_count = 0
+                for bucket, bucket_count in zip(histogram.buckets + ('+Inf', ), histogram.bucket_counts):
+                    cumulative_count += bucket_count
+                    bucket_labels = MetricsRegistry._format_labels(labels + (('le', str(bucket)), ))
+                    lines.append('{}_bucket{} {}'.format(prefixed_name, bucket_labels, cumulative_count))
+                lines.append('{}_sum{} {}'.format(prefixed_name, MetricsRegistry._format_labels(labels), histogram.sum))
+                lines.append('{}_count{} {}'.format(prefixed_name, MetricsRegistry._format_labels(labels),
+                                                    histogram.count))
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _create_key(name: str, labels: dict) -> tuple:
+        return name, tuple(sorted((label_name, str(label_value)) for label_name, label_value in labels.items()))
+
+    @staticmethod
+    def _to_sample(key: tuple, value) -> dict:
+        name, labels = key
+        return {'name': name, 'labels': dict(labels), 'value': value}
+
+    @staticmethod
+    def _append_samples(lines: [str], metric_type: str, samples: list) -> None:
+        previous_name = None
+        for (name, labels), value in samples:
+            prefixed_name = MetricsRegistry.NAME_PREFIX + name
+            if name != previous_name:
+                lines.append('# TYPE {} {}'.format(prefixed_name, metric_type))
+                previous_name = name
+
+            lines.append('{}{} {}'.format(prefixed_name, MetricsRegistry._format_labels(labels), value))
+
+    @staticmethod
+    def _format_labels(labels: tuple) -> str:
+        if not labels:
+            return ''
+
+        return '{{{}}}'.format(','.join('{}="{}"'.format(
+            label_name, label_value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+                                        for label_name, label_value in labels))
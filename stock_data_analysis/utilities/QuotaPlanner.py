@@ -0,0 +1,29 @@
+import math
+
+
+class QuotaPlanner:
+    def __init__(self, calls_per_day: int, calls_per_symbol: int = 1, reserved_calls_per_day: int = 0):
+        assert calls_per_symbol > 0
+        self._calls_per_symbol = calls_per_symbol
+
+        assert 0 <= reserved_calls_per_day < calls_per_day
+        self._symbols_per_day = (calls_per_day - reserved_calls_per_day) // calls_per_symbol
+        assert self._symbols_per_day > 0
+
+    def get_symbols_per_day(self) -> int:
+        return self._symbols_per_day
+
+    def get_number_of_days(self, symbols: [str]) -> int:
+        return math.ceil(len(set(symbols)) / self._symbols_per_day)
+
+    def plan(self, symbols: [str]) -> [[str]]:
+        # sort so that every run of the same universe assigns each symbol to the same day
+        ordered_symbols = sorted(set(symbols))
+        return [
+            ordered_symbols[i:i + self._symbols_per_day]
+            for i in range(0, len(ordered_symbols), self._symbols_per_day)
+        ]
+
+    def get_symbols_for_day(self, symbols: [str], day: int) -> [str]:
+        daily_schedule = self.plan(symbols)
+        return daily_schedule[day] if day < len(daily_schedule) else []
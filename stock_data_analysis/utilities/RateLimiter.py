@@ -0,0 +1,123 @@
+import datetime
+import threading
+import time
+
+from . import Logger
+from ..exceptions import DailyQuotaExceededException
+
+
+class RateLimiter:
+    _shared_rate_limiters = {}
+    _shared_rate_limiters_lock = threading.Lock()
+
+    def __init__(self,
+                 calls_per_minute: float = None,
+                 calls_per_day: int = None,
+                 burst_size: int = 1,
+                 quota_store=None,
+                 quota_key: str = None):
+        # without a per minute limit only the daily budget is enforced
+        assert calls_per_minute is None or calls_per_minute > 0
+        self._refill_rate_per_second = calls_per_minute / 60 if calls_per_minute else None
+
+        assert calls_per_day is None or calls_per_day > 0
+        self._calls_per_day = calls_per_day
+
+        # a bucket holding a full minute of calls lets through twice the limit within a rolling minute
+        assert burst_size >= 1 and (calls_per_minute is None or burst_size <= calls_per_minute)
+        self._burst_size = burst_size
+
+        self._available_tokens = float(burst_size)
+        self._last_refill_time = time.monotonic()
+        # a quota store keeps the calls of the day across runs, so that a restarted scan does not spend the budget again
+        assert quota_store is None or quota_key
+        self._quota_store = quota_store
+        self._quota_key = quota_key
+        self._current_day = datetime.date.today()
+        self._calls_today = quota_store.get_calls(quota_key, self._current_day.isoformat()) if quota_store else 0
+        self._total_calls = 0
+        self._total_wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+        self._logger = Logger(self.__class__.__name__)
+
+    @classmethod
+    def get_shared(cls,
+                   key: str,
+                   calls_per_minute: float = None,
+                   calls_per_day: int = None,
+                   burst_size: int = 1,
+                   quota_store=None):
+        with cls._shared_rate_limiters_lock:
+            if key not in cls._shared_rate_limiters:
+                cls._shared_rate_limiters[key] = cls(calls_per_minute, calls_per_day, burst_size, quota_store, key)
+
+            return cls._shared_rate_limiters[key]
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                wait_seconds = self._try_acquire_locked()
+                if wait_seconds == 0:
+                    return
+
+                self._total_wait_seconds += wait_seconds
+
+            self._logger.log_debug('waiting {:.2f} seconds for rate limit', wait_seconds)
+            time.sleep(wait_seconds)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            return self._try_acquire_locked() == 0
+
+    def get_available_tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._available_tokens
+
+    def get_remaining_daily_calls(self):
+        with self._lock:
+            self._reset_daily_budget_on_new_day()
+            return None if self._calls_per_day is None else self._calls_per_day - self._calls_today
+
+    def get_statistics(self) -> dict:
+        with self._lock:
+            return {
+                'total_calls': self._total_calls,
+                'calls_today': self._calls_today,
+                'total_wait_seconds': self._total_wait_seconds
+            }
+
+    def _try_acquire_locked(self) -> float:
+        self._reset_daily_budget_on_new_day()
+        if self._calls_per_day is not None and self._calls_today >= self._calls_per_day:
+            raise DailyQuotaExceededException()
+
+        self._refill()
+        if self._available_tokens < 1:
+            return (1 - self._available_tokens) / self._refill_rate_per_second
+
+        self._available_tokens -= 1
+        self._total_calls += 1
+        if self._quota_store is not None:
+            self._calls_today = self._quota_store.add_call(self._quota_key, self._current_day.isoformat())
+        else:
+            self._calls_today += 1
+        return 0
+
+    def _refill(self) -> None:
+        if self._refill_rate_per_second is None:
+            self._available_tokens = float(self._burst_size)
+            return
+
+        now = time.monotonic()
+        refilled_tokens = (now - self._last_refill_time) * self._refill_rate_per_second
+        self._available_tokens = min(self._burst_size, self._available_tokens + refilled_tokens)
+        self._last_refill_time = now
+
+    def _reset_daily_budget_on_new_day(self) -> None:
+        today = datetime.date.today()
+        if today != self._current_day:
+            self._current_day = today
+            self._calls_today = self._quota_store.get_calls(self._quota_key, today.isoformat()) \
+                if self._quota_store else 0
@@ -0,0 +1,25 @@
+from . import HttpClient
+from . import ResponseArchive
+
+
+class RecordingHttpClient:
+    def __init__(self, http_client: HttpClient, response_archive: ResponseArchive):
+        self._http_client = http_client
+        self._response_archive = response_archive
+
+    def get(self, url: str, stream: bool = False):
+        http_response = self._http_client.get(url, stream)
+
+        # reading the body here keeps it available to streaming callers through iter_content
+        self._response_archive.record(url, http_response.status_code, http_response.text)
+        return http_response
+
+    def get_thread_request_count(self) -> int:
+        return self._http_client.get_thread_request_count()
+
+    def get_connection_statistics(self) -> dict:
+        return self._http_client.get_connection_statistics()
+
+    def close(self) -> None:
+        self._http_client.close()
+        self._response_archive.close()
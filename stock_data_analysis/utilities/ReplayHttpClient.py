@@ -0,0 +1,44 @@
+import threading
+
+from . import ArchivedHttpResponse
+from . import Logger
+from . import ResponseArchive
+
+
+class ReplayHttpClient:
+    MISSING_RESPONSE_STATUS_CODE = 400
+
+    def __init__(self, response_archive: ResponseArchive):
+        self._response_archive = response_archive
+        self._thread_local = threading.local()
+        self._replayed_responses = 0
+        self._missing_responses = 0
+        self._lock = threading.Lock()
+        self._logger = Logger(self.__class__.__name__)
+
+    def get(self, url: str, stream: bool = False) -> ArchivedHttpResponse:  # pylint: disable=unused-argument
+        self._thread_local.request_count = self.get_thread_request_count() + 1
+        archived_response = self._response_archive.get(url)
+
+        with self._lock:
+            if archived_response is None:
+                self._missing_responses += 1
+            else:
+                self._replayed_responses += 1
+
+        if archived_response is None:
+            self._logger.log_warning('no archived response for request {}',
+                                     ResponseArchive.create_request_key(url))
+            return ArchivedHttpResponse(ReplayHttpClient.MISSING_RESPONSE_STATUS_CODE, '')
+
+        return ArchivedHttpResponse(*archived_response)
+
+    def get_thread_request_count(self) -> int:
+        return getattr(self._thread_local, 'request_count', 0)
+
+    def get_connection_statistics(self) -> dict:
+        with self._lock:
+            return {'replayed_responses': self._replayed_responses, 'missing_responses': self._missing_responses}
+
+    def close(self) -> None:
+        self._response_archive.close()
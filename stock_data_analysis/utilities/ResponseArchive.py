@@ -0,0 +1,66 @@
+import gzip
+import json
+import os
+import threading
+import urllib.parse
+
+
+class ResponseArchive:
+    SECRET_QUERY_PARAMETERS = {'token', 'apikey'}
+
+    def __init__(self, archive_file_name: str, writable: bool = False):
+        self._archive_file_name = archive_file_name
+        self._responses = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(archive_file_name):
+            # gzip members appended by separate recording sessions are read back as one stream
+            with gzip.open(archive_file_name, 'rt', encoding='utf-8') as archive_file:
+                for line in archive_file:
+                    entry = json.loads(line)
+                    self._responses[entry['key']] = (entry['status_code'], entry['body'])
+
+        self._archive_file = None
+        if writable:
+            archive_folder_name = os.path.dirname(archive_file_name)
+            if archive_folder_name and not os.path.exists(archive_folder_name):
+                os.makedirs(archive_folder_name)
+            self._archive_file = gzip.open(archive_file_name, 'at', encoding='utf-8')
+
+    @staticmethod
+    def create_request_key(url: str) -> str:
+        # keys leave out host and credentials so that an archive replays against any server and token
+        split_url = urllib.parse.urlsplit(url)
+        query_parameters = sorted((name, value)
+                                  for name, value in urllib.parse.parse_qsl(split_url.query, keep_blank_values=True)
+                                  if name.lower() not in ResponseArchive.SECRET_QUERY_PARAMETERS)
+
+        path = split_url.path
+        return '{}?{}'.format(path, urllib.parse.urlencode(query_parameters)) if query_parameters else path
+
+    def record(self, url: str, status_code: int, body: str) -> None:
+        assert self._archive_file is not None
+        request_key = ResponseArchive.create_request_key(url)
+
+        with self._lock:
+            self._responses[request_key] = (status_code, body)
+            self._archive_file.write(
+                json.dumps({
+                    'key': request_key,
+                    'status_code': status_code,
+                    'body': body
+                }, separators=(',', ':')) + '\n')
+
+    def get(self, url: str) -> (int, str):
+        with self._lock:
+            return self._responses.get(ResponseArchive.create_request_key(url))
+
+    def get_request_keys(self) -> [str]:
+        with self._lock:
+            return list(self._responses)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._archive_file is not None:
+                self._archive_file.close()
+                self._archive_file = None
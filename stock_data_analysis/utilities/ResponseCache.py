@@ -0,0 +1,156 @@
+import collections
+import itertools
+import threading
+import time
+
+from . import Logger
+
+
+class ResponseCache:
+    class _InFlightFetch:
+        def __init__(self):
+            self.completed = threading.Event()
+            self.entry = None
+            self.exception = None
+
+    def __init__(self,
+                 time_to_live_seconds: float = 24 * 60 * 60,
+                 max_entries: int = 1024,
+                 persistent_store=None):
+        assert time_to_live_seconds > 0
+        self._time_to_live_seconds = time_to_live_seconds
+
+        assert max_entries > 0
+        self._max_entries = max_entries
+
+        self._persistent_store = persistent_store
+        self._entries = collections.OrderedDict()
+        self._versions = itertools.count()
+        self._in_flight_fetches = {}
+        self._lock = threading.Lock()
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._coalesced_fetches = 0
+        self._evictions = 0
+
+        self._logger = Logger(self.__class__.__name__)
+
+    def get_or_fetch(self, key: str, fetch):
+        return self.get_or_fetch_entry(key, fetch)[0]
+
+    def get_or_fetch_entry(self, key: str, fetch) -> tuple:
+        # every stored value gets a new version, so callers can keep what they derive from a value until it changes
+        with self._lock:
+            entry = self._get_from_memory(key)
+            if entry is not None:
+                self._memory_hits += 1
+                return entry
+
+            in_flight_fetch = self._in_flight_fetches.get(key)
+            is_fetch_owner = in_flight_fetch is None
+            if is_fetch_owner:
+                in_flight_fetch = ResponseCache._InFlightFetch()
+                self._in_flight_fetches[key] = in_flight_fetch
+            else:
+                self._coalesced_fetches += 1
+
+        if not is_fetch_owner:
+            in_flight_fetch.completed.wait()
+            if in_flight_fetch.exception is not None:
+                raise in_flight_fetch.exception
+
+            return in_flight_fetch.entry
+
+        try:
+            entry = self._get_from_persistent_store(key)
+            if entry is None:
+                value = fetch()
+                entry = (value, self._put(key, value, time.time(), persist=True))
+            in_flight_fetch.entry = entry
+            return entry
+        except Exception as exception:  # pylint: disable=broad-except
+            in_flight_fetch.exception = exception
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight_fetches[key]
+            in_flight_fetch.completed.set()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._get_from_memory(key)
+            if entry is not None:
+                self._memory_hits += 1
+                return entry[0]
+
+        entry = self._get_from_persistent_store(key)
+        return entry[0] if entry is not None else None
+
+    def put(self, key: str, value) -> None:
+        self._put(key, value, time.time(), persist=True)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+        if self._persistent_store is not None:
+            self._persistent_store.delete(key)
+
+    def get_statistics(self) -> dict:
+        with self._lock:
+            return {
+                'memory_hits': self._memory_hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'coalesced_fetches': self._coalesced_fetches,
+                'evictions': self._evictions,
+                'entries': len(self._entries)
+            }
+
+    def close(self) -> None:
+        if self._persistent_store is not None:
+            self._persistent_store.delete_expired(time.time() - self._time_to_live_seconds)
+            self._persistent_store.close()
+
+    def _get_from_memory(self, key: str) -> tuple:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, stored_at, version = entry
+        if time.time() - stored_at > self._time_to_live_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value, version
+
+    def _get_from_persistent_store(self, key: str) -> tuple:
+        if self._persistent_store is not None:
+            entry = self._persistent_store.get(key)
+            if entry is not None and time.time() - entry[1] <= self._time_to_live_seconds:
+                with self._lock:
+                    self._disk_hits += 1
+                return entry[0], self._put(key, entry[0], entry[1], persist=False)
+
+        with self._lock:
+            self._misses += 1
+
+        self._logger.log_debug('cache miss for key {}', key)
+        return None
+
+    def _put(self, key: str, value, stored_at: float, persist: bool) -> int:
+        with self._lock:
+            version = next(self._versions)
+            self._entries[key] = (value, stored_at, version)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        if persist and self._persistent_store is not None:
+            self._persistent_store.put(key, value, stored_at)
+        return version
@@ -1,25 +1,122 @@
+import asyncio
+import email.utils
+import random
 import time
 
 from . import Logger
+from . import MetricsRegistry
 
 
 class RetryExecutor:
-    def __init__(self, initial_backoff_seconds: int = 1, max_retries: int = 5):
-        self._backoff_seconds = initial_backoff_seconds
-        self._remaining_retries = max_retries
+    DEFAULT_MAX_BACKOFF_SECONDS = 300
+    DEFAULT_JITTER_RATIO = 0.5
+
+    def __init__(self,
+                 initial_backoff_seconds: float = 1,
+                 max_retries: int = 5,
+                 max_retries_by_exception_type: dict = None,
+                 deadline_seconds: float = None,
+                 max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
+                 jitter_ratio: float = DEFAULT_JITTER_RATIO,
+                 random_seed: int = None):
+        assert initial_backoff_seconds >= 0 and max_retries >= 0
+        self._initial_backoff_seconds = initial_backoff_seconds
+        self._max_retries = max_retries
+        # lets a caller retry transient errors more often than for example throttling
+        self._max_retries_by_exception_type = max_retries_by_exception_type if max_retries_by_exception_type else {}
+
+        assert deadline_seconds is None or deadline_seconds > 0
+        self._deadline_seconds = deadline_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+
+        assert 0 <= jitter_ratio <= 1
+        self._jitter_ratio = jitter_ratio
+        self._random = random.Random(random_seed)
+
+        self._metrics_registry = MetricsRegistry.get_default()
         self._logger = Logger(self.__class__.__name__)
 
-    def execute_with_exponential_backoff_retry(self, task, can_retry):
+    @staticmethod
+    def parse_retry_after(retry_after: str) -> float:
+        if not retry_after:
+            return None
+
         try:
-            return task()
-        except Exception as exception:  # pylint: disable=broad-except
-            if not can_retry(exception) or not self._remaining_retries:
-                self._logger.log_info('Unable to retry {}'.format(task))
-                raise exception
-
-            time.sleep(self._backoff_seconds)
-            self._backoff_seconds *= 2
-            self._remaining_retries -= 1
-
-            self._logger.log_info('retrying {} with {} seconds backoff'.format(task, self._backoff_seconds))
-            return self.execute_with_exponential_backoff_retry(task, can_retry)
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def get_backoff_seconds(self, retry_number: int, exception: Exception = None) -> float:
+        backoff_seconds = min(self._max_backoff_seconds, self._initial_backoff_seconds * 2**retry_number)
+        # spreads the retries of workers that failed together instead of sending them back at the same instant
+        backoff_seconds -= self._random.uniform(0, backoff_seconds * self._jitter_ratio)
+
+        # the server knows best when it accepts calls again
+        retry_after_seconds = getattr(exception, 'retry_after_seconds', None)
+        if retry_after_seconds is not None:
+            backoff_seconds = max(
+                backoff_seconds,
+                retry_after_seconds + self._random.uniform(0, self._initial_backoff_seconds * self._jitter_ratio))
+
+        return backoff_seconds
+
+    def execute_with_exponential_backoff_retry(self, task, can_retry):
+        deadline = time.monotonic() + self._deadline_seconds if self._deadline_seconds is not None else None
+        retry_counts = {}
+
+        while True:
+            try:
+                return task()
+            except Exception as exception:  # pylint: disable=broad-except
+                backoff_seconds = self._get_retry_backoff_seconds(task, exception, can_retry, retry_counts, deadline)
+                if backoff_seconds is None:
+                    raise
+
+            time.sleep(backoff_seconds)
+
+    async def execute_with_exponential_backoff_retry_async(self, task, can_retry):
+        deadline = time.monotonic() + self._deadline_seconds if self._deadline_seconds is not None else None
+        retry_counts = {}
+
+        while True:
+            try:
+                return await task()
+            except Exception as exception:  # pylint: disable=broad-except
+                backoff_seconds = self._get_retry_backoff_seconds(task, exception, can_retry, retry_counts, deadline)
+                if backoff_seconds is None:
+                    raise
+
+            await asyncio.sleep(backoff_seconds)
+
+    def _get_retry_backoff_seconds(self, task, exception: Exception, can_retry, retry_counts: dict,
+                                   deadline: float) -> float:
+        exception_name = type(exception).__name__
+        if not can_retry(exception):
+            self._logger.log_info('Unable to retry {}', task)
+            return None
+
+        retry_count_key, max_retries = next(
+            ((exception_type, max_retries)
+             for exception_type, max_retries in self._max_retries_by_exception_type.items()
+             if isinstance(exception, exception_type)), (None, self._max_retries))
+        retry_number = sum(retry_counts.values())
+        backoff_seconds = self.get_backoff_seconds(retry_number, exception)
+
+        if retry_counts.get(retry_count_key, 0) >= max_retries or \
+                (deadline is not None and time.monotonic() + backoff_seconds > deadline):
+            self._metrics_registry.increment('retries_exhausted_total', exception=exception_name)
+            self._logger.log_info('Unable to retry {} after {} retries', task, retry_number)
+            return None
+
+        retry_counts[retry_count_key] = retry_counts.get(retry_count_key, 0) + 1
+        self._metrics_registry.increment('retries_total', exception=exception_name)
+        self._metrics_registry.increment('retry_backoff_seconds_total', backoff_seconds, exception=exception_name)
+        self._logger.log_info('retrying {} with {:.2f} seconds backoff', task, backoff_seconds)
+        return backoff_seconds
@@ -0,0 +1,48 @@
+import hashlib
+import os
+import sqlite3
+import threading
+
+
+class SqliteQuotaStore:
+    def __init__(self, database_file_name: str):
+        self._lock = threading.Lock()
+
+        database_folder_name = os.path.dirname(database_file_name)
+        if database_folder_name and not os.path.exists(database_folder_name):
+            os.makedirs(database_folder_name)
+
+        # the table may share its file with the response store, a connection of its own keeps their locks apart
+        self._connection = sqlite3.connect(database_file_name, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS daily_calls '
+                                 '(key TEXT PRIMARY KEY, day TEXT NOT NULL, calls INTEGER NOT NULL)')
+        self._connection.commit()
+
+    def get_calls(self, key: str, day: str) -> int:
+        with self._lock:
+            row = self._connection.execute('SELECT calls FROM daily_calls WHERE key = ? AND day = ?',
+                                           (SqliteQuotaStore._hash_key(key), day)).fetchone()
+
+        return row[0] if row else 0
+
+    def add_call(self, key: str, day: str) -> int:
+        # the count is incremented in the database, so processes sharing a token also share its budget
+        key = SqliteQuotaStore._hash_key(key)
+        with self._lock:
+            self._connection.execute(
+                'INSERT INTO daily_calls (key, day, calls) VALUES (?, ?, 1) ON CONFLICT (key) DO UPDATE SET '
+                'calls = CASE WHEN day = excluded.day THEN calls + 1 ELSE 1 END, day = excluded.day', (key, day))
+            calls = self._connection.execute('SELECT calls FROM daily_calls WHERE key = ?', (key, )).fetchone()[0]
+            self._connection.commit()
+
+        return calls
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _hash_key(key: str) -> str:
+        # keys name API tokens, which are not written to disk
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
@@ -0,0 +1,85 @@
+import os
+import pathlib
+import sqlite3
+import threading
+
+
+class SqliteResponseStore:
+    EVICTION_CHECK_INTERVAL = 100
+
+    def __init__(self, database_file_name: str, max_entries: int = 100000, read_only: bool = False):
+        assert max_entries > 0
+        self._max_entries = max_entries
+        self._read_only = read_only
+        self._puts_since_eviction_check = 0
+        self._lock = threading.Lock()
+
+        # readers such as the backtest must leave the cache of the scans as it is, so no schema or eviction is applied
+        if read_only:
+            self._connection = sqlite3.connect('{}?mode=ro'.format(pathlib.Path(database_file_name).resolve().as_uri()),
+                                               uri=True,
+                                               check_same_thread=False)
+            return
+
+        database_folder_name = os.path.dirname(database_file_name)
+        if database_folder_name and not os.path.exists(database_folder_name):
+            os.makedirs(database_folder_name)
+
+        self._connection = sqlite3.connect(database_file_name, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS responses '
+                                 '(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)')
+        self._connection.commit()
+
+    def get(self, key: str):
+        with self._lock:
+            row = self._connection.execute('SELECT value, stored_at FROM responses WHERE key = ?', (key, )).fetchone()
+
+        return row
+
+    def put(self, key: str, value: str, stored_at: float) -> None:
+        assert not self._read_only
+        with self._lock:
+            self._connection.execute('INSERT OR REPLACE INTO responses (key, value, stored_at) VALUES (?, ?, ?)',
+                                     (key, value, stored_at))
+
+            self._puts_since_eviction_check += 1
+            if self._puts_since_eviction_check >= SqliteResponseStore.EVICTION_CHECK_INTERVAL:
+                self._puts_since_eviction_check = 0
+                self._evict_oldest_entries()
+
+            self._connection.commit()
+
+    def delete(self, key: str) -> None:
+        assert not self._read_only
+        with self._lock:
+            self._connection.execute('DELETE FROM responses WHERE key = ?', (key, ))
+            self._connection.commit()
+
+    def delete_expired(self, oldest_stored_at: float) -> int:
+        assert not self._read_only
+        with self._lock:
+            deleted_rows = self._connection.execute('DELETE FROM responses WHERE stored_at < ?',
+                                                    (oldest_stored_at, )).rowcount
+            self._connection.commit()
+
+        return deleted_rows
+
+    def items(self):
+        with self._lock:
+            rows = self._connection.execute('SELECT key, value, stored_at FROM responses').fetchall()
+
+        return rows
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._read_only:
+                self._evict_oldest_entries()
+                self._connection.commit()
+            self._connection.close()
+
+    def _evict_oldest_entries(self) -> None:
+        self._connection.execute(
+            'DELETE FROM responses WHERE key NOT IN (SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)',
+            (self._max_entries, ))
@@ -0,0 +1,59 @@
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import unittest
+
+REPOSITORY_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+class BacktestTest(unittest.TestCase):
+    def test_backtest_should_leave_response_cache_unchanged(self):
+        quarter_ends = [('03-31', '04-28'), ('06-30', '07-28'), ('09-30', '10-28'), ('12-31', '01-28')]
+        earnings_response = json.dumps({
+            'annualEarnings': [{
+                'fiscalDateEnding': '{}-12-31'.format(year),
+                'reportedEPS': str(year - 2014)
+            } for year in range(2015, 2021)],
+            'quarterlyEarnings': [{
+                'fiscalDateEnding': '{}-{}'.format(year, period_end),
+                'reportedDate': '{}-{}'.format(year + 1 if period_end == '12-31' else year, reported_date),
+                'reportedEPS': str((year - 2014) * 4 + i)
+            } for year in range(2018, 2021) for i, (period_end, reported_date) in enumerate(quarter_ends)]
+        })
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            # a cache without the WAL journal or the stored_at index, which opening it for writing would add
+            response_cache_file_name = os.path.join(temporary_directory, 'responses.sqlite3')
+            connection = sqlite3.connect(response_cache_file_name)
+            connection.execute('CREATE TABLE responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                               'stored_at REAL NOT NULL)')
+            connection.execute('INSERT INTO responses VALUES (?, ?, ?)',
+                               ('AlphaVantageApi:EARNINGS:APPL', earnings_response, 0.0))
+            connection.commit()
+            connection.close()
+            with open(response_cache_file_name, 'rb') as response_cache_file:
+                response_cache_bytes = response_cache_file.read()
+
+            completed_process = subprocess.run([
+                sys.executable,
+                os.path.join(REPOSITORY_DIRECTORY, 'backtest.py'), response_cache_file_name, '--start-date',
+                '2020-06-30', '--end-date', '2020-12-31'
+            ],
+                                               cwd=temporary_directory,
+                                               stdout=subprocess.PIPE,
+                                               stderr=subprocess.PIPE,
+                                               check=True)
+
+            self.assertEqual([json.loads(i)['as_of_date'] for i in completed_process.stdout.splitlines()],
+                             ['2020-06-30', '2020-09-30', '2020-12-31'])
+            self.assertIn(b'loaded 1 symbols', completed_process.stderr)
+            with open(response_cache_file_name, 'rb') as response_cache_file:
+                self.assertEqual(response_cache_file.read(), response_cache_bytes)
+            self.assertEqual(sorted(os.listdir(temporary_directory)), ['responses.sqlite3'])
+
+
+if __name__ == '__main__':
+    unittest.main()
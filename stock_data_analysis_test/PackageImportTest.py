@@ -0,0 +1,89 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+REPOSITORY_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+IMPORT_SCRIPT = '''
+import json
+import sys
+import time
+
+start_time = time.perf_counter()
+import stock_data_analysis
+from stock_data_analysis.utilities import Logger
+import_seconds = time.perf_counter() - start_time
+
+Logger('PackageImportTest').log_info('logged before logging is configured')
+print(json.dumps({
+    'import_seconds': import_seconds,
+    'loaded_modules': sorted(i for i in ('requests', 'numpy', 'stock_data_analysis.data_sources') if i in sys.modules)
+}))
+'''
+
+CONCURRENT_IMPORT_SCRIPT = '''
+import importlib
+import json
+import threading
+
+# a submodule imported on its own must not leave the module where the package exports its class
+importlib.import_module('stock_data_analysis.scanning.ScanResult')
+import stock_data_analysis.scanning
+imported_objects = [stock_data_analysis.scanning.ScanResult]
+
+barrier = threading.Barrier(8)
+
+
+def import_classes():
+    barrier.wait()
+    from stock_data_analysis.data_sources import EarningsRecord
+    from stock_data_analysis.symbol_filters import SymbolFilter
+    from stock_data_analysis.utilities import RateLimiter
+    imported_objects.extend([EarningsRecord, SymbolFilter, RateLimiter])
+
+
+threads = [threading.Thread(target=import_classes) for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(json.dumps(sorted(set(type(i).__name__ for i in imported_objects))))
+'''
+
+
+class PackageImportTest(unittest.TestCase):
+    # eagerly importing every subpackage with requests and numpy took about 300 ms
+    MAX_IMPORT_SECONDS = 0.1
+
+    def run_import_script(self, working_directory: str) -> dict:
+        completed_process = subprocess.run([sys.executable, '-c', IMPORT_SCRIPT],
+                                           cwd=working_directory,
+                                           env=dict(os.environ, PYTHONPATH=REPOSITORY_DIRECTORY),
+                                           stdout=subprocess.PIPE,
+                                           check=True)
+        return json.loads(completed_process.stdout)
+
+    def test_import_should_be_lazy_and_leave_file_system_untouched(self):
+        with tempfile.TemporaryDirectory() as working_directory:
+            import_results = [self.run_import_script(working_directory) for _ in range(3)]
+
+            self.assertEqual(os.listdir(working_directory), [])
+
+        self.assertEqual(import_results[0]['loaded_modules'], [])
+        # the fastest of a few runs keeps a busy machine from failing the check
+        self.assertLess(min(i['import_seconds'] for i in import_results), PackageImportTest.MAX_IMPORT_SECONDS)
+
+    def test_import_should_bind_exported_classes_when_submodules_are_imported_concurrently(self):
+        for _ in range(3):
+            completed_process = subprocess.run([sys.executable, '-c', CONCURRENT_IMPORT_SCRIPT],
+                                               env=dict(os.environ, PYTHONPATH=REPOSITORY_DIRECTORY),
+                                               stdout=subprocess.PIPE,
+                                               check=True)
+            self.assertEqual(json.loads(completed_process.stdout), ['type'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class AlphaVantageApiTest(unittest.TestCase):
+    @staticmethod
+    def create_alpha_vantage_api(status_code: int, response: str, response_cache):
+        http_client = mock.Mock(stock_data_analysis.utilities.HttpClient)
+        http_client.get = mock.Mock(
+            return_value=stock_data_analysis.utilities.ArchivedHttpResponse(status_code, response))
+        # a deadline shorter than the first backoff turns retries off
+        return stock_data_analysis.data_sources.AlphaVantageApi(
+            'secret',
+            response_cache=response_cache,
+            rate_limiter=stock_data_analysis.utilities.RateLimiter(),
+            http_client=http_client,
+            retry_deadline_seconds=0.001)
+
+    def test_alpha_vantage_api_should_raise_error_responses_without_caching_them(self):
+        error_responses = [
+            (500, '', stock_data_analysis.exceptions.ServerErrorException),
+            (404, '', stock_data_analysis.exceptions.BadRequestException),
+            (200, json.dumps({'Error Message': 'Invalid API call.'}),
+             stock_data_analysis.exceptions.BadRequestException),
+            (200, json.dumps({'Information': 'Thank you for using Alpha Vantage! Our standard API rate limit is 25 '
+                                             'requests per day.'}),
+             stock_data_analysis.exceptions.DailyQuotaExceededException)
+        ]
+
+        for status_code, response, exception_type in error_responses:
+            response_cache = stock_data_analysis.utilities.ResponseCache()
+            alpha_vantage_api = self.create_alpha_vantage_api(status_code, response, response_cache)
+
+            self.assertRaises(exception_type, alpha_vantage_api.get_earnings_record, 'APPL')
+            self.assertIsNone(response_cache.get('AlphaVantageApi:EARNINGS:APPL'), status_code)
+
+    def test_alpha_vantage_api_should_cache_earnings_response(self):
+        response = json.dumps({'symbol': 'APPL', 'annualEarnings': [], 'quarterlyEarnings': []})
+        response_cache = stock_data_analysis.utilities.ResponseCache()
+        alpha_vantage_api = self.create_alpha_vantage_api(200, response, response_cache)
+
+        alpha_vantage_api.get_earnings_record('APPL')
+        self.assertEqual(response_cache.get('AlphaVantageApi:EARNINGS:APPL'), response)
+
+    def test_alpha_vantage_api_should_parse_earnings_record_again_when_cached_response_changes(self):
+        response_cache = stock_data_analysis.utilities.ResponseCache()
+        alpha_vantage_api = self.create_alpha_vantage_api(
+            200, json.dumps({'quarterlyEarnings': [{
+                'fiscalDateEnding': '2020-12-31',
+                'reportedEPS': '1'
+            }]}), response_cache)
+
+        earnings_record = alpha_vantage_api.get_earnings_record('APPL')
+        self.assertIs(alpha_vantage_api.get_earnings_record('APPL'), earnings_record)
+
+        response_cache.put('AlphaVantageApi:EARNINGS:APPL',
+                           json.dumps({'quarterlyEarnings': [{
+                               'fiscalDateEnding': '2021-03-31',
+                               'reportedEPS': '2'
+                           }]}))
+        self.assertEqual(alpha_vantage_api.get_earnings_record('APPL').get_quarterly_earnings_per_share(1), [2.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
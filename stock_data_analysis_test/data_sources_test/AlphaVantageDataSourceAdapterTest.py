@@ -0,0 +1,80 @@
+import json
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class AlphaVantageDataSourceAdapterTest(unittest.TestCase):
+    def test_alpha_vantage_data_source_adapter_should_return_most_recent_periods_oldest_first(self):
+        stub_http_client = mock.Mock(stock_data_analysis.utilities.HttpClient)
+        stub_http_client.get = mock.Mock(return_value=mock.Mock(status_code=200,
+                                                                text=json.dumps({
+                                                                    'quarterlyEarnings': [{
+                                                                        'fiscalDateEnding': '2021-03-31',
+                                                                        'reportedDate': '2021-04-28',
+                                                                        'reportedEPS': '3'
+                                                                    }, {
+                                                                        'fiscalDateEnding': '2020-12-31',
+                                                                        'reportedEPS': '2'
+                                                                    }, {
+                                                                        'fiscalDateEnding': '2020-09-30',
+                                                                        'reportedEPS': '1'
+                                                                    }]
+                                                                })))
+        alpha_vantage_api = stock_data_analysis.data_sources.AlphaVantageApi(
+            response_cache=stock_data_analysis.utilities.ResponseCache(),
+            rate_limiter=stock_data_analysis.utilities.RateLimiter(),
+            http_client=stub_http_client)
+        alpha_vantage_data_source_adapter = stock_data_analysis.data_sources.AlphaVantageDataSourceAdapter(
+            alpha_vantage_api)
+
+        self.assertEqual(alpha_vantage_data_source_adapter.get_quarterly_earnings_per_share('APPL', 2), [2.0, 3.0])
+        self.assertEqual(alpha_vantage_data_source_adapter.get_yearly_earnings_per_share('APPL', 2), [])
+        self.assertEqual(alpha_vantage_data_source_adapter.get_latest_earnings_report_dates('APPL'),
+                         ('2021-03-31', '2021-04-28'))
+        self.assertIs(alpha_vantage_api.get_earnings_record('APPL'), alpha_vantage_api.get_earnings_record('APPL'))
+        stub_http_client.get.assert_called_once()
+
+    def test_earnings_record_should_return_empty_series_when_periods_lack_earnings(self):
+        earnings_record = stock_data_analysis.data_sources.EarningsRecord.from_alpha_vantage_response(
+            json.dumps({
+                'annualEarnings': [{
+                    'fiscalDateEnding': '2020-12-31',
+                    'reportedEPS': '2'
+                }, {
+                    'fiscalDateEnding': '2019-12-31',
+                    'reportedEPS': 'None'
+                }, {
+                    'fiscalDateEnding': '2018-12-31',
+                    'reportedEPS': '1'
+                }]
+            }))
+
+        self.assertEqual(earnings_record.get_yearly_earnings_per_share(1), [2.0])
+        self.assertEqual(earnings_record.get_yearly_earnings_per_share(2), [])
+        self.assertEqual(earnings_record.get_quarterly_earnings_per_share(2), [])
+        self.assertIsNone(earnings_record.get_latest_quarterly_report_dates())
+
+    def test_alpha_vantage_data_source_adapter_should_keep_most_recent_years_in_any_listed_order(self):
+        stub_http_client = mock.Mock(stock_data_analysis.utilities.HttpClient)
+        stub_http_client.get = mock.Mock(return_value=mock.Mock(
+            status_code=200,
+            text=json.dumps({
+                'annualEarnings': [{
+                    'fiscalDateEnding': '{}-12-31'.format(year),
+                    'reportedEPS': str(year - 2016)
+                } for year in (2020, 2018, 2019, 2017)]
+            })))
+        alpha_vantage_data_source_adapter = stock_data_analysis.data_sources.AlphaVantageDataSourceAdapter(
+            stock_data_analysis.data_sources.AlphaVantageApi(rate_limiter=stock_data_analysis.utilities.RateLimiter(),
+                                                             http_client=stub_http_client))
+
+        # slicing the listed order used to drop the most recent years
+        self.assertEqual(alpha_vantage_data_source_adapter.get_yearly_earnings_per_share('APPL', 3), [2.0, 3.0, 4.0])
+        self.assertEqual(alpha_vantage_data_source_adapter.get_yearly_earnings_per_share('APPL', 4),
+                         [1.0, 2.0, 3.0, 4.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import json
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class EarningsPerShareIndexTest(unittest.TestCase):
+    QUARTERLY_EARNINGS_PER_SHARE = {
+        # year over year growth of 100%, 100% and 50% in the last three quarters
+        'APPL': [1.0, 1.0, 1.0, 1.0, 1.5, 2.0, 2.0, 1.5],
+        # growth of 100% in the oldest three comparable quarters only
+        'MSFT': [1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 2.0, 1.0],
+        'TSLA': [0.0, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 2.0]
+    }
+
+    def setUp(self):
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._earnings_per_share_index = stock_data_analysis.data_sources.EarningsPerShareIndex(
+            os.path.join(self._temporary_directory.name, 'index', 'earnings.db'))
+
+        for symbol, earnings_per_share in EarningsPerShareIndexTest.QUARTERLY_EARNINGS_PER_SHARE.items():
+            self._earnings_per_share_index.put(symbol, 'quarterly', earnings_per_share)
+
+    def tearDown(self):
+        self._earnings_per_share_index.close()
+        self._temporary_directory.cleanup()
+
+    def test_find_growth_streaks_should_match_consecutive_periods_above_threshold(self):
+        self.assertEqual(self._earnings_per_share_index.find_growth_streaks('quarterly', 0.3, 3), ['APPL', 'TSLA'])
+        self.assertEqual(self._earnings_per_share_index.find_growth_streaks('quarterly', 0.6, 3), ['TSLA'])
+        self.assertEqual(self._earnings_per_share_index.find_growth_streaks('quarterly', 0.6, 3, False),
+                         ['MSFT', 'TSLA'])
+        self.assertEqual(self._earnings_per_share_index.get_growth('TSLA', 'quarterly', 4), [None, 1.0, 1.0, 1.0])
+
+    def test_evaluators_should_run_against_index(self):
+        index_data_source_adapter = stock_data_analysis.data_sources.EarningsPerShareIndexDataSourceAdapter(
+            self._earnings_per_share_index)
+        symbol_filter = stock_data_analysis.symbol_filters.SymbolFilter([
+            stock_data_analysis.symbol_filters.QuarterlyEarningsPerShareIncrementEvaluator(
+                index_data_source_adapter, 0.3)
+        ])
+
+        self.assertEqual(symbol_filter.filter_symbols(index_data_source_adapter.get_all_symbols()), ['APPL', 'TSLA'])
+        self.assertTrue(symbol_filter.filter('APPL'))
+        self.assertFalse(symbol_filter.filter('NVDA'))
+
+    def test_indexing_data_source_adapter_should_index_longer_history_than_requested(self):
+        stub_data_source_adapter = mock.Mock(stock_data_analysis.data_sources.IDataSourceAdapter)
+        stub_data_source_adapter.get_earnings_record = mock.Mock(
+            return_value=stock_data_analysis.data_sources.EarningsRecord.from_earnings_per_share([],
+                                                                                                 [1.0, 2.0, 3.0, 4.0]))
+        stub_data_source_adapter.get_last_used_data_source_name = mock.Mock(return_value='stub')
+        indexing_data_source_adapter = stock_data_analysis.data_sources.IndexingDataSourceAdapter(
+            stub_data_source_adapter, self._earnings_per_share_index, min_years_to_index=4)
+
+        self.assertEqual(indexing_data_source_adapter.get_yearly_earnings_per_share('NVDA', 2), [3.0, 4.0])
+        stub_data_source_adapter.get_earnings_record.assert_called_once_with('NVDA', 0, 4)
+        self.assertEqual(self._earnings_per_share_index.get('NVDA', 'yearly', 10), [1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(self._earnings_per_share_index.get_growth('NVDA', 'yearly', 3), [1.0, 0.5, 1 / 3])
+
+    def test_indexing_data_source_adapter_should_index_both_series_of_rejected_symbols(self):
+        stub_http_client = mock.Mock(stock_data_analysis.utilities.HttpClient)
+        stub_http_client.get = mock.Mock(return_value=stock_data_analysis.utilities.ArchivedHttpResponse(
+            200,
+            json.dumps({
+                # yearly earnings shrink, so the yearly evaluator rejects the symbol before the quarterly one runs
+                'annualEarnings': [{
+                    'fiscalDateEnding': '{}-12-31'.format(2020 - i),
+                    'reportedEPS': str(1.0 + i)
+                } for i in range(4)],
+                'quarterlyEarnings': [{
+                    'fiscalDateEnding': '{}-{}'.format(2020 - i // 4, ('12-31', '09-30', '06-30', '03-31')[i % 4]),
+                    'reportedEPS': str(8.0 - i)
+                } for i in range(8)]
+            })))
+        alpha_vantage_api = stock_data_analysis.data_sources.AlphaVantageApi(
+            rate_limiter=stock_data_analysis.utilities.RateLimiter(), http_client=stub_http_client)
+        indexing_data_source_adapter = stock_data_analysis.data_sources.IndexingDataSourceAdapter(
+            stock_data_analysis.data_sources.AlphaVantageDataSourceAdapter(alpha_vantage_api),
+            self._earnings_per_share_index)
+        symbol_filter = stock_data_analysis.symbol_filters.SymbolFilter([
+            stock_data_analysis.symbol_filters.YearlyEarningsPerShareIncrementEvaluator(indexing_data_source_adapter),
+            stock_data_analysis.symbol_filters.QuarterlyEarningsPerShareIncrementEvaluator(indexing_data_source_adapter)
+        ])
+
+        self.assertFalse(symbol_filter.filter('NVDA'))
+        self.assertEqual(self._earnings_per_share_index.get('NVDA', 'yearly', 10), [4.0, 3.0, 2.0, 1.0])
+        self.assertEqual(self._earnings_per_share_index.get('NVDA', 'quarterly', 10),
+                         [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0])
+        stub_http_client.get.assert_called_once()
+
+    def test_put_should_merge_periods_by_period_end(self):
+        self._earnings_per_share_index.put('NVDA', 'yearly', [1.0, 2.0, 3.0], 'stub',
+                                           ['2017-12-31', '2018-12-31', '2019-12-31'])
+        self._earnings_per_share_index.put('NVDA', 'yearly', [2.5, 4.0], 'stub', ['2019-12-31', '2020-12-31'])
+
+        # a shorter fetch keeps the older periods and replaces the ones it has
+        self.assertEqual(self._earnings_per_share_index.get('NVDA', 'yearly', 10), [1.0, 2.0, 2.5, 4.0])
+        self.assertEqual(self._earnings_per_share_index.get_growth('NVDA', 'yearly', 2), [0.25, 0.6])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import json
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class IexApiTest(unittest.TestCase):
+    @staticmethod
+    def create_iex_api(status_code: int, response: str, response_cache):
+        http_client = mock.Mock(stock_data_analysis.utilities.HttpClient)
+        http_client.get = mock.Mock(
+            return_value=stock_data_analysis.utilities.ArchivedHttpResponse(status_code, response))
+        # a deadline shorter than the first backoff turns retries off
+        return stock_data_analysis.data_sources.IexApi('secret',
+                                                       response_cache=response_cache,
+                                                       http_client=http_client,
+                                                       retry_deadline_seconds=0.001)
+
+    def test_iex_api_should_raise_error_responses_without_caching_them(self):
+        for status_code, exception_type in [(503, stock_data_analysis.exceptions.ServerErrorException),
+                                            (403, stock_data_analysis.exceptions.BadRequestException)]:
+            response_cache = stock_data_analysis.utilities.ResponseCache()
+            iex_api = self.create_iex_api(status_code, 'Service Unavailable', response_cache)
+
+            self.assertRaises(exception_type, iex_api.get_reported_financials, 'APPL', 2, 'yearly')
+            self.assertIsNone(response_cache.get('IexApi:REPORTED_FINANCIALS:APPL:10-K:2'), status_code)
+
+    def test_iex_api_should_cache_reported_financials(self):
+        response_cache = stock_data_analysis.utilities.ResponseCache()
+        iex_api = self.create_iex_api(200, json.dumps([{'key': 'APPL'}]), response_cache)
+
+        self.assertEqual(iex_api.get_reported_financials('APPL', 2, 'yearly'), [{'key': 'APPL'}])
+        self.assertIsNotNone(response_cache.get('IexApi:REPORTED_FINANCIALS:APPL:10-K:2'))
+
+    def test_iex_api_should_request_10_q_for_quarters_and_10_k_for_years(self):
+        response_cache = stock_data_analysis.utilities.ResponseCache()
+        stub_http_client = mock.Mock(stock_data_analysis.utilities.HttpClient)
+        stub_http_client.get = mock.Mock(
+            return_value=stock_data_analysis.utilities.ArchivedHttpResponse(200, json.dumps([{'key': 'APPL'}])))
+        iex_api = stock_data_analysis.data_sources.IexApi('secret', response_cache, http_client=stub_http_client)
+
+        iex_api.get_reported_financials('APPL', 2, 'quarterly')
+        self.assertIn('/REPORTED_FINANCIALS/APPL/10-Q?', stub_http_client.get.call_args[0][0])
+        iex_api.get_reported_financials('APPL', 2, 'yearly')
+        self.assertIn('/REPORTED_FINANCIALS/APPL/10-K?', stub_http_client.get.call_args[0][0])
+
+        # the cache is keyed by form type, so an entry stored under the swapped mapping is never read
+        self.assertIsNotNone(response_cache.get('IexApi:REPORTED_FINANCIALS:APPL:10-Q:2'))
+        self.assertIsNotNone(response_cache.get('IexApi:REPORTED_FINANCIALS:APPL:10-K:2'))
+        self.assertRaises(Exception, iex_api.get_reported_financials, 'APPL', 2, 'monthly')
+
+    def test_iex_api_should_fetch_batch_in_one_request_and_cache_it_per_symbol(self):
+        reports = [{'key': 'MSFT', 'EarningsPerShareDiluted': 2}, {'key': 'APPL', 'EarningsPerShareDiluted': 1}]
+        stub_http_client = mock.Mock(stock_data_analysis.utilities.HttpClient)
+        stub_http_client.get = mock.Mock(return_value=mock.Mock(status_code=200, text=json.dumps(reports)))
+        iex_api = stock_data_analysis.data_sources.IexApi('token', stock_data_analysis.utilities.ResponseCache(),
+                                                          http_client=stub_http_client)
+        iex_data_source_adapter = stock_data_analysis.data_sources.IexDataSourceAdapter(iex_api)
+
+        self.assertEqual(iex_data_source_adapter.get_yearly_earnings_per_share_batch(['APPL', 'MSFT', 'TSLA'], 1), {
+            'APPL': [1.0],
+            'MSFT': [2.0],
+            'TSLA': []
+        })
+        self.assertEqual(iex_data_source_adapter.get_yearly_earnings_per_share('MSFT', 1), [2.0])
+        stub_http_client.get.assert_called_once()
+        self.assertIn('/REPORTED_FINANCIALS/APPL,MSFT,TSLA/10-K', stub_http_client.get.call_args[0][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class IexDataSourceAdapterTest(unittest.TestCase):
+    def test_iex_data_source_adapter_should_return_periods_oldest_first(self):
+        stub_iex_api = mock.Mock(stock_data_analysis.data_sources.IexApi)
+        stub_iex_api.get_reported_financials = mock.Mock(return_value=[{
+            'EarningsPerShareDiluted': 3
+        }, {
+            'EarningsPerShareDiluted': 2
+        }])
+
+        iex_data_source_adapter = stock_data_analysis.data_sources.IexDataSourceAdapter(stub_iex_api)
+        self.assertEqual(iex_data_source_adapter.get_yearly_earnings_per_share('APPL', 2), [2.0, 3.0])
+        stub_iex_api.get_reported_financials.assert_called_once_with('APPL', 2, 'yearly')
+
+    def test_iex_data_source_adapter_should_order_periods_by_period_end(self):
+        stub_iex_api = mock.Mock(stock_data_analysis.data_sources.IexApi)
+        stub_iex_api.get_reported_financials = mock.Mock(return_value=[{
+            'periodEnd': '2020-09-30',
+            'EarningsPerShareDiluted': 2
+        }, {
+            'periodEnd': '2020-12-31',
+            'EarningsPerShareDiluted': 3
+        }, {
+            'periodEnd': '2020-06-30',
+            'EarningsPerShareDiluted': 1
+        }])
+
+        iex_data_source_adapter = stock_data_analysis.data_sources.IexDataSourceAdapter(stub_iex_api)
+        self.assertEqual(iex_data_source_adapter.get_quarterly_earnings_per_share('APPL', 3), [1.0, 2.0, 3.0])
+        self.assertEqual(iex_data_source_adapter.get_quarterly_earnings_per_share('APPL', 2), [2.0, 3.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
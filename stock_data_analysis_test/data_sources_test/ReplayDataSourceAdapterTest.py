@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+import unittest
+
+from ..context import stock_data_analysis
+
+
+class ReplayDataSourceAdapterTest(unittest.TestCase):
+    EARNINGS_RESPONSE = {
+        'symbol': 'APPL',
+        'annualEarnings': [{
+            'fiscalDateEnding': '2020-12-31',
+            'reportedEPS': '2.0'
+        }, {
+            'fiscalDateEnding': '2019-12-31',
+            'reportedEPS': '1.0'
+        }],
+        'quarterlyEarnings': [{
+            'fiscalDateEnding': '2020-12-31',
+            'reportedDate': '2021-01-28',
+            'reportedEPS': '0.6'
+        }]
+    }
+
+    def setUp(self):
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._archive_file_name = os.path.join(self._temporary_directory.name, 'responses.jsonl.gz')
+
+        response_archive = stock_data_analysis.utilities.ResponseArchive(self._archive_file_name, writable=True)
+        response_archive.record('https://www.alphavantage.co/query?function=EARNINGS&symbol=APPL&apikey=secret', 200,
+                                json.dumps(ReplayDataSourceAdapterTest.EARNINGS_RESPONSE))
+        response_archive.record('https://sandbox.iexapis.com/stable/ref-data/symbols?token=secret', 200,
+                                json.dumps([{
+                                    'symbol': 'APPL',
+                                    'type': 'cs',
+                                    'exchange': 'NAS',
+                                    'isEnabled': True
+                                }]))
+        response_archive.close()
+
+    def tearDown(self):
+        self._temporary_directory.cleanup()
+
+    def test_replay_data_source_adapter_should_serve_recorded_responses(self):
+        replay_data_source_adapter = stock_data_analysis.data_sources.ReplayDataSourceAdapter(
+            stock_data_analysis.utilities.ResponseArchive(self._archive_file_name))
+
+        self.assertEqual(replay_data_source_adapter.get_all_symbols(), ['APPL'])
+        self.assertEqual(len(replay_data_source_adapter.get_yearly_earnings_per_share('APPL', 2)), 2)
+        self.assertEqual(replay_data_source_adapter.get_latest_earnings_report_dates('APPL'),
+                         ('2020-12-31', '2021-01-28'))
+        self.assertEqual(replay_data_source_adapter.get_replay_statistics()['missing_responses'], 0)
+
+    def test_stub_api_server_should_serve_recorded_responses_over_http(self):
+        stub_api_server = stock_data_analysis.data_sources.StubApiServer(
+            stock_data_analysis.utilities.ResponseArchive(self._archive_file_name))
+        stub_api_server.start()
+        http_client = stock_data_analysis.utilities.HttpClient()
+
+        try:
+            alpha_vantage_api = stock_data_analysis.data_sources.AlphaVantageApi(
+                'other token',
+                rate_limiter=stock_data_analysis.utilities.RateLimiter(),
+                http_client=http_client,
+                base_uri=stub_api_server.get_base_uri())
+
+            self.assertEqual(alpha_vantage_api.get_quarterly_and_annual_earnings_per_share('APPL'),
+                             ReplayDataSourceAdapterTest.EARNINGS_RESPONSE)
+            self.assertRaises(stock_data_analysis.exceptions.BadRequestException,
+                              alpha_vantage_api.get_quarterly_and_annual_earnings_per_share, 'MSFT')
+        finally:
+            http_client.close()
+            stub_api_server.stop()
+
+    def test_stub_api_server_should_serve_recorded_iex_responses_over_http(self):
+        stub_api_server = stock_data_analysis.data_sources.StubApiServer(
+            stock_data_analysis.utilities.ResponseArchive(self._archive_file_name))
+        stub_api_server.start()
+        http_client = stock_data_analysis.utilities.HttpClient()
+
+        try:
+            iex_api = stock_data_analysis.data_sources.IexApi('other token',
+                                                              rate_limiter=stock_data_analysis.utilities.RateLimiter(),
+                                                              http_client=http_client,
+                                                              base_uri=stub_api_server.get_iex_base_uri())
+
+            self.assertEqual([i['symbol'] for i in iex_api.stream_all_symbols()], ['APPL'])
+        finally:
+            http_client.close()
+            stub_api_server.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
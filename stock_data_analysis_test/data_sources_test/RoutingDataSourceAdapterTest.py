@@ -0,0 +1,114 @@
+import time
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class RoutingDataSourceAdapterTest(unittest.TestCase):
+    @staticmethod
+    def create_stub_data_source_adapter(name: str, get_quarterly_earnings_per_share):
+        stub_data_source_adapter = mock.Mock(stock_data_analysis.data_sources.IDataSourceAdapter)
+        stub_data_source_adapter.__str__ = mock.Mock(return_value=name)
+        stub_data_source_adapter.get_quarterly_earnings_per_share = mock.Mock(
+            side_effect=get_quarterly_earnings_per_share)
+        return stub_data_source_adapter
+
+    def test_routing_data_source_adapter_should_fall_back_and_skip_throttled_data_source(self):
+        def throttle(symbol, number_of_quarters):
+            raise stock_data_analysis.exceptions.TooManyRequestsException()
+
+        throttled_data_source_adapter = self.create_stub_data_source_adapter('throttled', throttle)
+        fallback_data_source_adapter = self.create_stub_data_source_adapter('fallback', lambda symbol, n: [1.0, 2.0])
+        routing_data_source_adapter = stock_data_analysis.data_sources.RoutingDataSourceAdapter(
+            [throttled_data_source_adapter, fallback_data_source_adapter])
+
+        self.assertEqual(routing_data_source_adapter.get_quarterly_earnings_per_share('APPL', 2), [1.0, 2.0])
+        self.assertEqual(routing_data_source_adapter.get_last_used_data_source_name(), 'fallback')
+        self.assertEqual(routing_data_source_adapter.get_quarterly_earnings_per_share('MSFT', 2), [1.0, 2.0])
+        throttled_data_source_adapter.get_quarterly_earnings_per_share.assert_called_once_with('APPL', 2)
+
+    def test_routing_data_source_adapter_should_prefer_data_source_with_quota_headroom(self):
+        exhausted_data_source_adapter = self.create_stub_data_source_adapter('exhausted', lambda symbol, n: [1.0])
+        available_data_source_adapter = self.create_stub_data_source_adapter('available', lambda symbol, n: [2.0])
+        exhausted_rate_limiter = stock_data_analysis.utilities.RateLimiter(calls_per_minute=1)
+        exhausted_rate_limiter.acquire()
+
+        routing_data_source_adapter = stock_data_analysis.data_sources.RoutingDataSourceAdapter(
+            [exhausted_data_source_adapter, available_data_source_adapter],
+            [exhausted_rate_limiter, stock_data_analysis.utilities.RateLimiter()])
+
+        self.assertEqual(routing_data_source_adapter.get_quarterly_earnings_per_share('APPL', 1), [2.0])
+        exhausted_data_source_adapter.get_quarterly_earnings_per_share.assert_not_called()
+
+    def test_routing_data_source_adapter_should_return_empty_series_or_raise_when_no_data_source_answers(self):
+        def reject(symbol, number_of_quarters):
+            raise stock_data_analysis.exceptions.BadRequestException()
+
+        routing_data_source_adapter = stock_data_analysis.data_sources.RoutingDataSourceAdapter([
+            self.create_stub_data_source_adapter('empty', lambda symbol, n: []),
+            self.create_stub_data_source_adapter('rejecting', reject)
+        ])
+        self.assertEqual(routing_data_source_adapter.get_quarterly_earnings_per_share('APPL', 4), [])
+
+        routing_data_source_adapter = stock_data_analysis.data_sources.RoutingDataSourceAdapter(
+            [self.create_stub_data_source_adapter('rejecting', reject)])
+        self.assertEqual(routing_data_source_adapter.get_quarterly_earnings_per_share('APPL', 4), [])
+
+        def throttle(symbol, number_of_quarters):
+            raise stock_data_analysis.exceptions.TooManyRequestsException()
+
+        routing_data_source_adapter = stock_data_analysis.data_sources.RoutingDataSourceAdapter([
+            self.create_stub_data_source_adapter('rejecting', reject),
+            self.create_stub_data_source_adapter('throttled', throttle)
+        ])
+        self.assertRaises(stock_data_analysis.exceptions.TooManyRequestsException,
+                          routing_data_source_adapter.get_quarterly_earnings_per_share, 'APPL', 4)
+
+    def test_routing_data_source_adapter_should_hedge_slow_calls(self):
+        def answer_slowly(symbol, number_of_quarters):
+            time.sleep(1)
+            return [1.0]
+
+        slow_data_source_adapter = self.create_stub_data_source_adapter('slow', answer_slowly)
+        fast_data_source_adapter = self.create_stub_data_source_adapter('fast', lambda symbol, n: [2.0])
+        routing_data_source_adapter = stock_data_analysis.data_sources.RoutingDataSourceAdapter(
+            [slow_data_source_adapter, fast_data_source_adapter], hedge_delay_seconds=0.05)
+        self.addCleanup(routing_data_source_adapter.close)
+
+        start_time = time.monotonic()
+        self.assertEqual(routing_data_source_adapter.get_quarterly_earnings_per_share('APPL', 1), [2.0])
+        self.assertLess(time.monotonic() - start_time, 0.5)
+
+    def test_routing_data_source_adapter_should_forward_batches_and_fall_back_per_symbol(self):
+        def throttle(symbols, number_of_quarters):
+            raise stock_data_analysis.exceptions.TooManyRequestsException()
+
+        throttled_data_source_adapter = self.create_stub_data_source_adapter('throttled', None)
+        throttled_data_source_adapter.get_quarterly_earnings_per_share_batch = mock.Mock(side_effect=throttle)
+        batch_data_source_adapter = self.create_stub_data_source_adapter('batch', None)
+        batch_data_source_adapter.get_quarterly_earnings_per_share_batch = mock.Mock(
+            side_effect=lambda symbols, n: {i: [1.0] if i != 'MSFT' else [] for i in symbols})
+        fallback_data_source_adapter = self.create_stub_data_source_adapter('fallback', None)
+        fallback_data_source_adapter.get_quarterly_earnings_per_share_batch = mock.Mock(
+            side_effect=lambda symbols, n: {i: [2.0] for i in symbols})
+        routing_data_source_adapter = stock_data_analysis.data_sources.RoutingDataSourceAdapter(
+            [throttled_data_source_adapter, batch_data_source_adapter, fallback_data_source_adapter])
+
+        self.assertEqual(routing_data_source_adapter.get_quarterly_earnings_per_share_batch(['APPL', 'MSFT'], 2), {
+            'APPL': [1.0],
+            'MSFT': [2.0]
+        })
+        self.assertEqual(routing_data_source_adapter.get_last_used_data_source_name(), 'batch')
+        batch_data_source_adapter.get_quarterly_earnings_per_share_batch.assert_called_once_with(['APPL', 'MSFT'], 2)
+        fallback_data_source_adapter.get_quarterly_earnings_per_share_batch.assert_called_once_with(['MSFT'], 2)
+
+        # the throttled source cools down and each symbol returns to the source that last answered for it
+        routing_data_source_adapter.get_quarterly_earnings_per_share_batch(['APPL', 'MSFT'], 2)
+        throttled_data_source_adapter.get_quarterly_earnings_per_share_batch.assert_called_once()
+        batch_data_source_adapter.get_quarterly_earnings_per_share_batch.assert_called_with(['APPL'], 2)
+        fallback_data_source_adapter.get_quarterly_earnings_per_share_batch.assert_called_with(['MSFT'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
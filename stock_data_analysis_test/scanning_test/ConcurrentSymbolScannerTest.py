@@ -0,0 +1,130 @@
+import json
+import threading
+import time
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class ConcurrentSymbolScannerTest(unittest.TestCase):
+    def test_scan_should_report_every_symbol_once(self):
+        stub_symbol_filter = mock.Mock(stock_data_analysis.symbol_filters.SymbolFilter)
+        stub_symbol_filter.filter = mock.Mock(side_effect=lambda symbol: symbol.startswith('A'))
+        results = {}
+
+        stock_data_analysis.scanning.ConcurrentSymbolScanner(stub_symbol_filter, number_of_workers=4).scan(
+            ['APPL', 'MSFT', 'AMZN', 'TSLA', 'AMD'], lambda symbol, passed: results.update({symbol: passed}))
+
+        self.assertEqual(results, {'APPL': True, 'MSFT': False, 'AMZN': True, 'TSLA': False, 'AMD': True})
+
+    def test_scan_should_bound_concurrent_evaluations(self):
+        lock = threading.Lock()
+        concurrent_evaluations = [0, 0]
+
+        def filter_symbol(symbol):
+            with lock:
+                concurrent_evaluations[0] += 1
+                concurrent_evaluations[1] = max(concurrent_evaluations)
+            time.sleep(0.01)
+            with lock:
+                concurrent_evaluations[0] -= 1
+            return True
+
+        stub_symbol_filter = mock.Mock(stock_data_analysis.symbol_filters.SymbolFilter)
+        stub_symbol_filter.filter = mock.Mock(side_effect=filter_symbol)
+
+        stock_data_analysis.scanning.ConcurrentSymbolScanner(stub_symbol_filter, number_of_workers=3).scan(
+            ('SYMBOL{}'.format(i) for i in range(30)), lambda symbol, passed: None)
+
+        self.assertEqual(stub_symbol_filter.filter.call_count, 30)
+        self.assertLessEqual(concurrent_evaluations[1], 3)
+
+    def test_scan_should_evaluate_symbols_in_batches(self):
+        stub_symbol_filter = mock.Mock(stock_data_analysis.symbol_filters.SymbolFilter)
+        stub_symbol_filter.filter_symbols_with_details = mock.Mock(
+            side_effect=lambda symbols: [(i.startswith('A'), []) for i in symbols])
+        results = {}
+
+        symbol_scanner = stock_data_analysis.scanning.ConcurrentSymbolScanner(stub_symbol_filter,
+                                                                              number_of_workers=2,
+                                                                              batch_size=2)
+        symbol_scanner.scan(['APPL', 'MSFT', 'AMZN', 'TSLA', 'AMD'],
+                            lambda symbol, passed: results.update({symbol: passed}))
+
+        self.assertEqual(results, {'APPL': True, 'MSFT': False, 'AMZN': True, 'TSLA': False, 'AMD': True})
+        self.assertEqual(stub_symbol_filter.filter_symbols_with_details.call_count, 3)
+        stub_symbol_filter.filter.assert_not_called()
+
+    def test_scan_should_reschedule_throttled_symbols(self):
+        throttled_symbols = ['MSFT', 'MSFT']
+
+        def filter_symbol(symbol):
+            if symbol in throttled_symbols:
+                throttled_symbols.remove(symbol)
+                raise stock_data_analysis.exceptions.TooManyRequestsException(0.01)
+            return True
+
+        stub_symbol_filter = mock.Mock(stock_data_analysis.symbol_filters.SymbolFilter)
+        stub_symbol_filter.filter = mock.Mock(side_effect=filter_symbol)
+        results = {}
+
+        stock_data_analysis.scanning.ConcurrentSymbolScanner(
+            stub_symbol_filter,
+            reschedule_retry_executor=stock_data_analysis.utilities.RetryExecutor(initial_backoff_seconds=0.01)).scan(
+                ['APPL', 'MSFT', 'AMZN'], lambda symbol, passed: results.update({symbol: passed}))
+
+        self.assertEqual(results, {'APPL': True, 'MSFT': True, 'AMZN': True})
+        self.assertEqual(stub_symbol_filter.filter.call_count, 5)
+
+    def test_scan_should_raise_when_symbol_stays_throttled(self):
+        stub_symbol_filter = mock.Mock(stock_data_analysis.symbol_filters.SymbolFilter)
+        stub_symbol_filter.filter = mock.Mock(side_effect=stock_data_analysis.exceptions.TooManyRequestsException())
+
+        symbol_scanner = stock_data_analysis.scanning.ConcurrentSymbolScanner(
+            stub_symbol_filter,
+            max_reschedules=2,
+            reschedule_retry_executor=stock_data_analysis.utilities.RetryExecutor(initial_backoff_seconds=0.001))
+        self.assertRaises(stock_data_analysis.exceptions.TooManyRequestsException, symbol_scanner.scan, ['APPL'],
+                          lambda symbol, passed: None)
+        self.assertEqual(stub_symbol_filter.filter.call_count, 3)
+
+    def test_scan_should_reject_symbol_unknown_to_data_source(self):
+        def get(url, stream=False):
+            if 'symbol=UNKNOWN' in url:
+                return mock.Mock(status_code=200, text=json.dumps({'Error Message': 'Invalid API call.'}))
+
+            return mock.Mock(status_code=200,
+                             text=json.dumps({
+                                 'annualEarnings': [{
+                                     'fiscalDateEnding': '{}-12-31'.format(2020 - i),
+                                     'reportedEPS': str(2.0**(4 - i))
+                                 } for i in range(4)],
+                                 'quarterlyEarnings': [{
+                                     'fiscalDateEnding': '{}-{}'.format(2020 - i // 4, ('12-31', '09-30', '06-30',
+                                                                                         '03-31')[i % 4]),
+                                     'reportedEPS': str(2.0**(8 - i))
+                                 } for i in range(8)]
+                             }))
+
+        stub_http_client = mock.Mock(stock_data_analysis.utilities.HttpClient)
+        stub_http_client.get = mock.Mock(side_effect=get)
+        data_source_adapter = stock_data_analysis.data_sources.AlphaVantageDataSourceAdapter(
+            stock_data_analysis.data_sources.AlphaVantageApi(
+                response_cache=stock_data_analysis.utilities.ResponseCache(),
+                rate_limiter=stock_data_analysis.utilities.RateLimiter(),
+                http_client=stub_http_client))
+        symbol_filter = stock_data_analysis.symbol_filters.SymbolFilter([
+            stock_data_analysis.symbol_filters.YearlyEarningsPerShareIncrementEvaluator(data_source_adapter),
+            stock_data_analysis.symbol_filters.QuarterlyEarningsPerShareIncrementEvaluator(data_source_adapter)
+        ])
+        results = {}
+
+        stock_data_analysis.scanning.ConcurrentSymbolScanner(symbol_filter, number_of_workers=2).scan(
+            ['APPL', 'UNKNOWN', 'MSFT'], lambda symbol, passed: results.update({symbol: passed}))
+
+        self.assertEqual(results, {'APPL': True, 'UNKNOWN': False, 'MSFT': True})
+
+
+if __name__ == '__main__':
+    unittest.main()
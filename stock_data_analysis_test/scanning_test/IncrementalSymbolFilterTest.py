@@ -0,0 +1,67 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class IncrementalSymbolFilterTest(unittest.TestCase):
+    def setUp(self):
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._incremental_scan_state = stock_data_analysis.scanning.IncrementalScanState(
+            os.path.join(self._temporary_directory.name, 'state.sqlite3'))
+
+        self._stub_symbol_filter = mock.Mock(stock_data_analysis.symbol_filters.SymbolFilter)
+        self._stub_symbol_filter.filter = mock.Mock(return_value=True)
+        self._stub_data_source_adapter = mock.Mock(stock_data_analysis.data_sources.IDataSourceAdapter)
+
+    def tearDown(self):
+        self._incremental_scan_state.close()
+        self._temporary_directory.cleanup()
+
+    def create_incremental_symbol_filter(self, configuration_fingerprint: str = 'fingerprint'):
+        return stock_data_analysis.scanning.IncrementalSymbolFilter(self._stub_symbol_filter,
+                                                                    self._stub_data_source_adapter,
+                                                                    self._incremental_scan_state,
+                                                                    configuration_fingerprint)
+
+    @staticmethod
+    def days_ago(days: int) -> str:
+        return (datetime.date.today() - datetime.timedelta(days=days)).isoformat()
+
+    def test_filter_should_reuse_verdict_without_fetching_when_no_filing_is_due(self):
+        self._incremental_scan_state.put('APPL', self.days_ago(40), self.days_ago(10), 'fingerprint', False)
+
+        self.assertFalse(self.create_incremental_symbol_filter().filter('APPL'))
+        self._stub_data_source_adapter.get_latest_earnings_report_dates.assert_not_called()
+        self._stub_symbol_filter.filter.assert_not_called()
+
+    def test_filter_should_reuse_verdict_when_due_filing_has_not_arrived(self):
+        self._incremental_scan_state.put('APPL', self.days_ago(120), self.days_ago(90), 'fingerprint', False)
+        self._stub_data_source_adapter.get_latest_earnings_report_dates = mock.Mock(
+            return_value=(self.days_ago(120), self.days_ago(90)))
+
+        self.assertFalse(self.create_incremental_symbol_filter().filter('APPL'))
+        self._stub_symbol_filter.filter.assert_not_called()
+
+    def test_filter_should_evaluate_again_with_new_filing(self):
+        self._incremental_scan_state.put('APPL', self.days_ago(120), self.days_ago(90), 'fingerprint', False)
+        self._stub_data_source_adapter.get_latest_earnings_report_dates = mock.Mock(
+            return_value=(self.days_ago(30), self.days_ago(1)))
+
+        self.assertTrue(self.create_incremental_symbol_filter().filter('APPL'))
+        self.assertEqual(self._incremental_scan_state.get('APPL').fiscal_date_ending, self.days_ago(30))
+
+    def test_filter_should_evaluate_again_with_changed_configuration(self):
+        self._incremental_scan_state.put('APPL', self.days_ago(40), self.days_ago(10), 'fingerprint', False)
+        self._stub_data_source_adapter.get_latest_earnings_report_dates = mock.Mock(
+            return_value=(self.days_ago(40), self.days_ago(10)))
+
+        self.assertTrue(self.create_incremental_symbol_filter('other fingerprint').filter('APPL'))
+        self._stub_symbol_filter.filter.assert_called_once_with('APPL')
+
+
+if __name__ == '__main__':
+    unittest.main()
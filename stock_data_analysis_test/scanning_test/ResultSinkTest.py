@@ -0,0 +1,210 @@
+import csv
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class ResultSinkTest(unittest.TestCase):
+    EVALUATOR_NAME = 'QuarterlyEarningsPerShareIncrementEvaluator'
+
+    def setUp(self):
+        self._temporary_directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._temporary_directory.cleanup()
+
+    @staticmethod
+    def create_scan_result(symbol: str, passed: bool):
+        return stock_data_analysis.scanning.ScanResult(symbol, passed, [
+            stock_data_analysis.symbol_filters.SymbolEvaluation(ResultSinkTest.EVALUATOR_NAME, passed, [1.0, 2.0],
+                                                                [1.0], 'AlphaVantageDataSourceAdapter')
+        ])
+
+    def test_json_lines_result_sink_should_only_publish_results_when_closed(self):
+        file_name = os.path.join(self._temporary_directory.name, 'output', 'scan_results.jsonl')
+        result_sink = stock_data_analysis.scanning.JsonLinesResultSink(file_name, batch_size=2)
+
+        for symbol in ['APPL', 'MSFT', 'TSLA']:
+            result_sink.write(self.create_scan_result(symbol, symbol != 'MSFT'))
+        self.assertFalse(os.path.exists(file_name))
+        result_sink.close()
+
+        with open(file_name) as result_file:
+            scan_results = [json.loads(i) for i in result_file]
+        self.assertEqual([i['symbol'] for i in scan_results], ['APPL', 'MSFT', 'TSLA'])
+        self.assertEqual(scan_results[1]['passed'], False)
+        self.assertEqual(scan_results[0]['data_source_name'], 'AlphaVantageDataSourceAdapter')
+        self.assertEqual(scan_results[0]['evaluations'][0]['growth'], [1.0])
+
+    def test_json_lines_result_sink_should_append_after_torn_line_when_resuming(self):
+        file_name = os.path.join(self._temporary_directory.name, 'scan_results.jsonl')
+        with open(file_name + stock_data_analysis.scanning.BufferedResultSink.PARTIAL_FILE_SUFFIX, 'w') as partial_file:
+            partial_file.write(json.dumps(self.create_scan_result('APPL', True).to_dict()) + '\n{"symbol": "MS')
+
+        result_sink = stock_data_analysis.scanning.JsonLinesResultSink(file_name, append=True)
+        result_sink.write(self.create_scan_result('MSFT', False))
+        result_sink.close()
+
+        with open(file_name) as result_file:
+            lines = result_file.read().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[2])['symbol'], 'MSFT')
+
+    def test_result_sink_flushed_by_journal_should_keep_every_recorded_symbol_after_crash(self):
+        file_name = os.path.join(self._temporary_directory.name, 'scan_results.jsonl')
+        journal_file_name = os.path.join(self._temporary_directory.name, 'journal.jsonl')
+        result_sink = stock_data_analysis.scanning.JsonLinesResultSink(file_name,
+                                                                       batch_size=None,
+                                                                       flush_interval_seconds=None)
+        scan_journal = stock_data_analysis.scanning.ScanJournal(journal_file_name,
+                                                                'fingerprint',
+                                                                batch_size=2,
+                                                                before_flush=result_sink.flush)
+
+        for symbol in ['APPL', 'MSFT', 'TSLA']:
+            result_sink.write(self.create_scan_result(symbol, True))
+            scan_journal.record(symbol, True)
+        # the process dies without closing the sink or the journal
+
+        resumed_result_sink = stock_data_analysis.scanning.JsonLinesResultSink(file_name, append=True)
+        resumed_scan_journal = stock_data_analysis.scanning.ScanJournal(journal_file_name, 'fingerprint')
+        completed_symbols = resumed_scan_journal.get_completed_symbols()
+        resumed_scan_journal.close()
+        resumed_result_sink.write(self.create_scan_result('TSLA', True))
+        resumed_result_sink.close()
+
+        with open(file_name) as result_file:
+            written_symbols = [json.loads(i)['symbol'] for i in result_file]
+        self.assertEqual(completed_symbols, ['APPL', 'MSFT'])
+        self.assertEqual(written_symbols, ['APPL', 'MSFT', 'TSLA'])
+
+    def test_journal_should_be_synced_after_flushed_results(self):
+        file_name = os.path.join(self._temporary_directory.name, 'scan_results.jsonl')
+        journal_file_name = os.path.join(self._temporary_directory.name, 'journal.jsonl')
+        result_sink = stock_data_analysis.scanning.JsonLinesResultSink(file_name,
+                                                                       batch_size=None,
+                                                                       flush_interval_seconds=None)
+        scan_journal = stock_data_analysis.scanning.ScanJournal(journal_file_name,
+                                                                'fingerprint',
+                                                                batch_size=1,
+                                                                before_flush=result_sink.flush)
+        partial_file_name = file_name + stock_data_analysis.scanning.BufferedResultSink.PARTIAL_FILE_SUFFIX
+        synced_files = []
+
+        def fsync(file_descriptor):
+            # records which file reached the disk and what the journal held at that moment
+            is_result_file = os.path.samestat(os.fstat(file_descriptor), os.stat(partial_file_name))
+            with open(journal_file_name) as journal_file:
+                synced_files.append((partial_file_name if is_result_file else journal_file_name,
+                                     'APPL' in journal_file.read()))
+
+        with mock.patch('os.fsync', side_effect=fsync):
+            result_sink.write(self.create_scan_result('APPL', True))
+            scan_journal.record('APPL', True)
+
+        self.assertEqual(synced_files, [(partial_file_name, False), (journal_file_name, True)])
+        scan_journal.close()
+        result_sink.close()
+
+    @unittest.skipIf(not stock_data_analysis.scanning.ParquetResultSink.is_supported(), 'pyarrow is not installed')
+    def test_parquet_result_sink_should_resume_after_crash_and_after_completed_run(self):
+        import pyarrow.parquet  # pylint: disable=import-outside-toplevel
+
+        file_name = os.path.join(self._temporary_directory.name, 'scan_results.parquet')
+        result_sink = stock_data_analysis.scanning.ParquetResultSink(file_name, [ResultSinkTest.EVALUATOR_NAME],
+                                                                     batch_size=1)
+        result_sink.write(self.create_scan_result('APPL', True))
+        result_sink.write(self.create_scan_result('MSFT', False))
+        # the process dies without closing the sink, which leaves a spool without a Parquet footer
+
+        for symbol in ['TSLA', 'AMZN']:
+            resumed_result_sink = stock_data_analysis.scanning.ParquetResultSink(file_name,
+                                                                                 [ResultSinkTest.EVALUATOR_NAME],
+                                                                                 append=True)
+            resumed_result_sink.write(self.create_scan_result(symbol, True))
+            resumed_result_sink.close()
+
+        table = pyarrow.parquet.read_table(file_name)
+        self.assertEqual(table.column('symbol').to_pylist(), ['APPL', 'MSFT', 'TSLA', 'AMZN'])
+        self.assertEqual(table.column('{}.growth'.format(ResultSinkTest.EVALUATOR_NAME)).to_pylist()[0], [1.0])
+
+    def test_csv_result_sink_should_flatten_evaluations_and_keep_concurrent_writes(self):
+        file_name = os.path.join(self._temporary_directory.name, 'scan_results.csv')
+        result_sink = stock_data_analysis.scanning.CsvResultSink(file_name, [ResultSinkTest.EVALUATOR_NAME],
+                                                                 batch_size=7)
+
+        def write_results(thread_index: int):
+            for i in range(50):
+                result_sink.write(self.create_scan_result('SYMBOL{}_{}'.format(thread_index, i), i % 2 == 0))
+
+        threads = [threading.Thread(target=write_results, args=(i, )) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        result_sink.close()
+
+        with open(file_name, newline='') as result_file:
+            rows = list(csv.DictReader(result_file))
+        self.assertEqual(len(rows), 200)
+        self.assertEqual(len(set(i['symbol'] for i in rows)), 200)
+        self.assertEqual(json.loads(rows[0]['{}.growth'.format(ResultSinkTest.EVALUATOR_NAME)]), [1.0])
+
+    def test_result_sinks_should_merge_shard_files_keeping_first_result_of_each_symbol(self):
+        create_result_sinks = {
+            'jsonl': lambda file_name: stock_data_analysis.scanning.JsonLinesResultSink(file_name),
+            'csv': lambda file_name: stock_data_analysis.scanning.CsvResultSink(file_name,
+                                                                                [ResultSinkTest.EVALUATOR_NAME])
+        }
+        if stock_data_analysis.scanning.ParquetResultSink.is_supported():
+            create_result_sinks['parquet'] = lambda file_name: stock_data_analysis.scanning.ParquetResultSink(
+                file_name, [ResultSinkTest.EVALUATOR_NAME])
+
+        for output_format, create_result_sink in create_result_sinks.items():
+            shard_file_names = []
+            for shard_index, shard_symbols in enumerate([['APPL', 'MSFT', 'APPL'], ['TSLA', 'MSFT']]):
+                shard_file_names.append(
+                    os.path.join(self._temporary_directory.name, 'shard_{}.{}'.format(shard_index, output_format)))
+                shard_result_sink = create_result_sink(shard_file_names[-1])
+                for symbol in shard_symbols:
+                    shard_result_sink.write(self.create_scan_result(symbol, symbol == 'TSLA'))
+                shard_result_sink.close()
+
+            merged_file_name = os.path.join(self._temporary_directory.name, 'merged.{}'.format(output_format))
+            merged_result_sink = create_result_sink(merged_file_name)
+            merged_symbols = set()
+            for shard_file_name in shard_file_names:
+                merged_symbols.update(merged_result_sink.append_file(shard_file_name, merged_symbols))
+            merged_result_sink.write(self.create_scan_result('AMZN', False))
+            merged_result_sink.close()
+
+            # every format is read back through a sink of its own kind
+            check_result_sink = create_result_sink(
+                os.path.join(self._temporary_directory.name, 'check.{}'.format(output_format)))
+            self.assertEqual(merged_symbols, {'APPL', 'MSFT', 'TSLA'}, output_format)
+            self.assertEqual(check_result_sink.append_file(merged_file_name), ['APPL', 'MSFT', 'TSLA', 'AMZN'],
+                             output_format)
+            check_result_sink.close()
+
+    def test_symbol_filter_should_return_evaluator_details(self):
+        stub_data_source_adapter = mock.Mock(stock_data_analysis.data_sources.IDataSourceAdapter)
+        stub_data_source_adapter.get_quarterly_earnings_per_share = mock.Mock(
+            return_value=[1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 0.5])
+        stub_data_source_adapter.get_last_used_data_source_name = mock.Mock(return_value='stub')
+        symbol_filter = stock_data_analysis.symbol_filters.SymbolFilter(
+            [stock_data_analysis.symbol_filters.QuarterlyEarningsPerShareIncrementEvaluator(stub_data_source_adapter)])
+
+        symbol_passed, symbol_evaluations = symbol_filter.filter_with_details('APPL')
+
+        self.assertFalse(symbol_passed)
+        self.assertEqual(symbol_evaluations[0].growth, [1.0, 1.0, -0.5])
+        self.assertEqual(symbol_evaluations[0].data_source_name, 'stub')
+
+
+if __name__ == '__main__':
+    unittest.main()
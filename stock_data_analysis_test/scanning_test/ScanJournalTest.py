@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+
+from ..context import stock_data_analysis
+
+
+class ScanJournalTest(unittest.TestCase):
+    def test_is_completed_should_return_true_for_symbols_recorded_by_previous_run(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            journal_file_name = os.path.join(temporary_directory, 'run.jsonl')
+
+            scan_journal = stock_data_analysis.scanning.ScanJournal(journal_file_name, 'fingerprint', batch_size=2)
+            scan_journal.record('APPL', True)
+            scan_journal.record('MSFT', False)
+            scan_journal.record('TSLA', False)
+            scan_journal.close()
+
+            scan_journal = stock_data_analysis.scanning.ScanJournal(journal_file_name, 'fingerprint')
+            self.assertTrue(scan_journal.is_completed('APPL'))
+            self.assertTrue(scan_journal.is_completed('TSLA'))
+            self.assertFalse(scan_journal.is_completed('AMZN'))
+            self.assertEqual(sorted(scan_journal.get_completed_symbols()), ['APPL', 'MSFT', 'TSLA'])
+            scan_journal.close()
+
+    def test_is_completed_should_return_false_when_inputs_fingerprint_changed(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            journal_file_name = os.path.join(temporary_directory, 'run.jsonl')
+
+            scan_journal = stock_data_analysis.scanning.ScanJournal(journal_file_name, 'fingerprint')
+            scan_journal.record('APPL', True)
+            scan_journal.close()
+
+            scan_journal = stock_data_analysis.scanning.ScanJournal(journal_file_name, 'other fingerprint')
+            self.assertFalse(scan_journal.is_completed('APPL'))
+            scan_journal.close()
+
+    def test_constructor_should_skip_torn_last_line(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            journal_file_name = os.path.join(temporary_directory, 'run.jsonl')
+            with open(journal_file_name, 'w') as journal_file:
+                journal_file.write('{"symbol": "APPL", "passed": true, "fingerprint": "fingerprint"}\n{"symbol": "MS')
+
+            scan_journal = stock_data_analysis.scanning.ScanJournal(journal_file_name, 'fingerprint')
+            scan_journal.record('TSLA', True)
+            scan_journal.close()
+
+            scan_journal = stock_data_analysis.scanning.ScanJournal(journal_file_name, 'fingerprint')
+            self.assertEqual(sorted(scan_journal.get_completed_symbols()), ['APPL', 'TSLA'])
+            scan_journal.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
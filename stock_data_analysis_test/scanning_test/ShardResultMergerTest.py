@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+from ..context import stock_data_analysis
+
+
+class ShardResultMergerTest(unittest.TestCase):
+    SYMBOLS = ['APPL', 'MSFT', 'TSLA', 'AMZN', 'GOOG', 'NFLX', 'NVDA', 'INTC']
+
+    def setUp(self):
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._shard_partitioner = stock_data_analysis.scanning.ShardPartitioner(3)
+
+    def tearDown(self):
+        self._temporary_directory.cleanup()
+
+    def write_shard(self, shard_index: int, evaluated_symbols: [str]) -> str:
+        shard_name = self._shard_partitioner.get_shard_name(shard_index)
+        journal_file_name = os.path.join(self._temporary_directory.name, 'run_{}.jsonl'.format(shard_name))
+        scan_journal = stock_data_analysis.scanning.ScanJournal(journal_file_name, 'fingerprint')
+        for symbol in evaluated_symbols:
+            scan_journal.record(symbol, symbol.startswith('A'))
+        scan_journal.close()
+
+        manifest_file_name = os.path.join(self._temporary_directory.name, 'run_{}.manifest.json'.format(shard_name))
+        stock_data_analysis.scanning.ShardManifest(
+            'run', shard_index, 3, 'fingerprint', journal_file_name,
+            list(self._shard_partitioner.filter_symbols(ShardResultMergerTest.SYMBOLS, shard_index)),
+            True).write(manifest_file_name)
+        return manifest_file_name
+
+    def test_shard_partitioner_should_assign_every_symbol_to_exactly_one_shard(self):
+        shards = [list(self._shard_partitioner.filter_symbols(ShardResultMergerTest.SYMBOLS, i)) for i in range(3)]
+
+        self.assertEqual(sorted(sum(shards, [])), sorted(ShardResultMergerTest.SYMBOLS))
+        self.assertEqual(self._shard_partitioner.get_shard_index('APPL'),
+                         stock_data_analysis.scanning.ShardPartitioner(3).get_shard_index('APPL'))
+
+    def test_merge_should_combine_complete_shards(self):
+        manifest_file_names = [
+            self.write_shard(i, self._shard_partitioner.filter_symbols(ShardResultMergerTest.SYMBOLS, i))
+            for i in range(3)
+        ]
+
+        merge_report = stock_data_analysis.scanning.ShardResultMerger().merge(manifest_file_names)
+
+        self.assertEqual(merge_report['evaluated_symbols'], len(ShardResultMergerTest.SYMBOLS))
+        self.assertEqual(merge_report['passed_symbols'], ['AMZN', 'APPL'])
+        self.assertEqual(merge_report['missing_shards'], [])
+        self.assertEqual(merge_report['missing_symbols'], [])
+        self.assertEqual(merge_report['duplicated_symbols'], [])
+
+    def test_merge_should_report_missing_shards_and_missing_or_duplicated_symbols(self):
+        first_shard_symbols = list(self._shard_partitioner.filter_symbols(ShardResultMergerTest.SYMBOLS, 0))
+        second_shard_symbols = list(self._shard_partitioner.filter_symbols(ShardResultMergerTest.SYMBOLS, 1))
+        manifest_file_names = [
+            self.write_shard(0, first_shard_symbols[1:]),
+            self.write_shard(1, second_shard_symbols + first_shard_symbols[-1:])
+        ]
+
+        merge_report = stock_data_analysis.scanning.ShardResultMerger().merge(manifest_file_names)
+
+        self.assertEqual(merge_report['missing_shards'], [2])
+        self.assertEqual(merge_report['missing_symbols'], first_shard_symbols[:1])
+        self.assertEqual(merge_report['duplicated_symbols'], first_shard_symbols[-1:])
+        self.assertEqual(merge_report['misassigned_symbols'], first_shard_symbols[-1:])
+
+    def test_remove_options_should_drop_launcher_options_and_their_values(self):
+        self.assertEqual(
+            stock_data_analysis.scanning.LocalShardLauncher.remove_options(
+                ['--workers', '4', '--shard-alpha-vantage-tokens', 'a', 'b', '--launch-shards=2', '--exchanges', 'NAS'],
+                ['--launch-shards', '--shard-alpha-vantage-tokens']), ['--workers', '4', '--exchanges', 'NAS'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import array
+import datetime
+import random
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class EarningsBacktesterTest(unittest.TestCase):
+    @staticmethod
+    def create_random_earnings_records(number_of_symbols: int, max_number_of_years: int) -> dict:
+        random_generator = random.Random(7)
+        earnings_records = {}
+
+        for i in range(number_of_symbols):
+            number_of_years = random_generator.randint(0, max_number_of_years)
+            first_year = 2020 - number_of_years
+            quarterly_period_ends = tuple(
+                str(datetime.date(year, month, 30 if month in (6, 9) else 31)) for year in range(first_year, 2020)
+                for month in (3, 6, 9, 12))
+            # some symbols report late or without a reported date, which leaves the yearly series to the lag
+            quarterly_reported_dates = tuple(
+                str(datetime.date.fromisoformat(period_end) + datetime.timedelta(random_generator.randint(20, 120)))
+                if random_generator.random() < 0.9 else None for period_end in quarterly_period_ends)
+            earnings_per_share = [
+                random_generator.choice([0.0, 1.0, 1.3, 2.0, -1.0, 0.5, 3.0, 4.5, float('nan')])
+                for _ in quarterly_period_ends
+            ]
+
+            earnings_records['SYMBOL{}'.format(i)] = stock_data_analysis.data_sources.EarningsRecord(
+                quarterly_period_ends, quarterly_reported_dates, array.array('d', earnings_per_share),
+                quarterly_period_ends[3::4], array.array('d', [sum(earnings_per_share[j:j + 4])
+                                                               for j in range(0, len(earnings_per_share), 4)]))
+
+        return earnings_records
+
+    @staticmethod
+    def get_report_dates(period_ends: tuple, reported_dates: list) -> [str]:
+        report_dates = []
+        for period_end, reported_date in zip(period_ends, reported_dates):
+            report_date = reported_date if reported_date else str(
+                datetime.date.fromisoformat(period_end) + datetime.timedelta(90))
+            report_dates.append(max(report_dates[-1], report_date) if report_dates else report_date)
+
+        return report_dates
+
+    @staticmethod
+    def truncate(earnings_record, as_of_date: str):
+        quarterly_report_dates = EarningsBacktesterTest.get_report_dates(earnings_record.quarterly_period_ends,
+                                                                         earnings_record.quarterly_reported_dates)
+        reported_dates_by_period_end = dict(
+            zip(earnings_record.quarterly_period_ends, earnings_record.quarterly_reported_dates))
+        yearly_report_dates = EarningsBacktesterTest.get_report_dates(
+            earnings_record.yearly_period_ends,
+            [reported_dates_by_period_end[i] for i in earnings_record.yearly_period_ends])
+
+        known_quarters = sum(1 for i in quarterly_report_dates if i <= as_of_date)
+        known_years = sum(1 for i in yearly_report_dates if i <= as_of_date)
+        return stock_data_analysis.data_sources.EarningsRecord(
+            earnings_record.quarterly_period_ends[:known_quarters],
+            earnings_record.quarterly_reported_dates[:known_quarters],
+            earnings_record.quarterly_earnings_per_share[:known_quarters],
+            earnings_record.yearly_period_ends[:known_years], earnings_record.yearly_earnings_per_share[:known_years])
+
+    def test_get_quarter_end_dates_should_list_quarter_ends_in_range(self):
+        self.assertEqual(stock_data_analysis.symbol_filters.EarningsBacktester.get_quarter_end_dates(
+            '2019-11-15', '2020-09-30'), ['2019-12-31', '2020-03-31', '2020-06-30', '2020-09-30'])
+
+    def test_backtest_should_match_live_evaluators_on_point_in_time_histories(self):
+        earnings_records = self.create_random_earnings_records(200, 6)
+        as_of_dates = stock_data_analysis.symbol_filters.EarningsBacktester.get_quarter_end_dates(
+            '2015-01-01', '2020-12-31')
+        truncated_earnings_records = {}
+
+        stub_data_source_adapter = mock.Mock(stock_data_analysis.data_sources.IDataSourceAdapter)
+        stub_data_source_adapter.get_quarterly_earnings_per_share = mock.Mock(
+            side_effect=lambda symbol, n: truncated_earnings_records[symbol].get_quarterly_earnings_per_share(n))
+        stub_data_source_adapter.get_yearly_earnings_per_share = mock.Mock(
+            side_effect=lambda symbol, n: truncated_earnings_records[symbol].get_yearly_earnings_per_share(n))
+        quarterly_evaluator = stock_data_analysis.symbol_filters.QuarterlyEarningsPerShareIncrementEvaluator(
+            stub_data_source_adapter, 0.2, 2)
+        yearly_evaluator = stock_data_analysis.symbol_filters.YearlyEarningsPerShareIncrementEvaluator(
+            stub_data_source_adapter, 0.1, 2)
+        symbol_filter = stock_data_analysis.symbol_filters.SymbolFilter([quarterly_evaluator, yearly_evaluator])
+
+        earnings_backtester = stock_data_analysis.symbol_filters.EarningsBacktester([quarterly_evaluator],
+                                                                                    [yearly_evaluator])
+        passed_symbols_by_date = earnings_backtester.backtest(earnings_records, as_of_dates)
+
+        self.assertEqual(list(passed_symbols_by_date), as_of_dates)
+        for as_of_date in as_of_dates:
+            for symbol, earnings_record in earnings_records.items():
+                truncated_earnings_records[symbol] = self.truncate(earnings_record, as_of_date)
+
+            self.assertEqual(passed_symbols_by_date[as_of_date],
+                             [symbol for symbol in earnings_records if symbol_filter.filter(symbol)])
+
+        self.assertTrue(any(passed_symbols_by_date.values()))
+
+    def test_backtest_should_wait_for_reported_date(self):
+        earnings_record = stock_data_analysis.data_sources.EarningsRecord(
+            ('2019-03-31', '2019-06-30', '2019-09-30', '2019-12-31', '2020-03-31', '2020-06-30'),
+            ('2019-04-20', '2019-07-20', '2019-10-20', '2020-01-20', '2020-04-20', '2020-08-15'),
+            array.array('d', [1, 1, 1, 1, 2, 2]))
+        quarterly_evaluator = stock_data_analysis.symbol_filters.QuarterlyEarningsPerShareIncrementEvaluator(
+            mock.Mock(stock_data_analysis.data_sources.IDataSourceAdapter), 0.5, 2)
+
+        passed_symbols_by_date = stock_data_analysis.symbol_filters.EarningsBacktester(
+            [quarterly_evaluator], []).backtest({'APPL': earnings_record}, ['2020-06-30', '2020-08-15'])
+
+        self.assertEqual(passed_symbols_by_date, {'2020-06-30': [], '2020-08-15': ['APPL']})
+
+
+if __name__ == '__main__':
+    unittest.main()
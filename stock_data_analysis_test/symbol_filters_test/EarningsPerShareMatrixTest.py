@@ -0,0 +1,56 @@
+import random
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class EarningsPerShareMatrixTest(unittest.TestCase):
+    @staticmethod
+    def create_random_earnings_per_share_series(number_of_symbols: int, max_number_of_periods: int) -> dict:
+        random_generator = random.Random(42)
+        return {
+            'SYMBOL{}'.format(i): [
+                random_generator.choice([0.0, 1.0, 1.3, 2.0, -1.0, 0.5, 3.0, 4.5])
+                for _ in range(random_generator.randint(0, max_number_of_periods))
+            ]
+            for i in range(number_of_symbols)
+        }
+
+    def assert_matrix_evaluation_matches_scalar_evaluation(self, evaluator_class, get_earnings_per_share_method_name):
+        earnings_per_share_by_symbol = self.create_random_earnings_per_share_series(500, 12)
+
+        stub_data_source_adapter = mock.Mock(stock_data_analysis.data_sources.IDataSourceAdapter)
+        setattr(stub_data_source_adapter, get_earnings_per_share_method_name,
+                mock.Mock(side_effect=lambda symbol, n: earnings_per_share_by_symbol[symbol][-n:]))
+
+        for threshold in [0.1, 0.3, 1.0]:
+            for number_of_periods_to_check in [2, 3, 5]:
+                evaluator = evaluator_class(stub_data_source_adapter, threshold, number_of_periods_to_check)
+                earnings_per_share_matrix = stock_data_analysis.symbol_filters.EarningsPerShareMatrix.\
+                    from_earnings_per_share_series(earnings_per_share_by_symbol)
+
+                self.assertEqual(
+                    list(evaluator.evaluate_earnings_per_share_matrix(earnings_per_share_matrix)),
+                    [evaluator.evaluate(symbol) for symbol in earnings_per_share_matrix.get_symbols()])
+
+    def test_get_history_lengths_should_count_known_periods(self):
+        earnings_per_share_matrix = stock_data_analysis.symbol_filters.EarningsPerShareMatrix.\
+            from_earnings_per_share_series({'APPL': [1, 2, 3], 'MSFT': [], 'TSLA': [1]})
+
+        self.assertEqual(list(earnings_per_share_matrix.get_history_lengths()), [3, 0, 1])
+        self.assertEqual(earnings_per_share_matrix.get_number_of_periods(), 3)
+
+    def test_quarterly_matrix_evaluation_should_match_scalar_evaluation(self):
+        self.assert_matrix_evaluation_matches_scalar_evaluation(
+            stock_data_analysis.symbol_filters.QuarterlyEarningsPerShareIncrementEvaluator,
+            'get_quarterly_earnings_per_share')
+
+    def test_yearly_matrix_evaluation_should_match_scalar_evaluation(self):
+        self.assert_matrix_evaluation_matches_scalar_evaluation(
+            stock_data_analysis.symbol_filters.YearlyEarningsPerShareIncrementEvaluator,
+            'get_yearly_earnings_per_share')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class SymbolFilterTest(unittest.TestCase):
+    @staticmethod
+    def create_stub_evaluator(name: str, evaluate):
+        stub_evaluator = mock.Mock(stock_data_analysis.symbol_filters.ISymbolEvaluator)
+        stub_evaluator.__str__ = mock.Mock(return_value=name)
+        stub_evaluator.evaluate = mock.Mock(side_effect=evaluate)
+        stub_evaluator.evaluate_batch = mock.Mock(side_effect=lambda symbols: [evaluate(i) for i in symbols])
+        return stub_evaluator
+
+    def test_filter_symbols_should_only_return_symbols_approved_by_every_evaluator(self):
+        first_evaluator = self.create_stub_evaluator('first', lambda symbol: symbol != 'MSFT')
+        second_evaluator = self.create_stub_evaluator('second', lambda symbol: symbol != 'TSLA')
+
+        symbol_filter = stock_data_analysis.symbol_filters.SymbolFilter([first_evaluator, second_evaluator])
+
+        self.assertEqual(symbol_filter.filter_symbols(['APPL', 'MSFT', 'TSLA', 'AMZN']), ['APPL', 'AMZN'])
+        second_evaluator.evaluate_batch.assert_called_once_with(['APPL', 'TSLA', 'AMZN'])
+
+    def test_filter_should_run_most_selective_evaluator_first_with_adaptive_ordering(self):
+        permissive_evaluator = self.create_stub_evaluator('permissive', lambda symbol: True)
+        selective_evaluator = self.create_stub_evaluator('selective', lambda symbol: False)
+
+        # every evaluation costs one counted API call and no measured time, so the order does not depend on how
+        # fast the test machine is
+        symbol_filter = stock_data_analysis.symbol_filters.SymbolFilter(
+            [permissive_evaluator, selective_evaluator],
+            adaptive_ordering=True,
+            api_call_counter=lambda: permissive_evaluator.evaluate.call_count + selective_evaluator.evaluate.call_count,
+            reordering_interval=10,
+            min_evaluations_before_reordering=5)
+
+        with mock.patch('time.perf_counter', return_value=0.0):
+            for i in range(100):
+                self.assertFalse(symbol_filter.filter('SYMBOL{}'.format(i)))
+
+        self.assertEqual(
+            symbol_filter.get_evaluator_statistics()[str(selective_evaluator)]['api_calls'],
+            selective_evaluator.evaluate.call_count)
+
+        self.assertEqual(symbol_filter.get_evaluators(), [selective_evaluator, permissive_evaluator])
+        self.assertLess(permissive_evaluator.evaluate.call_count, 20)
+
+    def test_profiling_symbol_filter_should_profile_sampled_calls(self):
+        evaluator = self.create_stub_evaluator('evaluator', lambda symbol: symbol != 'MSFT')
+        profiling_symbol_filter = stock_data_analysis.symbol_filters.ProfilingSymbolFilter(
+            stock_data_analysis.symbol_filters.SymbolFilter([evaluator]))
+
+        self.assertTrue(profiling_symbol_filter.filter('APPL'))
+        self.assertFalse(profiling_symbol_filter.filter('MSFT'))
+        self.assertEqual(profiling_symbol_filter.get_profiled_calls(), 2)
+        self.assertIn('_evaluate', profiling_symbol_filter.get_statistics_text())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import asyncio
+import http.server
+import threading
+import time
+import unittest
+
+import requests
+
+from ..context import stock_data_analysis
+
+
+class LocalHttpServer:
+    class _RequestHandler(http.server.BaseHTTPRequestHandler):
+        # keep-alive needs HTTP/1.1 and a content length
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            if self.path.startswith('/slow'):
+                time.sleep(0.5)
+
+            body = self.path.encode('utf-8')
+            try:
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                # a client that timed out has closed its connection
+                pass
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            pass
+
+    def __init__(self):
+        self._http_server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), LocalHttpServer._RequestHandler)
+        self._http_server.daemon_threads = True
+        self._server_thread = threading.Thread(target=self._http_server.serve_forever, args=(0.05, ), daemon=True)
+        self._server_thread.start()
+
+    def get_host(self) -> str:
+        return '127.0.0.1:{}'.format(self._http_server.server_address[1])
+
+    def get_uri(self, path: str) -> str:
+        return 'http://{}{}'.format(self.get_host(), path)
+
+    def stop(self) -> None:
+        self._http_server.shutdown()
+        self._http_server.server_close()
+        self._server_thread.join()
+
+
+class HttpClientTest(unittest.TestCase):
+    def setUp(self):
+        self._local_http_servers = [LocalHttpServer(), LocalHttpServer()]
+
+    def tearDown(self):
+        for local_http_server in self._local_http_servers:
+            local_http_server.stop()
+
+    def test_get_should_reuse_connections_and_count_requests_per_host(self):
+        http_client = stock_data_analysis.utilities.HttpClient(pool_size=2)
+        self.addCleanup(http_client.close)
+
+        for i in range(3):
+            self.assertEqual(http_client.get(self._local_http_servers[0].get_uri('/first/{}'.format(i))).text,
+                             '/first/{}'.format(i))
+        http_client.get(self._local_http_servers[1].get_uri('/second'))
+
+        # the statistics are read from the pools that the overridden adapter method tracks
+        self.assertEqual(
+            http_client.get_connection_statistics(), {
+                self._local_http_servers[0].get_host(): {
+                    'requests': 3,
+                    'new_connections': 1,
+                    'reused_connections': 2
+                },
+                self._local_http_servers[1].get_host(): {
+                    'requests': 1,
+                    'new_connections': 1,
+                    'reused_connections': 0
+                }
+            })
+        self.assertEqual(http_client.get_thread_request_count(), 4)
+
+    def test_get_should_keep_at_most_pool_size_connections_per_host(self):
+        http_client = stock_data_analysis.utilities.HttpClient(pool_size=2)
+        self.addCleanup(http_client.close)
+
+        threads = [
+            threading.Thread(target=http_client.get, args=(self._local_http_servers[0].get_uri('/slow'), ))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # pylint: disable=protected-access
+        connection_pool = http_client._http_adapter.connection_pools[self._local_http_servers[0].get_host()]
+        self.assertEqual(connection_pool.pool.maxsize, 2)
+        self.assertLessEqual(connection_pool.pool.qsize(), 2)
+        self.assertEqual(http_client.get_connection_statistics()[self._local_http_servers[0].get_host()]['requests'],
+                         4)
+
+    def test_get_should_raise_transient_error_after_read_timeout(self):
+        http_client = stock_data_analysis.utilities.HttpClient(read_timeout_seconds=0.1)
+        self.addCleanup(http_client.close)
+
+        with self.assertRaises(requests.exceptions.Timeout) as context:
+            http_client.get(self._local_http_servers[0].get_uri('/slow'))
+        self.assertTrue(stock_data_analysis.utilities.HttpRequestHandler.is_transient_error(context.exception))
+
+
+class AsyncHttpClientTest(unittest.TestCase):
+    def test_get_should_run_concurrently_on_the_shared_pool(self):
+        local_http_server = LocalHttpServer()
+        self.addCleanup(local_http_server.stop)
+        http_client = stock_data_analysis.utilities.HttpClient(pool_size=4)
+        self.addCleanup(http_client.close)
+        async_http_client = stock_data_analysis.utilities.AsyncHttpClient(http_client, max_concurrent_requests=4)
+        self.addCleanup(async_http_client.close)
+
+        async def get_all():
+            return await asyncio.gather(*[async_http_client.get(local_http_server.get_uri('/slow')) for _ in range(4)])
+
+        start_time = time.monotonic()
+        http_responses = asyncio.run(get_all())
+
+        # four slow requests on four connections take about as long as one
+        self.assertLess(time.monotonic() - start_time, 1.5)
+        self.assertEqual([i.text for i in http_responses], ['/slow'] * 4)
+        self.assertEqual(async_http_client.get_connection_statistics()[local_http_server.get_host()]['requests'], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
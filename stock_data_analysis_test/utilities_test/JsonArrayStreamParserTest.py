@@ -0,0 +1,28 @@
+import json
+import unittest
+
+from ..context import stock_data_analysis
+
+
+class JsonArrayStreamParserTest(unittest.TestCase):
+    def test_parse_should_yield_elements_regardless_of_chunk_boundaries(self):
+        elements = [{'symbol': 'SYMBOL{}'.format(i), 'name': 'Société [{}], "Inc"'.format(i)} for i in range(20)]
+        encoded_array = json.dumps(elements, ensure_ascii=False).encode('utf-8')
+
+        for chunk_size in [1, 2, 5, 64, len(encoded_array)]:
+            chunks = [encoded_array[i:i + chunk_size] for i in range(0, len(encoded_array), chunk_size)]
+            self.assertEqual(list(stock_data_analysis.utilities.JsonArrayStreamParser().parse(chunks)), elements)
+
+    def test_parse_should_yield_elements_before_array_is_complete(self):
+        elements = stock_data_analysis.utilities.JsonArrayStreamParser().parse(iter(['[{"symbol": "APPL"}, ']))
+
+        self.assertEqual(next(elements), {'symbol': 'APPL'})
+        self.assertRaises(ValueError, next, elements)
+
+    def test_parse_should_wait_for_scalars_split_across_chunks(self):
+        self.assertEqual(list(stock_data_analysis.utilities.JsonArrayStreamParser().parse(['[12', '34, 5', ']'])),
+                         [1234, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import logging
+import queue
+import unittest
+
+from ..context import stock_data_analysis
+
+
+class LoggerTest(unittest.TestCase):
+    class FormatCounter:
+        def __init__(self):
+            self.format_count = 0
+
+        def __format__(self, format_spec):
+            self.format_count += 1
+            return 'counter'
+
+    def test_constructor_should_not_add_handlers(self):
+        number_of_root_handlers = len(logging.getLogger().handlers)
+
+        for _ in range(10):
+            stock_data_analysis.utilities.Logger('LoggerTest')
+
+        self.assertEqual(len(logging.getLogger('LoggerTest').handlers), 0)
+        self.assertEqual(len(logging.getLogger().handlers), number_of_root_handlers)
+
+    def test_log_should_not_format_messages_below_level(self):
+        format_counter = LoggerTest.FormatCounter()
+        logger = stock_data_analysis.utilities.Logger('LoggerTest')
+        logging.getLogger('LoggerTest').setLevel(logging.WARNING)
+
+        try:
+            logger.log_debug('debug message {}', format_counter)
+            logger.log_info('info message {}', format_counter)
+        finally:
+            logging.getLogger('LoggerTest').setLevel(logging.NOTSET)
+
+        self.assertEqual(format_counter.format_count, 0)
+
+    def test_queue_handler_should_format_mutable_args_when_logged(self):
+        queue_handler = stock_data_analysis.utilities.Logger._DeferredFormattingQueueHandler(queue.SimpleQueue())
+        logger = logging.getLogger('LoggerTest')
+        logger.addHandler(queue_handler)
+        statistics = {'calls': 1}
+
+        try:
+            stock_data_analysis.utilities.Logger('LoggerTest').log_warning('statistics {} of {}', statistics, 'run')
+            stock_data_analysis.utilities.Logger('LoggerTest').log_warning('symbol {} passed {}', 'APPL', True)
+        finally:
+            logger.removeHandler(queue_handler)
+        statistics['calls'] = 2
+
+        self.assertEqual(queue_handler.queue.get().getMessage(), "statistics {'calls': 1} of run")
+        deferred_record = queue_handler.queue.get()
+        self.assertNotIsInstance(deferred_record.msg, str)
+        self.assertEqual(deferred_record.getMessage(), 'symbol APPL passed True')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+import unittest
+import urllib.request
+
+from ..context import stock_data_analysis
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def test_observe_should_summarize_histogram(self):
+        metrics_registry = stock_data_analysis.utilities.MetricsRegistry(buckets_seconds=(0.1, 1, 10))
+
+        for value in [0.05, 0.5, 0.5, 5, 50]:
+            metrics_registry.observe('api_request_seconds', value, endpoint='earnings')
+
+        histogram = metrics_registry.get_histogram('api_request_seconds', endpoint='earnings')
+        self.assertEqual(histogram['count'], 5)
+        self.assertAlmostEqual(histogram['sum'], 56.05)
+        self.assertEqual(histogram['min'], 0.05)
+        self.assertEqual(histogram['p50'], 1)
+        self.assertEqual(histogram['p99'], 50)
+        self.assertIsNone(metrics_registry.get_histogram('api_request_seconds', endpoint='symbols'))
+
+    def test_to_prometheus_text_should_export_cumulative_buckets(self):
+        metrics_registry = stock_data_analysis.utilities.MetricsRegistry(buckets_seconds=(0.1, 1))
+        metrics_registry.increment('retries_total', exception='TooManyRequestsException')
+        metrics_registry.increment('retries_total', exception='TooManyRequestsException')
+        metrics_registry.set_gauge('scan_symbols_per_second', 1.5)
+        metrics_registry.observe('evaluator_seconds', 0.5, evaluator='Yearly"Evaluator')
+
+        prometheus_lines = metrics_registry.to_prometheus_text().splitlines()
+
+        self.assertIn('# TYPE stock_data_analysis_retries_total counter', prometheus_lines)
+        self.assertIn('stock_data_analysis_retries_total{exception="TooManyRequestsException"} 2', prometheus_lines)
+        self.assertIn('stock_data_analysis_scan_symbols_per_second 1.5', prometheus_lines)
+        self.assertIn('stock_data_analysis_evaluator_seconds_bucket{evaluator="Yearly\\"Evaluator",le="0.1"} 0',
+                      prometheus_lines)
+        self.assertIn('stock_data_analysis_evaluator_seconds_bucket{evaluator="Yearly\\"Evaluator",le="1"} 1',
+                      prometheus_lines)
+        self.assertIn('stock_data_analysis_evaluator_seconds_bucket{evaluator="Yearly\\"Evaluator",le="+Inf"} 1',
+                      prometheus_lines)
+        self.assertIn('stock_data_analysis_evaluator_seconds_count{evaluator="Yearly\\"Evaluator"} 1',
+                      prometheus_lines)
+
+    def test_retry_executor_should_count_retries_and_backoff(self):
+        metrics_registry = stock_data_analysis.utilities.MetricsRegistry()
+        stock_data_analysis.utilities.MetricsRegistry.set_default(metrics_registry)
+        self.addCleanup(stock_data_analysis.utilities.MetricsRegistry.set_default, None)
+
+        def fail():
+            raise stock_data_analysis.exceptions.TooManyRequestsException()
+
+        retry_executor = stock_data_analysis.utilities.RetryExecutor(initial_backoff_seconds=0.01,
+                                                                     max_retries=2,
+                                                                     jitter_ratio=0)
+        self.assertRaises(stock_data_analysis.exceptions.TooManyRequestsException,
+                          retry_executor.execute_with_exponential_backoff_retry, fail, lambda exception: True)
+
+        self.assertEqual(metrics_registry.get_counter('retries_total', exception='TooManyRequestsException'), 2)
+        self.assertAlmostEqual(
+            metrics_registry.get_counter('retry_backoff_seconds_total', exception='TooManyRequestsException'), 0.03)
+        self.assertEqual(metrics_registry.get_counter('retries_exhausted_total', exception='TooManyRequestsException'),
+                         1)
+
+
+class MetricsExporterTest(unittest.TestCase):
+    def test_metrics_exporter_should_serve_and_write_metrics(self):
+        metrics_registry = stock_data_analysis.utilities.MetricsRegistry()
+        metrics_registry.increment('scan_processed_symbols_total', 3)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            prometheus_file_name = os.path.join(temporary_directory, 'metrics.prom')
+            json_file_name = os.path.join(temporary_directory, 'metrics.json')
+            metrics_exporter = stock_data_analysis.utilities.MetricsExporter(metrics_registry,
+                                                                             prometheus_file_name=prometheus_file_name,
+                                                                             port=0)
+            metrics_exporter.start()
+            try:
+                with urllib.request.urlopen(metrics_exporter.get_uri()) as http_response:
+                    self.assertIn('stock_data_analysis_scan_processed_symbols_total 3',
+                                  http_response.read().decode('utf-8'))
+            finally:
+                metrics_exporter.stop()
+
+            metrics_exporter.write_json_summary(json_file_name)
+            with open(prometheus_file_name) as prometheus_file:
+                self.assertIn('stock_data_analysis_scan_processed_symbols_total 3', prometheus_file.read())
+            with open(json_file_name) as json_file:
+                self.assertEqual(json.load(json_file)['counters'], [{
+                    'name': 'scan_processed_symbols_total',
+                    'labels': {},
+                    'value': 3
+                }])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import time
+import unittest
+
+from ..context import stock_data_analysis
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_acquire_should_space_calls_by_refill_rate(self):
+        rate_limiter = stock_data_analysis.utilities.RateLimiter(calls_per_minute=600)
+
+        start_time = time.monotonic()
+        for _ in range(4):
+            rate_limiter.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.29)
+
+    def test_try_acquire_should_return_false_without_tokens(self):
+        rate_limiter = stock_data_analysis.utilities.RateLimiter(calls_per_minute=1)
+
+        self.assertTrue(rate_limiter.try_acquire())
+        self.assertFalse(rate_limiter.try_acquire())
+
+    def test_acquire_should_raise_when_daily_quota_is_exhausted(self):
+        rate_limiter = stock_data_analysis.utilities.RateLimiter(calls_per_minute=6000, calls_per_day=2, burst_size=2)
+
+        rate_limiter.acquire()
+        rate_limiter.acquire()
+        self.assertEqual(rate_limiter.get_remaining_daily_calls(), 0)
+        self.assertRaises(stock_data_analysis.exceptions.DailyQuotaExceededException, rate_limiter.acquire)
+
+    def test_acquire_should_keep_daily_quota_across_restarts_with_quota_store(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            database_file_name = os.path.join(temporary_directory, 'responses.sqlite')
+            quota_store = stock_data_analysis.utilities.SqliteQuotaStore(database_file_name)
+            rate_limiter = stock_data_analysis.utilities.RateLimiter(calls_per_day=3,
+                                                                     quota_store=quota_store,
+                                                                     quota_key='AlphaVantageApi:secret')
+            rate_limiter.acquire()
+            rate_limiter.acquire()
+            quota_store.close()
+
+            quota_store = stock_data_analysis.utilities.SqliteQuotaStore(database_file_name)
+            restarted_rate_limiter = stock_data_analysis.utilities.RateLimiter(calls_per_day=3,
+                                                                               quota_store=quota_store,
+                                                                               quota_key='AlphaVantageApi:secret')
+            other_rate_limiter = stock_data_analysis.utilities.RateLimiter(calls_per_day=3,
+                                                                           quota_store=quota_store,
+                                                                           quota_key='AlphaVantageApi:other')
+            self.assertEqual(restarted_rate_limiter.get_remaining_daily_calls(), 1)
+            self.assertEqual(other_rate_limiter.get_remaining_daily_calls(), 3)
+
+            restarted_rate_limiter.acquire()
+            self.assertRaises(stock_data_analysis.exceptions.DailyQuotaExceededException,
+                              restarted_rate_limiter.acquire)
+            quota_store.close()
+
+
+class QuotaPlannerTest(unittest.TestCase):
+    def test_plan_should_split_symbols_into_daily_batches(self):
+        quota_planner = stock_data_analysis.utilities.QuotaPlanner(calls_per_day=3, calls_per_symbol=1)
+
+        self.assertEqual(quota_planner.plan(['D', 'B', 'A', 'C', 'B']), [['A', 'B', 'C'], ['D']])
+        self.assertEqual(quota_planner.get_symbols_for_day(['D', 'B', 'A', 'C'], 1), ['D'])
+        self.assertEqual(quota_planner.get_symbols_for_day(['D', 'B', 'A', 'C'], 2), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from unittest import mock
+from ..context import stock_data_analysis
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def test_get_or_fetch_should_fetch_each_key_once(self):
+        fetch = mock.Mock(return_value='{}')
+        response_cache = stock_data_analysis.utilities.ResponseCache()
+
+        self.assertEqual(response_cache.get_or_fetch('APPL', fetch), '{}')
+        self.assertEqual(response_cache.get_or_fetch('APPL', fetch), '{}')
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(response_cache.get_statistics()['memory_hits'], 1)
+        self.assertEqual(response_cache.get_statistics()['misses'], 1)
+
+    def test_get_or_fetch_should_fetch_again_after_time_to_live(self):
+        fetch = mock.Mock(return_value='{}')
+        response_cache = stock_data_analysis.utilities.ResponseCache(time_to_live_seconds=0.01)
+
+        response_cache.get_or_fetch('APPL', fetch)
+        time.sleep(0.02)
+        response_cache.get_or_fetch('APPL', fetch)
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_get_or_fetch_should_evict_least_recently_used_key(self):
+        fetch = mock.Mock(return_value='{}')
+        response_cache = stock_data_analysis.utilities.ResponseCache(max_entries=2)
+
+        response_cache.get_or_fetch('APPL', fetch)
+        response_cache.get_or_fetch('MSFT', fetch)
+        response_cache.get_or_fetch('APPL', fetch)
+        response_cache.get_or_fetch('TSLA', fetch)
+        response_cache.get_or_fetch('APPL', fetch)
+        self.assertEqual(fetch.call_count, 3)
+        self.assertEqual(response_cache.get_statistics()['evictions'], 1)
+
+    def test_get_or_fetch_should_coalesce_concurrent_fetches(self):
+        fetch_started = threading.Event()
+        release_fetch = threading.Event()
+
+        def fetch():
+            fetch_started.set()
+            release_fetch.wait()
+            return '{}'
+
+        fetch = mock.Mock(side_effect=fetch)
+        response_cache = stock_data_analysis.utilities.ResponseCache()
+        results = []
+
+        threads = [threading.Thread(target=lambda: results.append(response_cache.get_or_fetch('APPL', fetch)))]
+        threads[0].start()
+        fetch_started.wait()
+        threads.append(threading.Thread(target=lambda: results.append(response_cache.get_or_fetch('APPL', fetch))))
+        threads[1].start()
+        time.sleep(0.05)
+        release_fetch.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ['{}', '{}'])
+        self.assertEqual(fetch.call_count, 1)
+
+    def test_get_or_fetch_entry_should_change_version_when_value_is_stored_again(self):
+        response_cache = stock_data_analysis.utilities.ResponseCache()
+
+        value, version = response_cache.get_or_fetch_entry('APPL', lambda: '{}')
+        self.assertEqual(response_cache.get_or_fetch_entry('APPL', lambda: '[]'), (value, version))
+
+        response_cache.put('APPL', '{}')
+        self.assertNotEqual(response_cache.get_or_fetch_entry('APPL', lambda: '[]')[1], version)
+
+    def test_get_or_fetch_should_read_persisted_responses(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            database_file_name = os.path.join(temporary_directory, 'responses.sqlite3')
+            fetch = mock.Mock(return_value='{}')
+
+            response_cache = stock_data_analysis.utilities.ResponseCache(
+                persistent_store=stock_data_analysis.utilities.SqliteResponseStore(database_file_name))
+            response_cache.get_or_fetch('APPL', fetch)
+            response_cache.close()
+
+            response_cache = stock_data_analysis.utilities.ResponseCache(
+                persistent_store=stock_data_analysis.utilities.SqliteResponseStore(database_file_name))
+            self.assertEqual(response_cache.get_or_fetch('APPL', fetch), '{}')
+            self.assertEqual(fetch.call_count, 1)
+            self.assertEqual(response_cache.get_statistics()['disk_hits'], 1)
+            response_cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import asyncio
+import time
+import unittest
+
+from ..context import stock_data_analysis
+
+
+class RetryExecutorTest(unittest.TestCase):
+    @staticmethod
+    def create_failing_task(exceptions: list):
+        calls = []
+
+        def task():
+            calls.append(time.monotonic())
+            if len(calls) <= len(exceptions):
+                raise exceptions[len(calls) - 1]
+            return len(calls)
+
+        return task, calls
+
+    def test_get_backoff_seconds_should_cap_and_jitter_exponential_backoff(self):
+        retry_executor = stock_data_analysis.utilities.RetryExecutor(initial_backoff_seconds=1,
+                                                                     max_backoff_seconds=10,
+                                                                     random_seed=1)
+
+        for retry_number, expected_backoff_seconds in [(0, 1), (2, 4), (10, 10)]:
+            backoff_seconds = retry_executor.get_backoff_seconds(retry_number)
+            self.assertLessEqual(backoff_seconds, expected_backoff_seconds)
+            self.assertGreaterEqual(backoff_seconds, expected_backoff_seconds / 2)
+
+    def test_get_backoff_seconds_should_honour_retry_after(self):
+        retry_executor = stock_data_analysis.utilities.RetryExecutor(initial_backoff_seconds=1, jitter_ratio=0)
+
+        self.assertEqual(
+            retry_executor.get_backoff_seconds(0, stock_data_analysis.exceptions.TooManyRequestsException(30)), 30)
+        self.assertEqual(stock_data_analysis.utilities.RetryExecutor.parse_retry_after('12'), 12)
+        self.assertEqual(stock_data_analysis.utilities.RetryExecutor.parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'),
+                         0)
+        self.assertIsNone(stock_data_analysis.utilities.RetryExecutor.parse_retry_after('soon'))
+
+    def test_execute_should_limit_retries_per_exception_type(self):
+        retry_executor = stock_data_analysis.utilities.RetryExecutor(
+            initial_backoff_seconds=0.001,
+            max_retries=3,
+            max_retries_by_exception_type={stock_data_analysis.exceptions.TooManyRequestsException: 1})
+        task, calls = self.create_failing_task([
+            ConnectionError(),
+            stock_data_analysis.exceptions.TooManyRequestsException(),
+            ConnectionError(),
+            stock_data_analysis.exceptions.TooManyRequestsException()
+        ])
+
+        self.assertRaises(stock_data_analysis.exceptions.TooManyRequestsException,
+                          retry_executor.execute_with_exponential_backoff_retry, task, lambda exception: True)
+        self.assertEqual(len(calls), 4)
+
+    def test_execute_should_stop_retrying_at_deadline(self):
+        retry_executor = stock_data_analysis.utilities.RetryExecutor(initial_backoff_seconds=0.05,
+                                                                     max_retries=10,
+                                                                     deadline_seconds=0.1,
+                                                                     jitter_ratio=0)
+        task, calls = self.create_failing_task([ConnectionError()] * 10)
+
+        self.assertRaises(ConnectionError, retry_executor.execute_with_exponential_backoff_retry, task,
+                          lambda exception: True)
+        self.assertEqual(len(calls), 2)
+        self.assertLess(calls[-1] - calls[0], 0.1)
+
+    def test_execute_async_should_retry_without_blocking_event_loop(self):
+        retry_executor = stock_data_analysis.utilities.RetryExecutor(initial_backoff_seconds=0.01)
+        task, calls = self.create_failing_task([ConnectionError(), ConnectionError()])
+
+        async def execute_task():
+            return task()
+
+        async def execute_concurrently():
+            return await asyncio.gather(
+                retry_executor.execute_with_exponential_backoff_retry_async(execute_task, lambda exception: True),
+                asyncio.sleep(0, result='not blocked'))
+
+        self.assertEqual(asyncio.run(execute_concurrently()), [3, 'not blocked'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import argparse
+import logging
+
+from stock_data_analysis.data_sources import StubApiServer
+from stock_data_analysis.utilities import Logger
+from stock_data_analysis.utilities import ResponseArchive
+
+if __name__ == "__main__":
+    logger = Logger('stub_api_server', print_to_console=True)
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('archive', type=str, help='response archive recorded by main.py --record-archive')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='address to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='port to listen on')
+    parser.add_argument('--latency-seconds', type=float, default=0, help='delay added to every response')
+    parser.add_argument('--latency-jitter-seconds',
+                        type=float,
+                        default=0,
+                        help='maximum random deviation from the added delay')
+    parser.add_argument('--too-many-requests-probability',
+                        type=float,
+                        default=0,
+                        help='probability of answering with HTTP 429')
+    parser.add_argument('--throttle-note-probability',
+                        type=float,
+                        default=0,
+                        help='probability of answering an Alpha Vantage request with its rate limit note')
+    parser.add_argument('--random-seed', type=int, help='seed making injected failures repeatable')
+    args = parser.parse_args()
+
+    # the stub only reports where it listens and what it serves, nothing is written to log files
+    Logger.configure(level=logging.INFO)
+
+    stub_api_server = StubApiServer(ResponseArchive(args.archive), args.host, args.port, args.latency_seconds,
+                                    args.latency_jitter_seconds, args.too_many_requests_probability,
+                                    args.throttle_note_probability, args.random_seed)
+    logger.log_info('point main.py at the stub with --iex-base-uri {} --alpha-vantage-base-uri {}',
+                    stub_api_server.get_iex_base_uri(), stub_api_server.get_base_uri())
+    stub_api_server.serve_forever()